@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Serial compound links.
+
+A :class:`pynml.nml.LinkGroup` is a serial compound link when it's related
+with ``isSerialCompoundLink`` to an :class:`pynml.nml.OrderedList` of
+:class:`pynml.nml.Link` or other serial compound links, in order. The list is
+a chain of :class:`pynml.nml.ListItem`: the ``first`` item of the list, and
+the ``next`` item of each item, hold the Link or LinkGroup in each position
+with the ``item`` relation.
+
+:func:`expand` resolves a serial compound link into the sequence of links it
+goes through, expanding the nested ones.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from itertools import chain
+
+from .nml import Link, LinkGroup, OrderedList, ListItem
+
+
+def serial_compound_link(segments, **kwargs):
+    """
+    Create a serial compound link.
+
+    :param list segments: The :class:`pynml.nml.Link` or serial compound
+     :class:`pynml.nml.LinkGroup` objects to concatenate, in order.
+    :param kwargs: Arguments for the :class:`pynml.nml.LinkGroup`.
+    :rtype: tuple
+    :return: A tuple (link_group, ordered_list, items) with the new objects.
+    """
+    ordered_list = OrderedList()
+    items = []
+
+    for segment in segments:
+        item = ListItem()
+        item.set_item(segment)
+        if items:
+            items[-1].set_next(item)
+        else:
+            ordered_list.set_first(item)
+        items.append(item)
+
+    link_group = LinkGroup(**kwargs)
+    link_group.add_is_serial_compound_link(ordered_list)
+    return link_group, ordered_list, items
+
+
+def segments(link_group):
+    """
+    Get the segments of a serial compound link.
+
+    :param link_group: The serial compound link.
+    :type link_group: :class:`pynml.nml.LinkGroup`
+    :rtype: list
+    :return: The Link and LinkGroup objects in the ordered list of the
+     serial compound link, in order.
+    :raises Exception: If the LinkGroup isn't a serial compound link, has
+     more than one ordered list or its list has a cycle.
+    """
+    lists = list(link_group.iter_is_serial_compound_link())
+    if len(lists) != 1:
+        raise Exception(
+            'LinkGroup {} has {} serial compound lists, expected 1'.format(
+                link_group.identifier, len(lists)
+            )
+        )
+
+    found = []
+    seen = set()
+    item = next(lists[0].iter_first(), None)
+
+    while item is not None:
+        if item.identifier in seen:
+            raise Exception(
+                'Cycle in the ordered list of LinkGroup {} at {}'.format(
+                    link_group.identifier, item.identifier
+                )
+            )
+        seen.add(item.identifier)
+
+        segment = next(item.iter_item(), None)
+        if segment is not None:
+            found.append(segment)
+        item = next(item.iter_next(), None)
+
+    return found
+
+
+def expand(link_group, cache=None):
+    """
+    Expand a serial compound link into the links it goes through.
+
+    Nested serial compound links are expanded too, without recursion, and
+    each one is expanded only once: the expansion of every LinkGroup found
+    is stored in the cache, so the segments shared by many serial compound
+    links are reused.
+
+    :param link_group: The serial compound link.
+    :type link_group: :class:`pynml.nml.LinkGroup`
+    :param dict cache: Expansions of LinkGroup objects, by identifier. It's
+     filled with the expansion of the LinkGroup and of the nested ones.
+    :rtype: tuple
+    :return: The :class:`pynml.nml.Link` objects, in order.
+    :raises Exception: If a LinkGroup isn't a serial compound link or if
+     it's part of itself.
+    """
+    if cache is None:
+        cache = {}
+    if link_group.identifier in cache:
+        return cache[link_group.identifier]
+
+    # Stack of (LinkGroup, pending segments, expansion of each segment)
+    active = set([link_group.identifier])
+    stack = [(link_group, iter(segments(link_group)), [])]
+
+    while stack:
+        group, pending, parts = stack[-1]
+
+        for segment in pending:
+            if isinstance(segment, Link):
+                parts.append((segment, ))
+                continue
+
+            identifier = segment.identifier
+            if identifier in cache:
+                parts.append(cache[identifier])
+                continue
+            if identifier in active:
+                raise Exception(
+                    'LinkGroup {} is a serial compound link of '
+                    'itself'.format(identifier)
+                )
+
+            active.add(identifier)
+            stack.append((segment, iter(segments(segment)), []))
+            break
+
+        else:
+            stack.pop()
+            active.discard(group.identifier)
+
+            expansion = tuple(chain.from_iterable(parts))
+            cache[group.identifier] = expansion
+            if stack:
+                stack[-1][2].append(expansion)
+
+    return cache[link_group.identifier]
+
+
+__all__ = ['serial_compound_link', 'segments', 'expand']
@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Incremental tracking of the connected components of a topology.
+
+The :class:`ConnectivityTracker` keeps the connected components of the nodes
+of a topology up to date as nodes and links are added or removed, so
+questions like "is the fabric still one component?" don't need a traversal
+of the whole topology.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from collections import deque
+from itertools import count
+
+
+class ConnectivityTracker(object):
+    """
+    Connected components of a set of nodes joined by undirected links.
+
+    Components are kept as a quick-find structure, not as a parent pointer
+    union-find forest, so they can be split too: each node is labeled with
+    its component and each component keeps the set of its nodes. Finding
+    the component of a node is O(1).
+
+    When a link joins two components, the nodes of the smaller one are
+    relabeled, so a merge costs O(k), with k the size of the smaller
+    component. While only nodes and links are added, a node is relabeled
+    at most log2(n) times, as its component at least doubles each time,
+    and adding a link is O(log n) amortized. Components split by removals
+    can be merged again, so this bound doesn't hold across removals.
+
+    Removing the last link between two nodes may split their component. The
+    component is recomputed, but only partially: two breadth first searches
+    are run at the same time from both nodes and stop as soon as they meet,
+    or as soon as one of them runs out of nodes. In that case, only the
+    nodes it found, the smaller side of the split, are relabeled.
+
+    Nodes can be given as :class:`pynml.nml.Node` objects or as their
+    identifiers.
+    """
+
+    def __init__(self):
+        self._components = {}
+        self._members = {}
+        self._links = {}
+        self._ids = count()
+
+    @staticmethod
+    def _key(node):
+        return getattr(node, 'identifier', node)
+
+    def _component(self, node):
+        key = self._key(node)
+        try:
+            return self._components[key]
+        except KeyError:
+            raise Exception('Unknown node {}'.format(key))
+
+    def __len__(self):
+        return len(self._members)
+
+    def __contains__(self, node):
+        return self._key(node) in self._components
+
+    def add_node(self, node):
+        """
+        Add a node in a component of its own.
+
+        Adding a node that is already tracked does nothing.
+
+        :param node: The node.
+        """
+        key = self._key(node)
+        if key in self._components:
+            return
+
+        component = next(self._ids)
+        self._components[key] = component
+        self._members[component] = set([key])
+        self._links[key] = {}
+
+    def remove_node(self, node):
+        """
+        Remove a node and all its links.
+
+        :param node: The node.
+        """
+        key = self._key(node)
+        self._component(key)
+
+        for neighbour, links in list(self._links[key].items()):
+            for link in range(links):
+                self.remove_link(key, neighbour)
+
+        component = self._components.pop(key)
+        del self._links[key]
+        self._members[component].discard(key)
+        if not self._members[component]:
+            del self._members[component]
+
+    def add_link(self, node_a, node_b):
+        """
+        Add a link between two nodes, merging their components.
+
+        Nodes not tracked yet are added. Parallel links are counted, so the
+        nodes stay connected until all of them are removed.
+
+        :param node_a: A node.
+        :param node_b: The other node.
+        """
+        key_a, key_b = self._key(node_a), self._key(node_b)
+        self.add_node(key_a)
+        self.add_node(key_b)
+
+        links = self._links
+        links[key_a][key_b] = links[key_a].get(key_b, 0) + 1
+        if key_a != key_b:
+            links[key_b][key_a] = links[key_b].get(key_a, 0) + 1
+
+        component_a = self._components[key_a]
+        component_b = self._components[key_b]
+        if component_a == component_b:
+            return
+
+        # Relabel the smaller component, O(size of the smaller component)
+        members_a = self._members[component_a]
+        members_b = self._members[component_b]
+        if len(members_a) < len(members_b):
+            component_a, component_b = component_b, component_a
+            members_a, members_b = members_b, members_a
+
+        for key in members_b:
+            self._components[key] = component_a
+        members_a.update(members_b)
+        del self._members[component_b]
+
+    def remove_link(self, node_a, node_b):
+        """
+        Remove a link between two nodes, splitting their component if it was
+        the last path between them.
+
+        :param node_a: A node.
+        :param node_b: The other node.
+        """
+        key_a, key_b = self._key(node_a), self._key(node_b)
+        self._component(key_a)
+        self._component(key_b)
+
+        links = self._links
+        if key_b not in links[key_a]:
+            raise Exception(
+                'No link between {} and {}'.format(key_a, key_b)
+            )
+
+        links[key_a][key_b] -= 1
+        if links[key_a][key_b]:
+            if key_a != key_b:
+                links[key_b][key_a] -= 1
+            return
+
+        del links[key_a][key_b]
+        if key_a == key_b:
+            return
+        del links[key_b][key_a]
+
+        side = self._split(key_a, key_b)
+        if side is None:
+            return
+
+        component = self._components[key_a]
+        split = next(self._ids)
+        for key in side:
+            self._components[key] = split
+        self._members[component].difference_update(side)
+        self._members[split] = side
+
+    def _split(self, key_a, key_b):
+        """
+        Search if two nodes are still connected.
+
+        :return: `None` if the nodes are connected, or the set of nodes
+         connected to one of them, the smaller side of the split, otherwise.
+        """
+        links = self._links
+        searches = [
+            (deque([key_a]), set([key_a])),
+            (deque([key_b]), set([key_b])),
+        ]
+
+        while True:
+            for (pending, seen), (_, other) in zip(searches, searches[::-1]):
+                if not pending:
+                    return seen
+
+                for neighbour in links[pending.popleft()]:
+                    if neighbour in other:
+                        return None
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        pending.append(neighbour)
+
+    def component(self, node):
+        """
+        Get the component of a node.
+
+        :param node: The node.
+        :return: An opaque identifier of the component of the node, equal for
+         all the nodes of the component while it doesn't change.
+        """
+        return self._component(node)
+
+    def members(self, node):
+        """
+        Get the nodes in the same component as a node.
+
+        :param node: The node.
+        :rtype: frozenset
+        :return: The identifiers of the nodes of the component.
+        """
+        return frozenset(self._members[self._component(node)])
+
+    def connected(self, node_a, node_b):
+        """
+        Check if there's a path between two nodes.
+
+        :param node_a: A node.
+        :param node_b: The other node.
+        :rtype: bool
+        """
+        return self._component(node_a) == self._component(node_b)
+
+    def is_connected(self):
+        """
+        Check if all the nodes are in a single component.
+
+        :rtype: bool
+        :return: True if there's a single component, or no nodes at all.
+        """
+        return len(self._members) <= 1
+
+
+__all__ = ['ConnectivityTracker']
@@ -129,7 +129,7 @@ class RelationHasTopologyError(NMLException):
 
 class RelationHasLabelGroupError(NMLException):
     """
-    A hasLabelGroup relation must relate with objects of type Lifetime.
+    A hasLabelGroup relation must relate with objects of type LabelGroup.
     """
 
 
@@ -147,8 +147,26 @@ class RelationHasLinkError(NMLException):
 
 class RelationIsSerialCompoundLinkError(NMLException):
     """
-    A isSerialCompoundLink relation must relate with objects of type Port or
-    PortGroup.
+    A isSerialCompoundLink relation must relate with objects of type
+    OrderedList.
+    """
+
+
+class RelationFirstError(NMLException):
+    """
+    A first relation must relate with objects of type ListItem.
+    """
+
+
+class RelationItemError(NMLException):
+    """
+    A item relation must relate with objects of type Link or LinkGroup.
+    """
+
+
+class RelationNextError(NMLException):
+    """
+    A next relation must relate with objects of type ListItem.
     """
 
 
@@ -191,6 +209,9 @@ __all__ = [
     'RelationHasPortError',
     'RelationHasLinkError',
     'RelationIsSerialCompoundLinkError',
+    'RelationFirstError',
+    'RelationItemError',
+    'RelationNextError',
     'AttributeNameError',
     'AttributeIdError',
     'AttributeEncodingError'
@@ -0,0 +1,463 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Graphviz rendering module.
+
+Graphs are rendered by piping their source to a single ``dot`` process that
+writes all the requested output formats. The location of the ``dot``
+executable and the formats it supports are discovered once per process.
+
+Rendered files can be kept in a :class:`RenderCache`, so graphs that didn't
+change are not rendered again.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from io import open as io_open
+from hashlib import sha256
+from codecs import getwriter
+from shutil import copyfile
+from os import makedirs, remove, rename, listdir, stat, utime, getpid
+from logging import getLogger
+from tempfile import TemporaryFile
+from threading import current_thread
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from subprocess import Popen, PIPE
+from os.path import dirname, abspath, splitext, isdir, isfile, join
+from distutils.spawn import find_executable
+
+try:
+    from os import link
+except ImportError:
+    link = None
+
+
+log = getLogger(__name__)
+
+
+# Path to the dot executable and formats supported, by dot executable
+_dot = []
+_formats = {}
+
+
+def find_dot():
+    """
+    Find the Graphviz ``dot`` executable.
+
+    The executable is searched only until it's found, using
+    :py:func:`distutils.spawn.find_executable`.
+
+    :rtype: str
+    :return: Path to the ``dot`` executable.
+    :raises Exception: If the executable is not found.
+    """
+    if not _dot:
+        dot = find_executable('dot')
+        if dot is None:
+            raise Exception('Missing Graphviz "dot" executable')
+        _dot.append(dot)
+    return _dot[0]
+
+
+def supported_formats(dot):
+    """
+    Get the output formats supported by a ``dot`` executable.
+
+    :param str dot: Path to the ``dot`` executable.
+    :rtype: list
+    :return: Sorted list of the names of the formats supported.
+    """
+    if dot not in _formats:
+        # dot -T? stderr is in the format:
+        #     Format: "?" not recognized. Use one of: canon cmap cmapx [...]
+        proc = Popen([dot, '-T?'], stdout=PIPE, stderr=PIPE)
+        stdout, stderr = proc.communicate()
+        _formats[dot] = sorted(
+            stderr.decode('utf-8', 'replace').strip().split(':')[-1].split()
+        )
+    return _formats[dot]
+
+
+def output_format(path):
+    """
+    Get the output format of a path from its extension.
+
+    :param str path: Path to the output file, for example ``graph.svg``.
+    :rtype: str
+    :return: The name of the format, for example ``svg``, or an empty string
+     if the path has no extension.
+    """
+    root, ext = splitext(path)
+    return ext[1:]
+
+
+class RenderCache(object):
+    """
+    Content-addressed on-disk cache of rendered graphs.
+
+    Each entry is a rendered file, keyed by a hash of the source of the graph,
+    the output format, the layout engine and the ``dot`` executable. Entries
+    are evicted in least recently used order when the size of all of them
+    exceeds the maximum size.
+
+    :param str directory: Directory to store the entries in. It's created if
+     it does not exist.
+    :param int max_size: Maximum size in bytes of all the entries.
+    :param bool hardlink: Hard-link the entries to the output files, instead of
+     copying them. Files are copied anyway if they cannot be linked, for
+     example if they are in different file systems. Hard-linked output files
+     must not be modified in place.
+    """
+
+    def __init__(
+            self, directory, max_size=100 * 1024 * 1024, hardlink=True):
+        self.directory = abspath(directory)
+        self.max_size = max_size
+        self.hardlink = hardlink and link is not None
+
+        if not isdir(self.directory):
+            makedirs(self.directory)
+
+    def key(self, digest, format, engine=None, dot=None):
+        """
+        Get the key of a rendered graph.
+
+        :param str digest: Hexadecimal digest of the source of the graph.
+        :param str format: Output format.
+        :param str engine: Layout engine, if any.
+        :param str dot: Path to the ``dot`` executable.
+        :rtype: str
+        :return: The key of the entry.
+        """
+        return sha256('\0'.join(
+            (digest, format, engine or '', dot or '')
+        ).encode('utf-8')).hexdigest()
+
+    def entry(self, key, format):
+        """
+        Get the path to an entry.
+
+        :param str key: Key of the entry, see :meth:`key`.
+        :param str format: Output format.
+        :rtype: str
+        """
+        return join(self.directory, '{}.{}'.format(key, format))
+
+    def fetch(self, key, format, path):
+        """
+        Get an entry from the cache.
+
+        :param str key: Key of the entry, see :meth:`key`.
+        :param str format: Output format.
+        :param str path: Path to the output file.
+        :rtype: bool
+        :return: True if the entry was found and linked or copied to the
+         output file, False otherwise.
+        """
+        entry = self.entry(key, format)
+        try:
+            utime(entry, None)
+            if isfile(path):
+                remove(path)
+            if self.hardlink:
+                try:
+                    link(entry, path)
+                    return True
+                except OSError:
+                    pass
+            copyfile(entry, path)
+        except (IOError, OSError):
+            return False
+        return True
+
+    def store(self, key, format, path):
+        """
+        Add a rendered file to the cache and evict the least recently used
+        entries if the cache is full.
+
+        :param str key: Key of the entry, see :meth:`key`.
+        :param str format: Output format.
+        :param str path: Path to the rendered file.
+        """
+        entry = self.entry(key, format)
+        temporary = '{}.{}.{}.tmp'.format(
+            entry, getpid(), current_thread().ident
+        )
+        copyfile(path, temporary)
+        rename(temporary, entry)
+        self.evict()
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the size of the cache is
+        below its maximum size.
+        """
+        entries = []
+        for name in listdir(self.directory):
+            if name.endswith('.tmp'):
+                continue
+            entry = join(self.directory, name)
+            try:
+                stats = stat(entry)
+            except OSError:
+                continue
+            entries.append((stats.st_mtime, stats.st_size, entry))
+
+        size = sum(entry[1] for entry in entries)
+        for mtime, entry_size, entry in sorted(entries):
+            if size <= self.max_size:
+                break
+            try:
+                remove(entry)
+            except OSError:
+                pass
+            size -= entry_size
+
+
+class _HashingWriter(object):
+    """
+    Text file-like object that writes UTF-8 to a binary file and hashes it.
+
+    :param fd: Binary file-like object to write to.
+    """
+
+    def __init__(self, fd):
+        self._fd = fd
+        self._hash = sha256()
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self._hash.update(data)
+        self._fd.write(data)
+
+    def hexdigest(self):
+        return self._hash.hexdigest()
+
+
+def _outputs(dot, paths):
+    """
+    Check the output paths of a render and create their parent directories.
+
+    :param str dot: Path to the ``dot`` executable.
+    :param list paths: Paths to the output files.
+    :rtype: list
+    :return: List of (path, format) tuples.
+    """
+    formats = supported_formats(dot)
+    outputs = []
+
+    for path in paths:
+        path = abspath(path)
+        format = output_format(path)
+        if format not in formats:
+            raise Exception(
+                'Unsupported format "{}". '
+                'Supported formats are: {}'.format(
+                    format, ', '.join(formats)
+                )
+            )
+
+        parent = dirname(path)
+        if not isdir(parent):
+            makedirs(parent)
+
+        outputs.append((path, format))
+
+    return outputs
+
+
+def _call(dot, outputs, engine, write=None, stdin=None):
+    """
+    Run ``dot`` to render a graph.
+
+    :param str dot: Path to the ``dot`` executable.
+    :param list outputs: List of (path, format) tuples.
+    :param str engine: Layout engine, if any.
+    :param write: Function to write the graph to the ``dot`` stdin.
+    :param stdin: File object with the graph to use as stdin instead.
+    """
+    command = [dot]
+    if engine is not None:
+        command.append('-K{}'.format(engine))
+    for path, format in outputs:
+        command.extend(['-T{}'.format(format), '-o', path])
+
+        # Output files may be hard links to cache entries, so they are
+        # replaced instead of overwritten
+        if isfile(path):
+            remove(path)
+
+    with TemporaryFile() as errors:
+        if stdin is not None:
+            returncode = Popen(command, stdin=stdin, stderr=errors).wait()
+
+        else:
+            proc = Popen(command, stdin=PIPE, stderr=errors)
+            try:
+                write(getwriter('utf-8')(proc.stdin))
+            except (IOError, OSError):
+                # dot exited before reading the whole graph, its error
+                # message is reported below
+                pass
+            finally:
+                try:
+                    proc.stdin.close()
+                except (IOError, OSError):
+                    pass
+                returncode = proc.wait()
+
+        if returncode != 0:
+            errors.seek(0)
+            raise Exception(
+                'Graphviz "dot" failed with code {}: {}'.format(
+                    returncode,
+                    errors.read().decode('utf-8', 'replace').strip()
+                )
+            )
+
+
+def render(write, paths, source=None, engine=None, cache=None):
+    """
+    Render a graph to one or more files using a single ``dot`` process.
+
+    To use this function the following must be considered:
+
+    - The format of each output file is taken from its extension. If a format
+      is not supported by ``dot`` an exception is raised.
+    - The output files will be overriden. If the output parent directories
+      do not exist they are created.
+    - The source of the graph is piped to ``dot`` as it's written, unless a
+      path to keep the source or a cache is given.
+    - If a cache is given, the formats found in it are linked or copied from
+      it and ``dot`` only renders the formats missing, if any.
+
+    :param write: Function that writes the source of the graph to the
+     file-like object it receives, like
+     :meth:`pynml.manager.NMLManager.write_graphviz`.
+    :param list paths: Paths to the output files.
+    :param str source: Path to a file to keep the source of the graph. If
+     `None`, the source is not saved.
+    :param str engine: Graphviz layout engine, like ``sfdp``. If `None`, the
+     layout set in the graph is used.
+    :param RenderCache cache: Cache of rendered graphs, if any.
+    :raises Exception: If ``dot`` is not found, a format is not supported or
+     the graph cannot be rendered.
+    """
+    dot = find_dot()
+    outputs = _outputs(dot, paths)
+
+    # Pipe the graph to dot
+    if source is None and cache is None:
+        _call(dot, outputs, engine, write=write)
+        return
+
+    # Write the graph to a file first
+    if source is not None:
+        fd = io_open(source, 'w+b')
+    else:
+        fd = TemporaryFile()
+
+    with fd:
+        writer = _HashingWriter(fd)
+        write(writer)
+        fd.flush()
+
+        if source is not None:
+            log.info('Saved graphviz file {}'.format(source))
+
+        missing = outputs
+        if cache is not None:
+            digest = writer.hexdigest()
+            keys = dict(
+                (format, cache.key(digest, format, engine, dot))
+                for path, format in outputs
+            )
+            missing = [
+                (path, format) for path, format in outputs
+                if not cache.fetch(keys[format], format, path)
+            ]
+
+        if not missing:
+            return
+
+        fd.seek(0)
+        _call(dot, missing, engine, stdin=fd)
+
+        if cache is not None:
+            for path, format in missing:
+                cache.store(keys[format], format, path)
+
+
+def render_many(jobs, workers=None, keep_gv=False, cache=None, **options):
+    """
+    Plot many namespaces using Graphviz concurrently.
+
+    Each job is plotted with :meth:`pynml.manager.NMLManager.save_graphviz`
+    by a pool of threads. The source of the graphs is generated in this
+    process while up to `workers` ``dot`` processes render them at the same
+    time.
+
+    ::
+
+        errors = render_many(
+            [(mgr, 'pod{}.svg'.format(pod)) for pod, mgr in managers],
+            workers=8
+        )
+
+    :param list jobs: List of (manager, path) tuples. The path can also be a
+     list of paths, see :meth:`pynml.manager.NMLManager.save_graphviz`.
+    :param int workers: Maximum number of ``dot`` processes to run at the
+     same time. If `None`, the number of CPUs is used.
+    :param bool keep_gv: Keep the `.gv` file with the source of each graph.
+    :param RenderCache cache: Cache of rendered graphs, if any.
+    :param options: Other arguments for
+     :meth:`pynml.manager.NMLManager.save_graphviz`, like ``summary``.
+    :rtype: list
+    :return: The result of each job, in the same order: `None` if the job
+     succeeded or the exception raised otherwise.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+
+    if workers is None:
+        workers = cpu_count()
+
+    def run(job):
+        mgr, path = job
+        try:
+            mgr.save_graphviz(path, keep_gv=keep_gv, cache=cache, **options)
+        except Exception as e:
+            log.error('Unable to plot {}: {}'.format(mgr.name, e))
+            return e
+        return None
+
+    pool = ThreadPool(max(1, min(workers, len(jobs))))
+    try:
+        return pool.map(run, jobs, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+__all__ = [
+    'RenderCache',
+    'find_dot', 'supported_formats', 'output_format', 'render', 'render_many'
+]
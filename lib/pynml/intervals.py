@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Sets of integer labels stored as intervals.
+
+Labels like VLAN identifiers or wavelength channels usually come in ranges,
+written in NML as ``1-100,200-300``. An :class:`IntervalSet` keeps only the
+bounds of those ranges, so set operations take time proportional to the
+number of ranges, not to the number of labels.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from bisect import bisect_right
+
+from six import string_types, integer_types
+
+
+def _bounds(intervals):
+    """
+    Get the bounds of a set, building it first if needed.
+    """
+    if isinstance(intervals, IntervalSet):
+        return intervals._bounds
+    return IntervalSet(intervals)._bounds
+
+
+class IntervalSet(object):
+    """
+    Immutable set of integers stored as sorted, disjoint intervals.
+
+    The set is built from an iterable of integers and (first, last) inclusive
+    ranges, in any order and overlapping or not, or from a string in NML
+    range syntax, see :meth:`parse`.
+
+    Internally, the set is a sorted tuple of half open bounds
+    ``(start, stop, start, stop, ...)``, so a value is in the set if the
+    number of bounds lower or equal to it is odd.
+
+    :param intervals: Integers and (first, last) ranges, or a string.
+    """
+
+    __slots__ = ('_bounds', )
+
+    def __init__(self, intervals=()):
+        if isinstance(intervals, IntervalSet):
+            self._bounds = intervals._bounds
+            return
+        if isinstance(intervals, string_types):
+            self._bounds = IntervalSet.parse(intervals)._bounds
+            return
+
+        ranges = []
+        for interval in intervals:
+            if isinstance(interval, integer_types):
+                ranges.append((interval, interval + 1))
+                continue
+            first, last = interval
+            if first > last:
+                raise Exception(
+                    'Invalid interval {}-{}'.format(first, last)
+                )
+            ranges.append((first, last + 1))
+        ranges.sort()
+
+        # Merge the overlapping and adjacent ranges
+        bounds = []
+        for start, stop in ranges:
+            if bounds and start <= bounds[-1]:
+                bounds[-1] = max(bounds[-1], stop)
+            else:
+                bounds.extend((start, stop))
+        self._bounds = tuple(bounds)
+
+    @classmethod
+    def _from_bounds(cls, bounds):
+        interval_set = cls.__new__(cls)
+        interval_set._bounds = tuple(bounds)
+        return interval_set
+
+    @classmethod
+    def parse(cls, text):
+        """
+        Parse a set in NML range syntax.
+
+        The syntax is a comma separated list of values and ranges of values,
+        like ``1-100,200,300-400``. Whitespace is ignored.
+
+        :param text: The string to parse. Integers and sets are accepted too.
+        :rtype: IntervalSet
+        :raises Exception: If the string isn't in range syntax.
+        """
+        if isinstance(text, IntervalSet):
+            return text
+        if isinstance(text, integer_types):
+            return cls((text, ))
+
+        intervals = []
+        for part in text.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            try:
+                # Allow negative bounds, like -5--1
+                first, separator, last = part[1:].partition('-')
+                first = int(part[0] + first)
+                intervals.append((first, int(last) if separator else first))
+            except ValueError:
+                raise Exception(
+                    'Invalid range {!r} in {!r}'.format(part, text)
+                )
+        return cls(intervals)
+
+    @classmethod
+    def coerce(cls, value):
+        """
+        Parse a value if it's a set in NML range syntax.
+
+        Labels that aren't integers, like the ``1530.33`` wavelength of a
+        DWDM channel, can't be stored as an :class:`IntervalSet`, so they
+        are kept as they are.
+
+        :param value: The value to parse, see :meth:`parse`.
+        :return: The parsed :class:`IntervalSet`, or the value as is if it
+         isn't a set in range syntax.
+        """
+        if not isinstance(value, string_types + integer_types + (cls, )):
+            return value
+        try:
+            return cls.parse(value)
+        except Exception:
+            return value
+
+    def intervals(self):
+        """
+        Iterate the intervals of the set.
+
+        :return: An iterator over the (first, last) inclusive ranges of the
+         set, in order.
+        """
+        bounds = self._bounds
+        for index in range(0, len(bounds), 2):
+            yield bounds[index], bounds[index + 1] - 1
+
+    def __iter__(self):
+        for first, last in self.intervals():
+            for value in range(first, last + 1):
+                yield value
+
+    def __len__(self):
+        bounds = self._bounds
+        return sum(
+            bounds[index + 1] - bounds[index]
+            for index in range(0, len(bounds), 2)
+        )
+
+    def __bool__(self):
+        return bool(self._bounds)
+
+    __nonzero__ = __bool__
+
+    def __contains__(self, value):
+        return bisect_right(self._bounds, value) % 2 == 1
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._bounds == other._bounds
+
+    def __ne__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._bounds != other._bounds
+
+    def __hash__(self):
+        return hash(self._bounds)
+
+    def __str__(self):
+        return ','.join(
+            str(first) if first == last else '{}-{}'.format(first, last)
+            for first, last in self.intervals()
+        )
+
+    def __repr__(self):
+        return 'IntervalSet({!r})'.format(str(self))
+
+    def union(self, other):
+        """
+        Get the values in this set or in the other.
+
+        :rtype: IntervalSet
+        """
+        bounds_a, bounds_b = self._bounds, _bounds(other)
+        if not bounds_b or bounds_a == bounds_b:
+            return self
+
+        # Merge the intervals of both sets by start, joining the overlapping
+        # and adjacent ones
+        index_a = index_b = 0
+        bounds = []
+        while index_a < len(bounds_a) or index_b < len(bounds_b):
+            if index_b == len(bounds_b) or (
+                    index_a < len(bounds_a) and
+                    bounds_a[index_a] <= bounds_b[index_b]):
+                start, stop = bounds_a[index_a], bounds_a[index_a + 1]
+                index_a += 2
+            else:
+                start, stop = bounds_b[index_b], bounds_b[index_b + 1]
+                index_b += 2
+
+            if bounds and start <= bounds[-1]:
+                if stop > bounds[-1]:
+                    bounds[-1] = stop
+            else:
+                bounds.append(start)
+                bounds.append(stop)
+
+        return IntervalSet._from_bounds(bounds)
+
+    def intersection(self, other):
+        """
+        Get the values both in this set and in the other.
+
+        :rtype: IntervalSet
+        """
+        bounds_a, bounds_b = self._bounds, _bounds(other)
+        if bounds_a == bounds_b:
+            return self
+
+        length_a, length_b = len(bounds_a), len(bounds_b)
+        if length_a == 2 and length_b == 2:
+            start = max(bounds_a[0], bounds_b[0])
+            stop = min(bounds_a[1], bounds_b[1])
+            return IntervalSet._from_bounds(
+                (start, stop) if start < stop else ()
+            )
+
+        # Overlap of each pair of intervals, advancing the one ending first
+        index_a = index_b = 0
+        bounds = []
+        while index_a < length_a and index_b < length_b:
+            stop_a, stop_b = bounds_a[index_a + 1], bounds_b[index_b + 1]
+            start = max(bounds_a[index_a], bounds_b[index_b])
+            stop = min(stop_a, stop_b)
+            if start < stop:
+                bounds.append(start)
+                bounds.append(stop)
+            if stop_a < stop_b:
+                index_a += 2
+            else:
+                index_b += 2
+
+        return IntervalSet._from_bounds(bounds)
+
+    def difference(self, other):
+        """
+        Get the values in this set that aren't in the other.
+
+        :rtype: IntervalSet
+        """
+        bounds_b = _bounds(other)
+        bounds = []
+
+        for index in range(0, len(self._bounds), 2):
+            start, stop = self._bounds[index], self._bounds[index + 1]
+
+            # Cut the interval with the intervals of the other set over it
+            position = bisect_right(bounds_b, start)
+            if position % 2 == 1:
+                start = bounds_b[position]
+                position += 1
+            while start < stop:
+                if position == len(bounds_b) or bounds_b[position] >= stop:
+                    bounds.append(start)
+                    bounds.append(stop)
+                    break
+                if bounds_b[position] > start:
+                    bounds.append(start)
+                    bounds.append(bounds_b[position])
+                start = bounds_b[position + 1]
+                position += 2
+
+        return IntervalSet._from_bounds(bounds)
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+    def issubset(self, other):
+        """
+        Check if all the values of this set are in the other.
+
+        :rtype: bool
+        """
+        bounds, bounds_b = self._bounds, _bounds(other)
+        if bounds == bounds_b:
+            return True
+
+        # Each interval must be inside a single interval of the other set
+        for index in range(0, len(bounds), 2):
+            position = bisect_right(bounds_b, bounds[index])
+            if position % 2 == 0 or bounds_b[position] < bounds[index + 1]:
+                return False
+        return True
+
+    __le__ = issubset
+
+    def first(self):
+        """
+        Get the lowest value of the set.
+
+        :return: The lowest value, or `None` if the set is empty.
+        """
+        return self._bounds[0] if self._bounds else None
+
+    def first_free(self, used=(), start=None):
+        """
+        Get the lowest value of the set that isn't used yet.
+
+        ::
+
+            vlans = IntervalSet('1-4094')
+            vlan = vlans.first_free(allocated)
+            allocated = allocated | [vlan]
+
+        Only one bisection in the used values is done for each interval of
+        the set, so the values are never walked one by one.
+
+        :param used: The values already used, as an :class:`IntervalSet` or
+         anything it can be built from.
+        :param int start: If given, only the values greater or equal to it
+         are considered.
+        :return: The lowest free value, or `None` if all are used.
+        """
+        bounds, used = self._bounds, _bounds(used)
+
+        index = 0
+        if start is not None:
+            index = bisect_right(bounds, start)
+            index -= index % 2
+
+        for index in range(index, len(bounds), 2):
+            value, stop = bounds[index], bounds[index + 1]
+            if start is not None and value < start:
+                value = start
+
+            # The end of a used interval is always free, as they are merged
+            position = bisect_right(used, value)
+            if position % 2 == 1:
+                value = used[position]
+            if value < stop:
+                return value
+
+        return None
+
+
+__all__ = ['IntervalSet']
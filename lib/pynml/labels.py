@@ -0,0 +1,444 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Label-aware path computation.
+
+Ports and links can be restricted to a set of labels, like VLAN identifiers,
+with a :class:`pynml.nml.Label`, or with the
+:class:`pynml.nml.LabelGroup` of a :class:`pynml.nml.PortGroup` or a
+:class:`pynml.nml.LinkGroup` they are part of. A path is only feasible if
+the same label is available on all the ports and links of each segment of
+the path.
+
+A segment ends, and the label can change, only:
+
+- Inside a node with a :class:`pynml.nml.SwitchingService` whose
+  ``label_swapping`` is true, from one of the inbound ports of the service
+  to one of its outbound ports. A service without inbound or outbound ports
+  applies to all the inbound or outbound ports of its node.
+- Inside a node, when entering it or leaving it through a port with a
+  :class:`pynml.nml.AdaptationService` or a
+  :class:`pynml.nml.DeAdaptationService`, or a port provided by one of them.
+
+The labels available along each segment are propagated as
+:class:`pynml.intervals.IntervalSet` objects, so checking if a segment is
+still feasible is an intersection of intervals, not of labels.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from heapq import heappush, heappop
+
+from .intervals import IntervalSet
+from .nml import (
+    Node, Port, PortGroup, Link, LinkGroup, SwitchingService,
+    AdaptationService, DeAdaptationService, unset
+)
+
+
+class LabelConstraints(object):
+    """
+    Labels available on the ports and links of a compiled graph, and the
+    vertices where the label can change.
+
+    :var labeltype: Type of the labels.
+    :var dict ports: Labels available on each port, by vertex id, as an
+     :class:`pynml.intervals.IntervalSet`. Ports not in the dictionary take
+     any label.
+    :var dict links: Labels available on each link, by link id.
+    :var set adaptations: Vertex ids of the ports where the label can change
+     when entering or leaving their node.
+    :var dict swaps: Label swapping rules of each node, by vertex id, as a
+     list of (inbound, outbound) sets of port vertex ids, or `None` for all
+     the inbound or outbound ports of the node.
+    :var dict hops: Labels available on each link and the port it reaches,
+     by (link id, vertex id), filled as they are needed.
+    """
+
+    __slots__ = (
+        'labeltype', 'ports', 'links', 'adaptations', 'swaps', 'hops'
+    )
+
+    def __init__(
+            self, labeltype=None, ports=None, links=None, adaptations=None,
+            swaps=None):
+        self.labeltype = labeltype
+        self.ports = ports or {}
+        self.links = links or {}
+        self.adaptations = adaptations or set()
+        self.swaps = swaps or {}
+        self.hops = {}
+
+    def swapping(self, node, inbound, outbound):
+        """
+        Check if the label can change inside a node.
+
+        :param int node: Vertex id of the node.
+        :param int inbound: Vertex id of the port the node is entered
+         through, or ``-1`` if the path starts at the node.
+        :param int outbound: Vertex id of the port the node is left through.
+        :rtype: bool
+        """
+        if inbound in self.adaptations or outbound in self.adaptations:
+            return True
+
+        for ports_in, ports_out in self.swaps.get(node, ()):
+            if (ports_in is None or inbound in ports_in) and \
+                    (ports_out is None or outbound in ports_out):
+                return True
+        return False
+
+
+def _enabled(value):
+    """
+    Check if an attribute is true, as a boolean or as a string read from
+    NML.
+    """
+    return value is True or str(value).lower() == 'true'
+
+
+def _label_set(label, labeltype):
+    """
+    Get the labels of a Label or LabelGroup, if of the given type.
+
+    Values that aren't sets of integers in range syntax, like wavelengths,
+    can't be intersected, so they are skipped.
+
+    :rtype: :class:`pynml.intervals.IntervalSet` or None
+    """
+    if label is None or label.value is None or label.value is unset:
+        return None
+    if label.labeltype != labeltype:
+        return None
+    labels = IntervalSet.coerce(label.value)
+    if not isinstance(labels, IntervalSet):
+        return None
+    return labels
+
+
+def _labeltypes(mgr):
+    """
+    Get the types of the labels of the ports, links and groups of a
+    namespace.
+
+    :rtype: set
+    """
+    labeltypes = set()
+    for cls, relation in (
+            (Port, 'iter_has_label'), (Link, 'iter_has_label'),
+            (PortGroup, 'iter_has_label_group'),
+            (LinkGroup, 'iter_has_label_group')):
+        for obj in mgr.objects_of(cls):
+            for label in getattr(obj, relation)():
+                if label.value is not None and label.value is not unset:
+                    labeltypes.add(label.labeltype)
+    return labeltypes
+
+
+def _members(group, relation):
+    """
+    Get the members of a PortGroup or LinkGroup, including the members of
+    the nested groups.
+    """
+    found = []
+    seen = set([group.identifier])
+    pending = [group]
+
+    while pending:
+        for member in getattr(pending.pop(), relation)():
+            if member.identifier in seen:
+                continue
+            seen.add(member.identifier)
+            if isinstance(member, (PortGroup, LinkGroup)):
+                pending.append(member)
+            else:
+                found.append(member)
+
+    return found
+
+
+def label_constraints(mgr, graph, labeltype=None):
+    """
+    Read the label constraints of a namespace.
+
+    The Label of a port or link takes precedence over the LabelGroup of the
+    groups it's part of. A port or link in several labeled groups takes the
+    labels available in all of them.
+
+    Labels of different types, like a VLAN and a MPLS label, aren't
+    comparable, so only the labels of a single type are taken into account.
+    Labels whose value isn't a set of integers in range syntax, like a
+    wavelength, are skipped.
+
+    :param mgr: Manager of the namespace.
+    :type mgr: :class:`pynml.manager.NMLManager`
+    :param CompiledGraph graph: Graph of the namespace.
+    :param labeltype: Only labels of this type are taken into account. If
+     `None`, the type of the labels of the namespace is used, which must be
+     the same for all of them.
+    :rtype: LabelConstraints
+    :raises Exception: If no type is given and the namespace has labels of
+     several types.
+    """
+    if labeltype is None:
+        labeltypes = _labeltypes(mgr)
+        if len(labeltypes) > 1:
+            raise Exception(
+                'Labels of several types found ({}), a labeltype must be '
+                'given'.format(', '.join(sorted(
+                    str(labeltype) for labeltype in labeltypes
+                )))
+            )
+        if labeltypes:
+            labeltype = labeltypes.pop()
+
+    ids = graph.ids
+    link_ids = dict(
+        (identifier, link)
+        for link, identifier in enumerate(graph.link_identifiers)
+    )
+    constraints = LabelConstraints(labeltype=labeltype)
+
+    for labels, ids_of, cls, group_cls, relation in (
+            (constraints.ports, ids, Port, PortGroup, 'iter_has_port'),
+            (constraints.links, link_ids, Link, LinkGroup, 'iter_has_link')):
+
+        for group in mgr.objects_of(group_cls):
+            available = _label_set(
+                next(group.iter_has_label_group(), None), labeltype
+            )
+            if available is None:
+                continue
+            for member in _members(group, relation):
+                vertex = ids_of.get(member.identifier, None)
+                if vertex is None:
+                    continue
+                if vertex in labels:
+                    labels[vertex] = labels[vertex] & available
+                else:
+                    labels[vertex] = available
+
+        for obj in mgr.objects_of(cls):
+            available = _label_set(next(obj.iter_has_label(), None), labeltype)
+            vertex = ids_of.get(obj.identifier, None)
+            if available is not None and vertex is not None:
+                labels[vertex] = available
+
+    def vertices(ports):
+        found = set()
+        for port in ports:
+            if isinstance(port, PortGroup):
+                found.update(
+                    ids[member.identifier]
+                    for member in _members(port, 'iter_has_port')
+                    if member.identifier in ids
+                )
+            elif port.identifier in ids:
+                found.add(ids[port.identifier])
+        return found
+
+    for port in mgr.objects_of(Port):
+        for service in port.iter_has_service():
+            constraints.adaptations.add(ids[port.identifier])
+            constraints.adaptations.update(vertices(
+                service.iter_provides_port()
+            ))
+            constraints.adaptations.update(vertices(
+                service.iter_can_provide_port()
+            ))
+
+    for service_cls in (AdaptationService, DeAdaptationService):
+        for service in mgr.objects_of(service_cls):
+            constraints.adaptations.update(vertices(
+                service.iter_provides_port()
+            ))
+
+    for node in mgr.objects_of(Node):
+        rules = []
+        for service in node.iter_has_service():
+            if not isinstance(service, SwitchingService) or \
+                    not _enabled(service.label_swapping):
+                continue
+            inbound = vertices(service.iter_has_inbound_port())
+            outbound = vertices(service.iter_has_outbound_port())
+            rules.append((inbound or None, outbound or None))
+        if rules:
+            constraints.swaps[ids[node.identifier]] = rules
+
+    return constraints
+
+
+def _dominated(settled, labels):
+    """
+    Check if a set of labels is covered by one already settled at a state.
+    """
+    for other in settled:
+        if other is None or (labels is not None and labels <= other):
+            return True
+    return False
+
+
+def label_path(graph, constraints, source, target, link_weights=None):
+    """
+    Find the shortest path between two vertices with a feasible label on
+    each segment.
+
+    A label constrained Dijkstra's search is run: each state of the search
+    is a vertex with the labels still available on the current segment, so
+    the same vertex can be reached by several states, as long as the labels
+    of each one aren't a subset of the labels of a state reached before with
+    a lower or equal cost.
+
+    :param CompiledGraph graph: The graph.
+    :param LabelConstraints constraints: The labels of the graph.
+    :param int source: Id of the source vertex.
+    :param int target: Id of the target vertex.
+    :param link_weights: Weight of each link, by link id. If `None`, the
+     path with less links is found.
+    :rtype: tuple or None
+    :return: A tuple (identifiers, labels) with the identifiers of the
+     vertices and links along the path, as
+     :func:`pynml.graph.path_identifiers` returns, and the label chosen for
+     each one, the lowest label available on its segment. Nodes, and ports
+     and links without label constraints on their segment, have `None` as
+     label. `None` is returned if there is no feasible path.
+    """
+    offsets = graph.offsets
+    targets = graph.targets
+    link_offsets = graph.link_offsets
+    links = graph.links
+    node_count = graph.node_count
+    ports = constraints.ports
+    link_labels = constraints.links
+    swaps = constraints.swaps
+    adaptations = constraints.adaptations
+    hops = constraints.hops
+
+    def restrict(labels, available):
+        if available is None:
+            return labels
+        if labels is None:
+            return available
+        return labels & available
+
+    def hop(link, head):
+        key = (link, head)
+        if key not in hops:
+            hops[key] = restrict(
+                link_labels.get(link, None), ports.get(head, None)
+            )
+        return hops[key]
+
+    # States: (vertex, labels, inbound port, parent, link, new segment)
+    states = []
+    settled = {}
+    pending = []
+
+    def push(cost, vertex, labels, inbound, parent, link, reset):
+        if labels is not None and not labels:
+            return
+        key = (vertex, inbound)
+        if _dominated(settled.get(key, ()), labels):
+            return
+        heappush(pending, (cost, len(states)))
+        states.append((vertex, labels, inbound, parent, link, reset))
+
+    push(0, source, ports.get(source, None), -1, -1, -1, True)
+
+    while pending:
+        cost, index = heappop(pending)
+        vertex, labels, inbound, parent, link, reset = states[index]
+
+        key = (vertex, inbound)
+        if _dominated(settled.get(key, ()), labels):
+            continue
+        settled.setdefault(key, []).append(labels)
+
+        if vertex == target:
+            return _backtrack(graph, states, index)
+
+        for edge in range(offsets[vertex], offsets[vertex + 1]):
+            head = targets[edge]
+
+            # From a node to one of its outbound ports
+            if vertex < node_count:
+                if constraints.swapping(vertex, inbound, head):
+                    push(
+                        cost, head, ports.get(head, None), -1, index, -1,
+                        True
+                    )
+                else:
+                    push(
+                        cost, head, restrict(labels, ports.get(head, None)),
+                        -1, index, -1, False
+                    )
+                continue
+
+            # From an inbound port to its node
+            first, last = link_offsets[edge], link_offsets[edge + 1]
+            if first == last:
+                entry = vertex if (
+                    head in swaps or vertex in adaptations
+                ) else -1
+                push(cost, head, labels, entry, index, -1, False)
+                continue
+
+            # From a port to another through each of the parallel links
+            for link in links[first:last]:
+                push(
+                    cost + (
+                        1 if link_weights is None else link_weights[link]
+                    ),
+                    head,
+                    restrict(labels, hop(link, head)),
+                    -1, index, link, False
+                )
+
+    return None
+
+
+def _backtrack(graph, states, index):
+    """
+    Get the identifiers and labels of the path to a state of the search.
+    """
+    identifiers = []
+    labels = []
+    current = states[index][1]
+
+    while index != -1:
+        vertex, available, inbound, parent, link, reset = states[index]
+        label = None if current is None else current.first()
+
+        identifiers.append(graph.identifiers[vertex])
+        labels.append(None if graph.is_node(vertex) else label)
+        if link != -1:
+            identifiers.append(graph.link_identifiers[link])
+            labels.append(label)
+
+        # The labels of the previous segment end at the parent
+        if reset and parent != -1:
+            current = states[parent][1]
+        index = parent
+
+    identifiers.reverse()
+    labels.reverse()
+    return identifiers, labels
+
+
+__all__ = ['LabelConstraints', 'label_constraints', 'label_path']
@@ -22,31 +22,49 @@ topology manager module.
 from __future__ import unicode_literals, absolute_import
 from __future__ import print_function, division
 
+from io import open as io_open
+from inspect import isabstract
+from contextlib import contextmanager
+from itertools import repeat, islice
+from weakref import ref
+from string import Formatter
 from logging import getLogger
-from os import makedirs, remove
+from os import makedirs
 from os.path import dirname, abspath, splitext, isdir
-from collections import OrderedDict
-from xml.dom import minidom
+from collections import OrderedDict, defaultdict
+from xml.sax.saxutils import quoteattr
 from xml.etree import ElementTree as etree  # noqa
-from subprocess import check_call, Popen, PIPE
-from distutils.spawn import find_executable
 
-from six import StringIO, text_type
-
-from .nml import NAMESPACES
+from six import StringIO, string_types, text_type
+
+from . import nml, timestamps, validators
+from .compound import expand
+from .connectivity import ConnectivityTracker
+from .graph import compile_graph, edge_weights, shortest_path, paths_many
+from .graph import equal_cost_paths, k_shortest_paths
+from .graph import path_identifiers, parallel_identifiers
+from .graphviz import render
+from .labels import label_constraints, label_path
+from .timestamps import Timestamp
+from .whatif import WhatIf
+from .nml import NAMESPACES, NetworkObject, unset
 from .nml import Node, Port, BidirectionalPort, Link, BidirectionalLink
+from .nml import Topology
 
 
 log = getLogger(__name__)
 
 
+INDENT = '    '
+
+
 GRAPHVIZ_TPL = """\
 digraph G {{
     // Style
     graph [fontname="Verdana" fontsize=8]
     node [fontname="Verdana" fontsize=7]
     edge [fontname="Verdana" fontsize=7]
-    graph [layout=fdp, nodesep=0.05 pad=0.0 margin=0.0 ranksep=0.25]
+    graph [layout={layout}, nodesep=0.05 pad=0.0 margin=0.0 ranksep=0.25]
     node [style=filled shape=box margin=0.05 width=0.25 height=0.25]
 
     label="{namespace}"
@@ -66,7 +84,7 @@ graph G {{
     graph [fontname="Verdana" fontsize=8]
     node [fontname="Verdana" fontsize=7]
     edge [fontname="Verdana" fontsize=7]
-    graph [nodesep=0.05 pad=0.0 margin=0.0 ranksep=0.25]
+    graph [{layout}nodesep=0.05 pad=0.0 margin=0.0 ranksep=0.25]
     node [style=filled shape=box margin=0.05 width=0.25 height=0.25]
 
     label="{namespace}"
@@ -83,20 +101,839 @@ graph G {{
 """
 
 
+GRAPHVIZ_TPL_SUMMARY = """\
+graph G {{
+    // Style
+    graph [fontname="Verdana" fontsize=8]
+    node [fontname="Verdana" fontsize=7]
+    edge [fontname="Verdana" fontsize=7]
+    graph [layout={layout}, overlap=prism outputorder=edgesfirst]
+    graph [nodesep=0.05 pad=0.0 margin=0.0 ranksep=0.25]
+    node [style=filled shape=box margin=0.05 width=0.25 height=0.25]
+
+    label="{namespace}"
+
+    // Nodes
+    {nodes}
+
+    // Clusters
+    {clusters}
+
+    // Links
+    {links}
+}}
+"""
+
+
+LAYOUT_THRESHOLD = 1000
+"""
+Number of vertices of a Graphviz graph above which the scalable ``sfdp``
+layout is used instead of ``fdp``, unless a layout is given.
+"""
+
+
+def auto_layout(vertices, layout=None):
+    """
+    Choose the Graphviz layout for a graph.
+
+    :param int vertices: Number of vertices of the graph.
+    :param str layout: Layout requested, if any.
+    :rtype: str
+    :return: The layout requested, or ``fdp`` for small graphs and ``sfdp``
+     for graphs with more vertices than :data:`LAYOUT_THRESHOLD`.
+    """
+    if layout is not None:
+        return layout
+    return 'fdp' if vertices <= LAYOUT_THRESHOLD else 'sfdp'
+
+
+def indent(element, level=0):
+    """
+    Indent in place an XML element and all its subelements.
+
+    :param element: Element to indent.
+    :type element: :py:class:`xml.etree.ElementTree.Element`
+    :param int level: Indentation level of the element.
+    """
+    children = list(element)
+    if not children:
+        return
+
+    element.text = '\n' + INDENT * (level + 1)
+    for child in children:
+        indent(child, level + 1)
+        child.tail = '\n' + INDENT * (level + 1)
+    children[-1].tail = '\n' + INDENT * level
+
+
+def write_template(fileobj, template, **sections):
+    """
+    Write a template to a file-like object, streaming its sections.
+
+    Sections given as strings are written as is. Any other section must be an
+    iterable of lines, that are written one by one separated by a new line
+    indented as the sections of the Graphviz templates, so the lines are never
+    joined in memory.
+
+    :param fileobj: File-like object to write to.
+    :param str template: Template with the ``{section}`` placeholders.
+    :param sections: Values of the sections, by name.
+    """
+    for literal, field, spec, conversion in Formatter().parse(template):
+        fileobj.write(literal)
+        if field is None:
+            continue
+
+        section = sections[field]
+        if isinstance(section, string_types):
+            fileobj.write(section)
+            continue
+
+        separator = ''
+        for line in section:
+            fileobj.write(separator + line)
+            separator = '\n' + INDENT
+
+
+def tolist(column):
+    """
+    Convert a column of values to a list.
+
+    :param column: Sequence of values, or an array with a ``tolist()`` method
+     like NumPy arrays.
+    :rtype: list
+    :return: The values of the column.
+    """
+    convert = getattr(column, 'tolist', None)
+    if convert is not None:
+        return convert()
+    return list(column)
+
+
+def stored(obj, attr_name):
+    """
+    Get the value stored for an attribute of a NML object.
+
+    Unlike :py:func:`getattr` the getter of the attribute isn't called, so
+    lazy timestamps are returned as they are, see
+    :class:`pynml.timestamps.Timestamp`.
+
+    :param NMLObject obj: NML object.
+    :param str attr_name: Name of the attribute.
+    :return: The value stored, or ``unset`` if the object has no such
+     attribute.
+    """
+    if isinstance(getattr(obj.__class__, attr_name, None), property):
+        return getattr(obj, '_' + attr_name, unset)
+    return getattr(obj, attr_name, unset)
+
+
 class NMLManager(object):
     """
     NML namespace manager.
 
     :param str name: Name of this namespace.
+    :param indexes: Names of the attributes to index, like ``name``,
+     ``encoding`` or ``version``. See :meth:`create_index`.
+    :param bool reverse_index: Index the relations of the objects by the
+     related object. See :meth:`create_reverse_index`.
     :var namespace: :py:class:`OrderedDict` with all NML objects registered.
      Use :meth:`register_object` to register new objects.
     :var metadata: Store all kwargs passed to the constructor.
+    :var timestamp: Timestamp pinned by :meth:`pinned_timestamp`, if any.
     """
 
-    def __init__(self, name='NML Namespace', **kwargs):
+    def __init__(
+            self, name='NML Namespace', indexes=(), reverse_index=False,
+            **kwargs):
         self.name = name
         self.namespace = OrderedDict()
         self.metadata = kwargs
+        self.timestamp = None
+
+        # Objects by class and by (class, value) of the indexed attributes
+        self._classes = defaultdict(OrderedDict)
+        self._indexes = OrderedDict()
+        self._timestamps = defaultdict(list)
+        for attr_name in indexes:
+            self.create_index(attr_name)
+
+        # Revision of the namespace, increased on every change seen, and last
+        # graph compiled
+        self._revision = 0
+        self._observed = None
+        self._graph = None
+
+        # Expansions of the serial compound links, and their revision
+        self._expansions = {}
+        self._expansions_revision = None
+
+        # (subject, related object) pairs by (related object identifier,
+        # relation) and subject identifier
+        self._reverse = None
+        if reverse_index:
+            self.create_reverse_index()
+
+    def _observe(self):
+        """
+        Start observing the changes in the relations of the objects of this
+        namespace.
+
+        A weak reference to this manager is added to the observers of each
+        registered object, and of the objects registered later, so only the
+        managers of an object are notified of its changes. See
+        :func:`pynml.nml.notify`.
+        """
+        if self._observed is None:
+            self._observed = ref(self)
+            self._attach(self.namespace.values())
+
+    def _attach(self, objects):
+        """
+        Add this manager to the observers of given objects.
+
+        :param objects: Iterable of objects registered in the namespace.
+        """
+        observed = (self._observed, )
+        for obj in objects:
+            obj._observers += observed
+
+    def _index(self, objects):
+        """
+        Add given objects to the class and attribute indexes.
+
+        :param objects: Iterable of objects being registered.
+        """
+        self._revision += 1
+
+        classes = self._classes
+        indexes = self._indexes.items()
+
+        for obj in objects:
+            cls = obj.__class__
+            classes[cls][obj.identifier] = obj
+            for attr_name, index in indexes:
+                self._index_value(attr_name, index, cls, obj)
+
+        if self._reverse is not None:
+            for obj in objects:
+                self._index_relations(obj)
+        if self._observed is not None:
+            self._attach(objects)
+
+    def _index_relations(self, subject):
+        """
+        Add the current relations of given object to the reverse index.
+
+        :param NMLObject subject: Object registered in the namespace.
+        """
+        reverse = self._reverse
+        for relname, related in subject.iter_relations():
+            for obj in related:
+                reverse[(obj.identifier, relname)][subject.identifier] = \
+                    (subject, obj)
+
+    def _subclasses(self, cls):
+        """
+        Get the classes of the registered objects that are subclasses of the
+        given class.
+
+        :param cls: NML class.
+        :rtype: list
+        """
+        return [other for other in self._classes if issubclass(other, cls)]
+
+    def create_index(self, attr_name):
+        """
+        Index the objects of this namespace by the value of given attribute.
+
+        Objects registered later are indexed too. The index is used by
+        :meth:`find` to find objects by that attribute.
+
+        Objects are indexed by the value their attribute has when they are
+        registered. If the attribute of a registered object changes
+        :meth:`find` won't return it for the new value. Objects with
+        unhashable values aren't indexed, :meth:`find` looks for them with a
+        linear scan.
+
+        :param str attr_name: Name of the attribute to index.
+        """
+        if attr_name in self._indexes:
+            return
+        index = self._indexes[attr_name] = defaultdict(OrderedDict)
+
+        for cls, objects in self._classes.items():
+            for obj in objects.values():
+                self._index_value(attr_name, index, cls, obj)
+
+    def _index_value(self, attr_name, index, cls, obj):
+        """
+        Add an object to the index of given attribute.
+
+        Objects are indexed by the value stored for the attribute, so lazy
+        timestamps are only formatted when the index is looked up, see
+        :meth:`_resolve_timestamps`.
+
+        :param str attr_name: Name of the indexed attribute.
+        :param index: Index of the attribute.
+        :param cls: Class of the object.
+        :param NMLObject obj: Object to index.
+        """
+        value = stored(obj, attr_name)
+        if value is unset:
+            return
+
+        try:
+            bucket = index[(cls, value)]
+        except TypeError:
+            return
+
+        bucket[obj.identifier] = obj
+        if value.__class__ is Timestamp and len(bucket) == 1:
+            self._timestamps[attr_name].append((cls, value))
+
+    def _resolve_timestamps(self, attr_name):
+        """
+        Format the lazy timestamps of the index of given attribute, merging
+        their objects with the objects indexed by the formatted value.
+
+        :param str attr_name: Name of the indexed attribute.
+        """
+        keys = self._timestamps.pop(attr_name, None)
+        if not keys:
+            return
+
+        index = self._indexes[attr_name]
+        for cls, timestamp in keys:
+            bucket = index.pop((cls, timestamp))
+            key = (cls, timestamp.isoformat())
+
+            other = index.get(key, None)
+            if other is None:
+                index[key] = bucket
+                continue
+
+            # Keep the order of registration
+            index[key] = OrderedDict(
+                (identifier, obj)
+                for identifier, obj in self._classes[cls].items()
+                if identifier in bucket or identifier in other
+            )
+
+    def create_reverse_index(self):
+        """
+        Index the relations of the objects of this namespace by the related
+        object.
+
+        Once created, the index is updated by the ``add_*`` and ``set_*``
+        methods of the objects and it's used by :meth:`referrers` to find the
+        objects related to a given one.
+
+        Only the relations of registered objects are indexed. Keeping the
+        index up to date makes the changes to the relations of all NML objects
+        slower, so it's disabled by default.
+        """
+        if self._reverse is not None:
+            return
+
+        self._reverse = defaultdict(OrderedDict)
+        for obj in self.namespace.values():
+            self._index_relations(obj)
+
+        self._observe()
+
+    def relation_changed(self, subject, relation, removed, added):
+        """
+        Update the revision of the namespace and the reverse index after a
+        change in a relation of an object.
+
+        See :func:`pynml.nml.notify`.
+
+        :param NMLObject subject: Object whose relation changed.
+        :param str relation: Name of the relation.
+        :param tuple removed: Objects no longer related.
+        :param tuple added: Objects related.
+        """
+        identifier = subject.identifier
+        if self.namespace.get(identifier, None) is not subject:
+            return
+
+        self._revision += 1
+
+        reverse = self._reverse
+        if reverse is None:
+            return
+        # Objects with the same identifier replace each other in the
+        # relations, so entries are only removed for the same object
+        for obj in removed:
+            if obj is None:
+                continue
+            key = (obj.identifier, relation)
+            referrers = reverse.get(key, None)
+            if referrers is None:
+                continue
+            entry = referrers.get(identifier, None)
+            if entry is not None and entry[1] is obj:
+                del referrers[identifier]
+                if not referrers:
+                    del reverse[key]
+        for obj in added:
+            reverse[(obj.identifier, relation)][identifier] = (subject, obj)
+
+    def referrers(self, obj, relation):
+        """
+        Iterate over the registered objects related to given object.
+
+        ::
+
+            # Node of a port
+            node = next(mgr.referrers(port, 'hasInboundPort'))
+
+        The reverse index must be created first, see
+        :meth:`create_reverse_index`.
+
+        :param NMLObject obj: Object the referrers point to.
+        :param str relation: Name of the relation, for example ``isSink``.
+        :return: An iterator to the objects that have given object in their
+         relation, in the order they were related.
+        :raises Exception: If the reverse index wasn't created.
+        """
+        if self._reverse is None:
+            raise Exception('Reverse index not created')
+
+        related = self._reverse.get((obj.identifier, relation), {})
+        return iter([
+            subject for subject, target in related.values() if target is obj
+        ])
+
+    def compile_graph(self):
+        """
+        Compile the nodes, ports and links of this namespace into a graph.
+
+        The compiled graph is cached and returned again until an object is
+        registered or the relations of a registered object change. See
+        :class:`pynml.graph.CompiledGraph`.
+
+        Once a graph is compiled, this manager observes the changes in the
+        relations of all NML objects to know when the graph is outdated.
+
+        :rtype: :class:`pynml.graph.CompiledGraph`
+        :return: The graph of the current namespace.
+        """
+        self._observe()
+
+        graph = self._graph
+        if graph is None or graph.revision != self._revision:
+            graph = self._graph = compile_graph(self, revision=self._revision)
+        return graph
+
+    def _vertex(self, graph, obj):
+        """
+        Get the id of a node or port in the compiled graph.
+
+        :param CompiledGraph graph: Graph of this namespace.
+        :param obj: A registered node or port.
+        :rtype: int
+        """
+        vertex = graph.ids.get(obj.identifier, None)
+        if vertex is None:
+            raise Exception(
+                'Object {} is not a registered Node or Port'.format(
+                    obj.identifier
+                )
+            )
+        return vertex
+
+    def _weights(self, graph, weight, default):
+        """
+        Get the weights of the edges of the compiled graph, read from the
+        metadata of its links and cached in the graph.
+
+        :param CompiledGraph graph: Graph of this namespace.
+        :param str weight: Metadata key of the weight of the links.
+        :param default: Weight of the links without that key.
+        :rtype: tuple
+        :return: A tuple (link_weights, weights, best) with the weight of
+         each link followed by the arrays returned by
+         :func:`pynml.graph.edge_weights`.
+        """
+        key = ('weights', weight, default)
+        if key not in graph.cache:
+            link_weights = []
+            for identifier in graph.link_identifiers:
+                link = self.namespace.get(identifier, None)
+                if link is None:
+                    link_weights.append(default)
+                else:
+                    link_weights.append(link.metadata.get(weight, default))
+            graph.cache[key] = (link_weights, ) + edge_weights(
+                graph, link_weights
+            )
+        return graph.cache[key]
+
+    def shortest_path(self, source, target, weight=None, default=1):
+        """
+        Find the shortest path between two nodes or ports.
+
+        Paths go from a node to one of its outbound ports, through a link
+        the port is source of to a port that is sink of it, and from an
+        inbound port to its node. Unidirectional links are only followed from
+        their source to their sink.
+
+        Paths are found over the graph returned by :meth:`compile_graph`. The
+        weights read from the metadata of the links are cached with that
+        graph, so changes in the metadata of the links are only seen once the
+        graph is compiled again.
+
+        :param source: Node or port the path starts at.
+        :param target: Node or port the path ends at.
+        :param str weight: Key of the weight of each link in its metadata. If
+         `None`, the path with less links is found.
+        :param default: Weight of the links without the weight key.
+        :rtype: list or None
+        :return: The objects along the path, like
+         ``[node, outbound port, link, inbound port, node]``, or `None` if
+         there is no path from source to target. Links that are not
+         registered in this namespace are `None` in the path.
+        """
+        graph = self.compile_graph()
+        vertex = self._vertex(graph, source)
+
+        weights = best = None
+        if weight is not None:
+            _, weights, best = self._weights(graph, weight, default)
+
+        edges = shortest_path(
+            graph, vertex, self._vertex(graph, target), weights=weights
+        )
+        if edges is None:
+            return None
+
+        return [
+            self.get_object(identifier)
+            for identifier in path_identifiers(graph, vertex, edges, best)
+        ]
+
+    def paths_many(self, pairs, weight=None, default=1, workers=None):
+        """
+        Find the shortest paths between many pairs of nodes or ports.
+
+        The graph of this namespace is compiled once and shared with a pool
+        of processes that search the paths, see
+        :func:`pynml.graph.paths_many`. Pairs with the same source are
+        searched together.
+
+        ::
+
+            for (source, target), path in zip(
+                    pairs, mgr.paths_many(pairs, workers=8)):
+                ...
+
+        Stopping early::
+
+            with closing(mgr.paths_many(pairs, workers=8)) as paths:
+                first = next(paths)
+
+        :param list pairs: The (source, target) nodes or ports of each query.
+        :param str weight: Key of the weight of each link in its metadata, see
+         :meth:`shortest_path`.
+        :param default: Weight of the links without the weight key.
+        :param int workers: Number of processes to use. If `None`, the number
+         of CPUs is used.
+        :return: An iterator over the path of each pair, in the same order,
+         as returned by :meth:`shortest_path`. Close it if it's not consumed
+         until the end, to stop the pool.
+        """
+        graph = self.compile_graph()
+
+        weights = best = None
+        if weight is not None:
+            _, weights, best = self._weights(graph, weight, default)
+
+        vertices = [
+            (self._vertex(graph, source), self._vertex(graph, target))
+            for source, target in pairs
+        ]
+
+        paths = paths_many(graph, vertices, weights=weights, workers=workers)
+
+        def objects():
+            try:
+                for (source, _), path in zip(vertices, paths):
+                    if path is None:
+                        yield None
+                        continue
+                    yield [
+                        self.get_object(identifier)
+                        for identifier in path_identifiers(
+                            graph, source, path, best
+                        )
+                    ]
+            finally:
+                paths.close()
+
+        return objects()
+
+    def _parallel_paths(self, search, source, target, weight, default):
+        """
+        Iterate over the paths found by a search with all their parallel
+        links.
+
+        :param function search: Search over the compiled graph, like
+         :func:`pynml.graph.equal_cost_paths`.
+        :param source: Node or port the paths start at.
+        :param target: Node or port the paths end at.
+        :param str weight: Key of the weight of each link in its metadata.
+        :param default: Weight of the links without the weight key.
+        :return: An iterator over the objects along each path.
+        """
+        graph = self.compile_graph()
+        vertex = self._vertex(graph, source)
+
+        weights = link_weights = None
+        if weight is not None:
+            link_weights, weights, _ = self._weights(graph, weight, default)
+
+        def objects(identifier):
+            if isinstance(identifier, tuple):
+                return tuple(self.get_object(link) for link in identifier)
+            return self.get_object(identifier)
+
+        for edges in search(
+                graph, vertex, self._vertex(graph, target), weights=weights):
+            yield [
+                objects(identifier)
+                for identifier in parallel_identifiers(
+                    graph, vertex, edges, weights, link_weights
+                )
+            ]
+
+    def equal_cost_paths(self, source, target, weight=None, default=1):
+        """
+        Iterate over all the shortest paths between two nodes or ports.
+
+        Paths are found as in :meth:`shortest_path`, but all the paths with
+        the minimal cost are generated, lazily, one at a time.
+
+        Parallel links between the same pair of ports, like the links of
+        parallel :class:`pynml.nml.BidirectionalLink` between the same pair
+        of :class:`pynml.nml.BidirectionalPort`, don't multiply the paths.
+        Instead, each path has a tuple with all the parallel links with the
+        minimal weight in place of each link. The number of equal-cost paths
+        over the links is the product of the lengths of those tuples.
+
+        :param source: Node or port the paths start at.
+        :param target: Node or port the paths end at.
+        :param str weight: Key of the weight of each link in its metadata. If
+         `None`, the paths with less links are found.
+        :param default: Weight of the links without the weight key.
+        :return: An iterator over the objects along each path, like
+         ``[node, outbound port, (link, parallel link), inbound port, node]``.
+        """
+        return self._parallel_paths(
+            equal_cost_paths, source, target, weight, default
+        )
+
+    def k_shortest_paths(
+            self, source, target, k=None, weight=None, default=1):
+        """
+        Iterate over the loopless paths between two nodes or ports, from the
+        shortest to the longest.
+
+        Paths are found lazily, each one when requested, using Yen's
+        algorithm. Parallel links are returned together as in
+        :meth:`equal_cost_paths`, and count as a single path.
+
+        :param source: Node or port the paths start at.
+        :param target: Node or port the paths end at.
+        :param int k: Maximum number of paths to find. If `None`, all the
+         loopless paths are found.
+        :param str weight: Key of the weight of each link in its metadata. If
+         `None`, each link weights 1.
+        :param default: Weight of the links without the weight key.
+        :return: An iterator over the objects along each path.
+        """
+        paths = self._parallel_paths(
+            k_shortest_paths, source, target, weight, default
+        )
+        if k is not None:
+            paths = islice(paths, k)
+        return paths
+
+    def label_path(
+            self, source, target, labeltype=None, weight=None, default=1):
+        """
+        Find the shortest path between two nodes or ports with a label, like
+        a VLAN, available end to end on each segment.
+
+        Paths are found as in :meth:`shortest_path`, but the labels of the
+        ports and links are taken into account. The label can only change
+        inside a node with a label swapping
+        :class:`pynml.nml.SwitchingService`, or through a port with an
+        adaptation service. See :mod:`pynml.labels`.
+
+        The labels are read once per graph returned by :meth:`compile_graph`
+        and cached with it, so changes in the values of the Label and
+        LabelGroup objects are only seen once the graph is compiled again.
+        For the cache to notice the changes in the relations of the services
+        and groups, they must be registered too.
+
+        :param source: Node or port the path starts at.
+        :param target: Node or port the path ends at.
+        :param labeltype: Only labels of this type are taken into account. If
+         `None`, the type of the labels of the namespace is used, see
+         :func:`pynml.labels.label_constraints`.
+        :param str weight: Key of the weight of each link in its metadata. If
+         `None`, the path with less links is found.
+        :param default: Weight of the links without the weight key.
+        :rtype: tuple or None
+        :return: A tuple (path, labels) with the objects along the path, as
+         :meth:`shortest_path` returns, and the label to use on each one, or
+         `None` if there is no feasible path. Nodes, and the ports and links
+         of unconstrained segments, have `None` as label.
+        :raises Exception: If no type is given and the namespace has labels
+         of several types.
+        """
+        graph = self.compile_graph()
+        vertex = self._vertex(graph, source)
+
+        key = ('labels', labeltype)
+        if key not in graph.cache:
+            graph.cache[key] = label_constraints(
+                self, graph, labeltype=labeltype
+            )
+
+        link_weights = None
+        if weight is not None:
+            link_weights = self._weights(graph, weight, default)[0]
+
+        found = label_path(
+            graph, graph.cache[key], vertex, self._vertex(graph, target),
+            link_weights=link_weights
+        )
+        if found is None:
+            return None
+
+        identifiers, labels = found
+        path = [self.get_object(identifier) for identifier in identifiers]
+        return path, labels
+
+    def what_if(self, sources=None):
+        """
+        Get a what-if engine to evaluate the impact of failures in this
+        namespace.
+
+        ::
+
+            engine = mgr.what_if()
+            for impact in engine.evaluate_many(
+                    [[link] for link in candidates], workers=8):
+                print(impact.disconnected)
+
+        The engine is built over the graph returned by :meth:`compile_graph`
+        and cached with it. See :class:`pynml.whatif.WhatIf`.
+
+        :param sources: Nodes whose paths are evaluated. If `None`, the paths
+         from all nodes are evaluated.
+        :rtype: :class:`pynml.whatif.WhatIf`
+        """
+        graph = self.compile_graph()
+
+        if sources is not None:
+            sources = tuple(
+                getattr(source, 'identifier', source) for source in sources
+            )
+
+        key = ('what-if', sources)
+        if key not in graph.cache:
+            graph.cache[key] = WhatIf(graph, sources=sources)
+        return graph.cache[key]
+
+    def expand_serial_compound_link(self, link_group):
+        """
+        Expand a serial compound link into the links it goes through.
+
+        See :func:`pynml.compound.expand`. The expansions of all the
+        LinkGroup objects found are cached, and reused by the following
+        calls, until an object is registered or the relations of a
+        registered object change. For the cache to notice the changes, the
+        OrderedList and ListItem objects must be registered too.
+
+        :param link_group: The serial compound link.
+        :type link_group: :class:`pynml.nml.LinkGroup`
+        :rtype: tuple
+        :return: The :class:`pynml.nml.Link` objects, in order.
+        """
+        self._observe()
+
+        if self._expansions_revision != self._revision:
+            self._expansions = {}
+            self._expansions_revision = self._revision
+
+        return expand(link_group, self._expansions)
+
+    def objects_of(self, cls):
+        """
+        Iterate over all registered objects of given class or its subclasses.
+
+        Objects are iterated grouped by class and in the order they were added
+        into the namespace.
+
+        :param cls: NML class, for example :class:`pynml.nml.Port` or
+         :class:`pynml.nml.NetworkObject`.
+        :return: An iterator to the objects of given class.
+        """
+        for subcls in self._subclasses(cls):
+            for obj in self._classes[subcls].values():
+                yield obj
+
+    def find(self, cls, **attrs):
+        """
+        Iterate over the registered objects of given class with the given
+        attribute values.
+
+        ::
+
+            ethernet = mgr.find(Port, encoding=ETHERNET)
+
+        Attributes indexed with :meth:`create_index` are looked up in their
+        index, so the cost depends on the number of objects found and not on
+        the size of the namespace.
+
+        :param cls: NML class, for example :class:`pynml.nml.Port`.
+        :param attrs: Values of the attributes of the objects to find.
+        :return: An iterator to the objects found, grouped by class and in the
+         order they were added into the namespace.
+        """
+        indexed = []
+        for attr_name, value in attrs.items():
+            if attr_name not in self._indexes:
+                continue
+
+            # Unhashable values are not indexed
+            try:
+                hash(value)
+            except TypeError:
+                continue
+
+            self._resolve_timestamps(attr_name)
+            indexed.append((attr_name, self._indexes[attr_name], value))
+
+        for subcls in self._subclasses(cls):
+            candidates = self._classes[subcls]
+
+            # Use the smallest index bucket
+            for attr_name, index, value in indexed:
+                bucket = index.get((subcls, value), {})
+                if len(bucket) < len(candidates):
+                    candidates = bucket
+
+            for obj in candidates.values():
+                if all(
+                    getattr(obj, attr_name, unset) == value
+                    for attr_name, value in attrs.items()
+                ):
+                    yield obj
 
     def register_object(self, obj):
         """
@@ -110,6 +947,262 @@ class NMLManager(object):
                 'Object already in namespace {}'.format(obj.identifier)
             )
         self.namespace[obj.identifier] = obj
+        self._index((obj, ))
+
+    def bulk_create(self, cls, records):
+        """
+        Create and register many objects of the same class at once.
+
+        To use this function the following must be considered:
+
+        - The records are given in columnar form: a mapping of attribute name
+          to a sequence (for example, a list or a NumPy array) with the value
+          of that attribute for each object. The ``identifier`` column is
+          required, missing columns or ``None`` values take the same default
+          values as the class constructor, like ``str(id(obj))`` for the
+          identifier.
+        - All values are validated before registering any object, with the
+          ``validate_*`` methods of the class. Each distinct value of an
+          attribute is validated only once.
+        - Objects are built without calling their constructor and a single
+          timestamp is used as default version for all of them, the one
+          pinned with :meth:`pinned_timestamp` if any.
+        - It is about twice as fast as calling the constructor of each
+          object and registering it. Most of the remaining cost is the
+          allocation of the objects and the update of the namespace and its
+          indexes.
+
+        :param cls: Class of the objects to create. It must be a subclass of
+         :class:`pynml.nml.NetworkObject`.
+        :param dict records: Attributes of the objects to create, by
+         attribute name.
+        :rtype: list
+        :return: The new objects, in the same order as the records.
+        :raises Exception: If a column is unknown or of a different size, or
+         if an identifier is duplicated or already in the namespace.
+        """
+        if not issubclass(cls, NetworkObject) or isabstract(cls):
+            raise Exception(
+                'Unable to bulk create objects of class {}'.format(
+                    cls.__name__
+                )
+            )
+
+        # Gather columns
+        columns = {}
+        for attr_name, column in records.items():
+            if attr_name not in cls.attributes:
+                raise Exception(
+                    'Unknown attribute {} for {}'.format(
+                        attr_name, cls.__name__
+                    )
+                )
+            columns[attr_name] = tolist(column)
+
+        if 'identifier' not in columns:
+            raise Exception('Missing identifier column')
+
+        for attr_name, column in columns.items():
+            if len(column) != len(columns['identifier']):
+                raise Exception(
+                    'Column {} has {} values, expected {}'.format(
+                        attr_name, len(column), len(columns['identifier'])
+                    )
+                )
+
+        # Build objects, with the same default identifier as the constructor
+        objects = [cls.__new__(cls) for obj in columns['identifier']]
+        for obj in objects:
+            obj._initialize()
+        identifiers = columns['identifier'] = [
+            str(id(obj)) if identifier is None else identifier
+            for obj, identifier in zip(objects, columns['identifier'])
+        ]
+
+        if len(set(identifiers)) != len(identifiers):
+            raise Exception('Duplicated identifiers')
+        for identifier in identifiers:
+            if identifier in self.namespace:
+                raise Exception(
+                    'Object already in namespace {}'.format(identifier)
+                )
+
+        # Validate each distinct value once, keeping the value the setter
+        # would store
+        for attr_name, column in columns.items():
+            validate = getattr(cls, 'validate_' + attr_name, None)
+            if validate is None:
+                continue
+
+            # Identifiers are all distinct URIs, checked at once
+            if attr_name == 'identifier' and \
+                    validators.all_valid_uris(column):
+                continue
+
+            stored = dict(
+                (value, validate(value))
+                for value in set(column) if value is not None
+            )
+            columns[attr_name] = [
+                None if value is None else stored[value] for value in column
+            ]
+
+        version = self.timestamp
+        if version is None:
+            version = timestamps.now()
+
+        for attr_name in cls.attributes:
+            column = columns.get(attr_name, None)
+
+            # Plain attributes are stored as is
+            if not isinstance(getattr(cls, attr_name, None), property):
+                for obj, value in zip(objects, column or repeat(None)):
+                    setattr(obj, attr_name, value)
+                continue
+
+            # Same defaults as the NetworkObject constructors
+            default = version if attr_name == 'version' else unset
+
+            storage = '_' + attr_name
+            for obj, value in zip(objects, column or repeat(None)):
+                if value is None and attr_name == 'name':
+                    value = '{}({})'.format(cls.__name__, str(id(obj)))
+                elif value is None:
+                    value = default
+                setattr(obj, storage, value)
+
+        # Register objects
+        self.namespace.update(zip(identifiers, objects))
+        self._index(objects)
+        return objects
+
+    def bulk_relate(self, relation, pairs):
+        """
+        Relate many objects of the namespace at once.
+
+        To use this function the following must be considered:
+
+        - The pairs are given in columnar form: a tuple of two sequences (for
+          example, lists or NumPy arrays) with the identifiers of the subjects
+          and the identifiers of the objects to relate with them.
+        - All pairs are validated before relating any object. The relation is
+          validated only once for each distinct pair of classes.
+        - For relations with a fixed cardinality, like ``hasPort`` of
+          :class:`pynml.nml.BidirectionalPort`, all the objects of each
+          subject are set at once, in order.
+
+        :param str relation: Name of the NML relation, for example
+         ``hasInboundPort``.
+        :param tuple pairs: Identifiers of the subjects and identifiers of the
+         objects to relate.
+        :raises Exception: If an object is not in the namespace, the relation
+         is unknown or the number of objects doesn't match the cardinality of
+         the relation.
+        """
+        subjects, objects = (tolist(column) for column in pairs)
+        if len(subjects) != len(objects):
+            raise Exception(
+                'Got {} subjects and {} objects'.format(
+                    len(subjects), len(objects)
+                )
+            )
+
+        # Resolve objects
+        try:
+            subjects = [self.namespace[identifier] for identifier in subjects]
+            objects = [self.namespace[identifier] for identifier in objects]
+        except KeyError as e:
+            raise Exception('Object not in namespace {}'.format(e.args[0]))
+
+        # Validate relation once per distinct pair of classes
+        checked = set()
+        for subject, obj in zip(subjects, objects):
+            classes = (subject.__class__, obj.__class__)
+            if classes in checked:
+                continue
+
+            suffix = subject.relation_methods.get(relation, None)
+            if suffix is None:
+                raise Exception(
+                    'Unknown relation {} for {}'.format(
+                        relation, subject.__class__.__name__
+                    )
+                )
+
+            # The check method raises if the classes can't be related
+            getattr(subject, suffix)(obj)
+            checked.add(classes)
+
+        if not subjects:
+            return
+
+        # Aggregations are added one by one
+        suffix = subjects[0].relation_methods[relation]
+        if hasattr(subjects[0], 'add_' + suffix):
+            for subject, obj in zip(subjects, objects):
+                getattr(subject, 'add_' + suffix)(obj)
+            return
+
+        # Compositions are set at once per subject
+        grouped = OrderedDict()
+        for subject, obj in zip(subjects, objects):
+            grouped.setdefault(subject, []).append(obj)
+
+        for subject, related in grouped.items():
+            cardinality = len(getattr(subject, 'get_' + suffix)())
+            if len(related) != cardinality:
+                raise Exception(
+                    'Relation {} of {} requires {} objects, got {}'.format(
+                        relation, subject.identifier, cardinality,
+                        len(related)
+                    )
+                )
+
+        for subject, related in grouped.items():
+            getattr(subject, 'set_' + suffix)(*related)
+
+    @contextmanager
+    def pinned_timestamp(self, timestamp=None):
+        """
+        Context manager that pins the default timestamp of the objects built
+        by this manager.
+
+        All NML objects created inside this context by this manager, with
+        :meth:`bulk_create`, :meth:`load_nml` or the ``create_*`` helpers of
+        :class:`ExtendedNMLManager`, share the pinned timestamp as their
+        default ``version`` and don't read the clock. The timestamp is
+        formatted only when read, for example when exporting the namespace.
+
+        ::
+
+            with mgr.pinned_timestamp():
+                mgr.load_nml(path)
+                mgr.bulk_create(Port, {'identifier': identifiers})
+
+        Contexts can be nested. Objects created directly with their
+        constructor, and the ones created by other managers, are not affected.
+        See :func:`pynml.timestamps.pinned` to pin the default timestamp of all
+        new objects.
+
+        :param timestamp: Timestamp to pin, as an ISO 8601 string or a
+         :py:class:`datetime.datetime`. If `None`, the current time is used.
+        :return: The pinned timestamp.
+        """
+        previous = self.timestamp
+        self.timestamp = pinned = timestamps.create(timestamp)
+        try:
+            yield pinned
+        finally:
+            self.timestamp = previous
+
+    def _build(self, cls, **kwargs):
+        """
+        Build an object, with the timestamp pinned by
+        :meth:`pinned_timestamp` as default version.
+        """
+        if self.timestamp is not None and 'version' in cls.attributes:
+            kwargs.setdefault('version', self.timestamp)
+        return cls(**kwargs)
 
     def get_object(self, identifier):
         """
@@ -129,19 +1222,43 @@ class NMLManager(object):
         :rtype: str
         :return: The current NML namespace in NML XML format.
         """
-        root = etree.Element('Namespace')
-        for xmlns, uri in NAMESPACES.items():
-            root.attrib['xmlns:{}'.format(xmlns)] = uri
+        output = StringIO()
+        self.write_nml(output, pretty=pretty)
+        return output.getvalue()
+
+    def write_nml(self, fileobj, pretty=False):
+        """
+        Write current namespace in NML XML format to a file object.
+
+        Objects are serialized and written one by one, so no XML tree of the
+        whole namespace is ever built and the first bytes reach the file
+        object immediately.
+
+        :param fileobj: Text file object to write the NML XML to.
+        :param bool pretty: Pretty print the output XML. Each object is
+         indented in place before being serialized.
+        """
+        fileobj.write('<?xml version="1.0" encoding="utf-8"?>\n')
+        fileobj.write('<Namespace {}>'.format(' '.join(
+            'xmlns:{}={}'.format(xmlns, quoteattr(uri))
+            for xmlns, uri in NAMESPACES.items()
+        )))
+
+        separator = '\n' + INDENT if pretty else ''
 
         for obj_id, obj in self.namespace.items():
-            obj.as_nml(parent=root)
+            element = obj.as_nml()
+            if pretty:
+                indent(element, level=1)
+
+            fileobj.write(separator)
+            fileobj.write(text_type(
+                etree.tostring(element, encoding='utf-8'), 'utf-8'
+            ))
 
-        xml = etree.tostring(root, encoding='utf-8')
         if pretty:
-            infile = StringIO(text_type(xml, 'utf-8'))
-            doc = minidom.parse(infile)
-            xml = doc.toprettyxml(indent='    ', encoding='utf-8')
-        return text_type(xml, 'utf-8')
+            fileobj.write('\n')
+        fileobj.write('</Namespace>\n')
 
     def save_nml(self, path, pretty=True):
         """
@@ -164,54 +1281,353 @@ class NMLManager(object):
             makedirs(parent)
 
         # Export namespace
-        nml_xml = self.export_nml(pretty=True)
-        with open(path, 'w') as fd:
-            fd.write(nml_xml)
+        with io_open(path, 'w', encoding='utf-8') as fd:
+            self.write_nml(fd, pretty=pretty)
 
-        log.info('Saved graphviz file {}'.format(path))
+        log.info('Saved NML file {}'.format(path))
 
-    def export_graphviz(self):
+    def load_nml(self, path, trusted=False):
         """
-        Export current namespace as a Graphviz graph.
+        Load a NML XML file into the namespace managed by this Manager.
 
-        :rtype: str
-        :return: The current NML namespace in Graphviz graph notation.
+        To use this function the following must be considered:
+
+        - The file is parsed incrementally using
+          :py:func:`xml.etree.ElementTree.iterparse`. Each object element is
+          discarded as soon as the NML object it describes is built, so memory
+          usage is bounded by the namespace and not by the size of the file.
+        - Relations pointing to objects defined later in the file are recorded
+          in a patch-up table and set as soon as all the objects they refer to
+          are registered. The file is parsed only once.
+        - Every object is registered using :meth:`register_object`, so loading
+          objects already in the namespace raises an exception.
+        - Attributes can be given by their name in the NML specification,
+          like ``id``, or by their name in the NML classes, like
+          ``identifier``, as written by :meth:`save_nml`, and as XML
+          attributes or as child elements, like ``<nml:name>``. Relations
+          and child elements can be in the NML XML namespace or not.
+        - If the file comes from a trusted source, like a file previously
+          saved with :meth:`save_nml`, the validation of the URIs can be
+          skipped.
+
+        :param str path: Path to the NML XML file to load, or a file object.
+        :param bool trusted: Skip the validation of the URIs in the file.
+        :raises Exception: If the file uses an unknown NML class, attribute or
+         relation, or if it refers to objects that are never defined.
         """
-        rdr_objects = []
-        rdr_relations = []
+        if trusted:
+            with validators.trusted():
+                return self.load_nml(path)
+
+        nml_prefix = '{{{}}}'.format(NAMESPACES['nml'])
+        relation_tags = ('Relation', nml_prefix + 'Relation')
+
+        # Relations waiting for objects not yet defined, by missing identifier.
+        # Each entry is a list of the form [method, aggregation, identifiers,
+        # objects, missing].
+        pending = defaultdict(list)
+
+        def relate(entry):
+            method, aggregation, identifiers, objects, missing = entry
+            if aggregation:
+                for obj in objects:
+                    method(obj)
+            else:
+                method(*objects)
+
+        root = None
+        depth = 0
+
+        for event, element in etree.iterparse(path, events=('start', 'end')):
+            if event == 'start':
+                if root is None:
+                    root = element
+                depth += 1
+                continue
+
+            depth -= 1
+            if depth != 1:
+                continue
+
+            # Build and register object
+            name = element.tag[len(nml_prefix):]
+            cls = getattr(nml, name, None)
+            if not element.tag.startswith(nml_prefix) or \
+                    name not in nml.__all__:
+                raise Exception(
+                    'Unknown NML object {}'.format(element.tag)
+                )
 
-        # Gather nodes and relations
-        for obj_id, obj in self.namespace.items():
-            rdr_objects.append('{} [label="{}"]'.format(obj_id, obj.name))
+            # Attributes by their NML XML name or by their name, given as
+            # XML attributes or as child elements
+            values = list(element.attrib.items())
+            relations = []
+            for child in element:
+                if child.tag in relation_tags:
+                    relations.append(child)
+                    continue
+                tag = child.tag
+                if tag.startswith(nml_prefix):
+                    tag = tag[len(nml_prefix):]
+                values.append((tag, (child.text or '').strip()))
+
+            attrs = {}
+            for key, value in values:
+                attr_name = cls.nml_attributes.get(key, key)
+                if attr_name not in cls.attributes:
+                    raise Exception(
+                        'Unknown attribute {} for {}'.format(key, name)
+                    )
+                attrs[attr_name] = value
+
+            obj = self._build(cls, **attrs)
+            self.register_object(obj)
+
+            # Resolve relations waiting for this object
+            for entry in pending.pop(obj.identifier, ()):
+                identifiers, objects = entry[2], entry[3]
+                for position, identifier in enumerate(identifiers):
+                    if identifier == obj.identifier:
+                        objects[position] = obj
+                        entry[4] -= 1
+                if not entry[4]:
+                    relate(entry)
+
+            # Relate object
+            for relation in relations:
+                relname = relation.attrib['type'].split('#')[-1]
+                suffix = cls.relation_methods.get(relname, None)
+                if suffix is None:
+                    raise Exception(
+                        'Unknown relation {} for {}'.format(relname, name)
+                    )
 
-            for relation_name, related_objs in obj.relations.items():
+                method = getattr(obj, 'add_' + suffix, None)
+                aggregation = method is not None
+                if not aggregation:
+                    method = getattr(obj, 'set_' + suffix)
+
+                identifiers = [
+                    associated.attrib['id'] for associated in relation
+                ]
+                objects = [
+                    self.namespace.get(identifier, None)
+                    for identifier in identifiers
+                ]
+                missing = set(
+                    identifier
+                    for identifier, associated in zip(identifiers, objects)
+                    if associated is None
+                )
+                entry = [
+                    method, aggregation, identifiers, objects,
+                    objects.count(None)
+                ]
 
-                # Handle iteration over dictionaries and tuples
-                collection = related_objs()
-                if hasattr(collection, 'values'):
-                    collection = collection.values()
+                if not missing:
+                    relate(entry)
+                    continue
 
-                for related_obj in collection:
+                for identifier in missing:
+                    pending[identifier].append(entry)
 
-                    # Ignore non-setup relations
-                    if related_obj is None:
-                        continue
+            # Free parsed element
+            root.clear()
 
-                    rdr_relations.append(
-                        '{} -> {} [label="{}"]'.format(
+        if pending:
+            raise Exception(
+                'Undefined objects {}'.format(', '.join(sorted(pending)))
+            )
+
+    def export_graphviz(self, summary=False, cluster=None, layout=None):
+        """
+        Export current namespace as a Graphviz graph.
+
+        See :meth:`write_graphviz` for the arguments.
+
+        :rtype: str
+        :return: The current NML namespace in Graphviz graph notation.
+        """
+        output = StringIO()
+        self.write_graphviz(
+            output, summary=summary, cluster=cluster, layout=layout
+        )
+        return output.getvalue()
+
+    def write_graphviz(
+            self, fileobj, summary=False, cluster=None, layout=None):
+        """
+        Write current namespace as a Graphviz graph to a file-like object.
+
+        The graph is written line by line, so memory usage does not depend on
+        the size of the graph.
+
+        By default every object is a vertex of the graph and every relation
+        is an edge. For large namespaces a summary graph can be written
+        instead, where:
+
+        - Each :class:`pynml.nml.Node` is a vertex, labeled with the number
+          of ports it has. The ports of a
+          :class:`pynml.nml.BidirectionalPort` count as one.
+        - All the links between the ports of two nodes are a single edge,
+          weighted by the number of links. The links of a
+          :class:`pynml.nml.BidirectionalLink` count as one.
+        - Nodes can be clustered by the :class:`pynml.nml.Topology` they
+          belong to or by the :class:`pynml.nml.Location` they are located at.
+
+        :param fileobj: File-like object opened for writing text.
+        :param bool summary: Write the summary graph.
+        :param str cluster: Cluster the nodes of the summary graph by
+         ``topology`` or by ``location``. If `None`, nodes are not clustered.
+        :param str layout: Graphviz layout engine. If `None`, the layout is
+         chosen by the number of vertices, see :func:`auto_layout`.
+        """
+        if summary:
+            self._write_graphviz_summary(fileobj, cluster, layout)
+            return
+
+        def objects():
+            for obj_id, obj in self.namespace.items():
+                yield '{} [label="{}"]'.format(obj_id, obj.name)
+
+        def relations():
+            for obj_id, obj in self.namespace.items():
+                for relation_name, related_objs in obj.iter_relations():
+                    for related_obj in related_objs:
+                        yield '{} -> {} [label="{}"]'.format(
                             obj_id, related_obj.identifier, relation_name
                         )
+
+        write_template(
+            fileobj, GRAPHVIZ_TPL,
+            namespace=self.name,
+            layout=auto_layout(len(self.namespace), layout),
+            objects=objects(),
+            relations=relations()
+        )
+
+    def _write_graphviz_summary(self, fileobj, cluster, layout):
+        """
+        Write the summary graph of the namespace.
+
+        See :meth:`write_graphviz`.
+        """
+        if cluster not in (None, 'topology', 'location'):
+            raise Exception('Unknown cluster {}'.format(cluster))
+
+        # Bidirectional port of all ports
+        port_biport = {}
+        for biport in self.objects_of(BidirectionalPort):
+            for port in biport.iter_has_port():
+                port_biport[port.identifier] = biport.identifier
+
+        # Ordinal and number of ports of all nodes, and node of all ports.
+        # The ports of a bidirectional port count as one.
+        nodes_idx = OrderedDict()
+        ports_count = {}
+        port_node = {}
+
+        for node_idx, node in enumerate(self.objects_of(Node), 1):
+            nodes_idx[node.identifier] = node_idx
+            counted = set()
+            for ports in (
+                    node.iter_has_inbound_port(),
+                    node.iter_has_outbound_port()):
+                for port in ports:
+                    port_node[port.identifier] = node_idx
+                    counted.add(
+                        port_biport.get(port.identifier, port.identifier)
                     )
+            ports_count[node.identifier] = len(counted)
+
+        # Ends of all links and bidirectional link of all links
+        link_source = {}
+        link_sink = {}
+        link_bilink = {}
+
+        for port in self.objects_of(Port):
+            node_idx = port_node.get(port.identifier, None)
+            if node_idx is None:
+                continue
+            for link in port.iter_is_source():
+                link_source[link.identifier] = node_idx
+            for link in port.iter_is_sink():
+                link_sink[link.identifier] = node_idx
+
+        for bilink in self.objects_of(BidirectionalLink):
+            for link in bilink.iter_has_link():
+                link_bilink[link.identifier] = bilink.identifier
+
+        # Connections between each pair of nodes
+        connections = OrderedDict()
+        for link_id, source_idx in link_source.items():
+            sink_idx = link_sink.get(link_id, None)
+            if sink_idx is None or sink_idx == source_idx:
+                continue
+            pair = (min(source_idx, sink_idx), max(source_idx, sink_idx))
+            connections.setdefault(pair, set()).add(
+                link_bilink.get(link_id, link_id)
+            )
+
+        # Cluster of all nodes
+        clusters = OrderedDict()
+        if cluster == 'topology':
+            for topology in self.objects_of(Topology):
+                members = [
+                    nodes_idx[node.identifier]
+                    for node in topology.iter_has_node()
+                    if node.identifier in nodes_idx
+                ]
+                if members:
+                    clusters[topology.identifier] = (topology, members)
+
+        elif cluster == 'location':
+            for node in self.objects_of(Node):
+                for location in node.iter_located_at():
+                    clusters.setdefault(
+                        location.identifier, (location, [])
+                    )[1].append(nodes_idx[node.identifier])
+
+        # Render, labeling the objects without name by their identifier
+        def label(obj):
+            if obj.name is None or obj.name is unset:
+                return obj.identifier
+            return obj.name
+
+        def nodes():
+            for node in self.objects_of(Node):
+                yield 'n{} [label="{} ({} ports)"]'.format(
+                    nodes_idx[node.identifier], label(node),
+                    ports_count[node.identifier]
+                )
+
+        def subgraphs():
+            for cluster_idx, (obj, members) in enumerate(
+                    clusters.values(), 1):
+                yield 'subgraph cluster{} {{'.format(cluster_idx)
+                yield '    label="{}"'.format(label(obj))
+                for node_idx in members:
+                    yield '    n{}'.format(node_idx)
+                yield '}'
+
+        def links():
+            for (node_a, node_b), links in connections.items():
+                yield 'n{0} -- n{1} [weight={2} label="{2}"]'.format(
+                    node_a, node_b, len(links)
+                )
 
-        # Render template
-        graph = GRAPHVIZ_TPL.format(
+        write_template(
+            fileobj, GRAPHVIZ_TPL_SUMMARY,
             namespace=self.name,
-            objects='\n    '.join(rdr_objects),
-            relations='\n    '.join(rdr_relations)
+            layout=auto_layout(len(nodes_idx), layout),
+            nodes=nodes(),
+            clusters=subgraphs(),
+            links=links()
         )
-        return graph
 
-    def save_graphviz(self, path, keep_gv=False):
+    def save_graphviz(
+            self, path, keep_gv=False, cache=None,
+            summary=False, cluster=None, layout=None):
         """
         Plot this namespace using Graphviz.
 
@@ -220,71 +1636,49 @@ class NMLManager(object):
         - The path must be a path to a filename in the format expected, for
           example, if a `.svg` file is expected the `path` must end with a
           `.svg`. If no format is provided an exception is raised.
-        - The output file will be overriden. If case of permissions or IO error
-          and exception is raised.
+        - Several paths can be given to plot the namespace in several formats
+          at once, for example ``['graph.svg', 'graph.png']``.
+        - The output files will be overriden. If case of permissions or IO
+          error and exception is raised.
         - This function will call the `dot` binary by itself if found
           (using py:func:`distutils.spawn.find_executable`); if not, an
-          exception is raised.
+          exception is raised. The graph is piped to a single `dot` process
+          that writes all the formats. See :func:`pynml.graphviz.render`.
         - If the output parent directories does not exists this function will
           try to create them using py:func:`os.makedirs`.
+        - If a cache is given and the same graph was already rendered, the
+          files are taken from the cache without calling `dot`.
 
-        :param str path: Path to save the rendered graphviz file.
+        :param path: Path to save the rendered graphviz file, or list of paths.
         :param bool keep_gv: Keep the `.gv` file with the source of the graph.
-         This file will live in the same directory of the output file with the
-         same name but with the `.gv`.
+         This file will live in the same directory of the (first) output file
+         with the same name but with the `.gv`.
+        :param cache: Cache of rendered graphs, if any.
+        :type cache: :class:`pynml.graphviz.RenderCache`
+        :param bool summary: Plot the summary graph of the namespace. See
+         :meth:`write_graphviz` for this and the following arguments.
+        :param str cluster: Cluster the nodes of the summary graph.
+        :param str layout: Graphviz layout engine.
         :rtype: str o None
         :return: Path to `.gv` file is `keep_gv` is True, else `None`.
         """
-        # Find dot executable
-        dot_exec = find_executable('dot')
-        if dot_exec is None:
-            raise Exception('Missing Graphviz "dot" executable')
+        paths = [path] if isinstance(path, string_types) else list(path)
+        if not paths:
+            raise Exception('No output path given')
 
-        # Create parent directories
-        path = abspath(path)
-        parent = dirname(path)
-        if not isdir(parent):
-            makedirs(parent)
+        source = None
+        if keep_gv:
+            source = splitext(abspath(paths[0]))[0] + '.gv'
 
-        # Determine and cache supported formats
-        # dot -T? stderr is in the format:
-        #     Format: "?" not recognized. Use one of: canon cmap cmapx [...]
-        if not hasattr(self, '_graphviz_formats_cache'):
-            self._graphviz_formats_cache = []
-            proc = Popen([dot_exec, '-T?'], stdout=PIPE, stderr=PIPE)
-            stdout, stderr = proc.communicate()
-            self._graphviz_formats_cache = \
-                sorted(text_type(stderr).strip().split(':')[-1].split())
-
-        # Determine plot format
-        root, ext = splitext(path)
-        format = ext[1:] if ext else ''
-        if format not in self._graphviz_formats_cache:
-            raise Exception(
-                'Unsupported format "{}". '
-                'Supported formats are: {}'.format(
-                    format, ', '.join(self._graphviz_formats_cache)
-                )
+        def write(fileobj):
+            self.write_graphviz(
+                fileobj, summary=summary, cluster=cluster, layout=layout
             )
 
-        # Export namespace
-        graph = self.export_graphviz()
-        source = root + '.gv'
-        with open(source, 'w') as fd:
-            fd.write(graph)
-
-        # Plot graph
-        check_call([
-            dot_exec, '-T{}'.format(format), source, '-o', path
-        ])
-
-        log.info('Saved graphviz file {}'.format(source))
+        render(write, paths, source=source, cache=cache)
 
-        if keep_gv:
-            return source
-
-        remove(source)
-        return None
+        log.info('Saved graphviz files {}'.format(', '.join(paths)))
+        return source
 
 
 class ExtendedNMLManager(NMLManager):
@@ -307,14 +1701,55 @@ class ExtendedNMLManager(NMLManager):
     The original proposed name for this class was
     ``NMLManagerWithCommonHelpersThatMakeSeveralAssumptions``, but it was too
     long.
+
+    :param bool connectivity: Track the connected components of the nodes.
+     See :meth:`create_connectivity_tracker`.
+    :var connectivity: The :class:`pynml.connectivity.ConnectivityTracker` of
+     the nodes, or `None` if not tracked.
     """
 
-    def __init__(self, **kwargs):
+    def __init__(self, connectivity=False, **kwargs):
         super(ExtendedNMLManager, self).__init__(**kwargs)
         self._nodes = OrderedDict()
         self._biport_node_map = OrderedDict()
         self._bilink_biport_map = OrderedDict()
 
+        self.connectivity = None
+        if connectivity:
+            self.create_connectivity_tracker()
+
+    def create_connectivity_tracker(self):
+        """
+        Track the connected components of the nodes of this namespace.
+
+        The tracker is built from the current nodes and bidirectional links,
+        and is then updated by :meth:`create_node`, :meth:`create_biport` and
+        :meth:`create_bilink`, so questions like "is the fabric still one
+        component?" are answered without traversing the topology::
+
+            mgr.connectivity.is_connected()
+
+        Relations changed directly on the objects, and not through these
+        helpers, are not seen by the tracker.
+
+        :rtype: :class:`pynml.connectivity.ConnectivityTracker`
+        :return: The tracker, also available as :attr:`connectivity`.
+        """
+        if self.connectivity is not None:
+            return self.connectivity
+
+        tracker = ConnectivityTracker()
+        for node in self.nodes():
+            tracker.add_node(node)
+        for biport_a, biport_b in self._bilink_biport_map.values():
+            tracker.add_link(
+                self._biport_node_map[biport_a.identifier],
+                self._biport_node_map[biport_b.identifier]
+            )
+
+        self.connectivity = tracker
+        return tracker
+
     def create_node(self, **kwargs):
         """
         Helper to create and register a :class:`pynml.nml.Node`.
@@ -326,9 +1761,12 @@ class ExtendedNMLManager(NMLManager):
         :return: A new :class:`pynml.nml.Node` already registered into the
          namespace.
         """
-        node = Node(**kwargs)
+        node = self._build(Node, **kwargs)
         self.register_object(node)
         self._nodes[node.identifier] = node
+
+        if self.connectivity is not None:
+            self.connectivity.add_node(node)
         return node
 
     def create_biport(self, node, **kwargs):
@@ -346,9 +1784,9 @@ class ExtendedNMLManager(NMLManager):
          into the namespace and with subports already related.
         """
         # Create objects
-        biport = BidirectionalPort(**kwargs)
-        in_port = Port(name=biport.name + '_in')
-        out_port = Port(name=biport.name + '_out')
+        biport = self._build(BidirectionalPort, **kwargs)
+        in_port = self._build(Port, name=biport.name + '_in')
+        out_port = self._build(Port, name=biport.name + '_out')
 
         # Register objects
         self.register_object(biport)
@@ -362,6 +1800,9 @@ class ExtendedNMLManager(NMLManager):
         node.add_has_outbound_port(out_port)
 
         self._biport_node_map[biport.identifier] = node
+
+        if self.connectivity is not None:
+            self.connectivity.add_node(node)
         return biport
 
     def create_bilink(self, biport_a, biport_b, **kwargs):
@@ -378,9 +1819,9 @@ class ExtendedNMLManager(NMLManager):
          into the namespace and with sublinks already related.
         """
         # Create objects
-        bilink = BidirectionalLink(**kwargs)
-        link_a_b = Link(name=bilink.name + '_link_a_b')
-        link_b_a = Link(name=bilink.name + '_link_b_a')
+        bilink = self._build(BidirectionalLink, **kwargs)
+        link_a_b = self._build(Link, name=bilink.name + '_link_a_b')
+        link_b_a = self._build(Link, name=bilink.name + '_link_b_a')
 
         # Register objects
         self.register_object(bilink)
@@ -397,6 +1838,12 @@ class ExtendedNMLManager(NMLManager):
         biport_b._has_port_ports[1].add_is_source(link_b_a)  # outbound port
 
         self._bilink_biport_map[bilink.identifier] = (biport_a, biport_b)
+
+        if self.connectivity is not None:
+            self.connectivity.add_link(
+                self._biport_node_map[biport_a.identifier],
+                self._biport_node_map[biport_b.identifier]
+            )
         return bilink
 
     def nodes(self):
@@ -449,67 +1896,82 @@ class ExtendedNMLManager(NMLManager):
                 self.namespace[bilink_id]
             )
 
-    def export_graphviz(self):
+    def write_graphviz(
+            self, fileobj, summary=False, cluster=None, layout=None):
         """
-        Graphiz export override. See :meth:`NMLManager.export_graphviz`.
+        Graphiz export override. See :meth:`NMLManager.write_graphviz`.
+
+        The summary graph is the same as the one written by
+        :class:`NMLManager`. Otherwise the default Graphviz layout is used,
+        unless a `layout` is given or the number of nodes and ports is above
+        :data:`LAYOUT_THRESHOLD`, in which case ``sfdp`` is used.
         """
-        # Get and index of all nodes
-        nodes_idx = list(self._nodes.values())
+        if summary:
+            super(ExtendedNMLManager, self).write_graphviz(
+                fileobj, summary=summary, cluster=cluster, layout=layout
+            )
+            return
 
-        # Get an index of all biports
-        biports_per_node = OrderedDict()
-        for node, biport in self.biports():
-            if node.identifier not in biports_per_node:
-                biports_per_node[node.identifier] = []
-            biports_per_node[node.identifier].append(biport)
+        # Ordinal of all nodes and of all biports in their node
+        nodes_idx = OrderedDict(
+            (node.identifier, node_idx)
+            for node_idx, node in enumerate(self.nodes(), 1)
+        )
+        biports_per_node = defaultdict(list)
+        biports_idx = {}
 
-        # Render
-        rdr_nodes = []
-        rdr_ports = []
-        rdr_links = []
+        for node, biport in self.biports():
+            biports = biports_per_node[node.identifier]
+            biports.append(biport)
+            biports_idx[biport.identifier] = len(biports)
 
         # Render nodes and ports
-        for node_idx, node in enumerate(nodes_idx, 1):
-
-            # Render node
-            rdr_nodes.append('subgraph clusterNode{} {{'.format(node_idx))
-            rdr_nodes.append('    label="{}"'.format(node.name))
-
-            # Render ports
-            if node.identifier in biports_per_node:
-                for port_idx, port in enumerate(
-                        biports_per_node[node.identifier], 1):
-                    rdr_nodes.append(
-                        '    n{}p{}'.format(node_idx, port_idx)
-                    )
-                    rdr_ports.append(
-                        'n{0}p{1} [label="p{1}"]'.format(
-                            node_idx, port_idx
-                        )
-                    )
-
-            rdr_nodes.append('}')
-            rdr_nodes.append('')
+        def nodes():
+            for node in self.nodes():
+                node_idx = nodes_idx[node.identifier]
+                yield 'subgraph clusterNode{} {{'.format(node_idx)
+                yield '    label="{}"'.format(node.name)
+
+                for port_idx in range(
+                        1, len(biports_per_node.get(node.identifier, ())) + 1):
+                    yield '    n{}p{}'.format(node_idx, port_idx)
+
+                yield '}'
+                yield ''
+
+        def ports():
+            for node_id, node_idx in nodes_idx.items():
+                for port_idx in range(
+                        1, len(biports_per_node.get(node_id, ())) + 1):
+                    yield 'n{0}p{1} [label="p{1}"]'.format(node_idx, port_idx)
+
+        # Only large graphs change the default layout
+        layout_attribute = ''
+        vertices = len(nodes_idx) + len(biports_idx)
+        if layout is not None or vertices > LAYOUT_THRESHOLD:
+            layout_attribute = 'layout={}, '.format(
+                auto_layout(vertices, layout)
+            )
 
         # Render links
-        for (node_a, biport_a), (node_b, biport_b), bilink in self.bilinks():
-            rdr_links.append(
-                'n{}p{} -- n{}p{}'.format(
-                    nodes_idx.index(node_a) + 1,
-                    biports_per_node[node_a.identifier].index(biport_a) + 1,
-                    nodes_idx.index(node_b) + 1,
-                    biports_per_node[node_b.identifier].index(biport_b) + 1,
+        def links():
+            for (node_a, biport_a), (node_b, biport_b), bilink in \
+                    self.bilinks():
+                yield 'n{}p{} -- n{}p{}'.format(
+                    nodes_idx[node_a.identifier],
+                    biports_idx[biport_a.identifier],
+                    nodes_idx[node_b.identifier],
+                    biports_idx[biport_b.identifier],
                 )
-            )
 
-        # Render template
-        graph = GRAPHVIZ_TPL_EXTENDED.format(
+        write_template(
+            fileobj, GRAPHVIZ_TPL_EXTENDED,
             namespace=self.name,
-            nodes='\n    '.join(rdr_nodes),
-            ports='\n    '.join(rdr_ports),
-            links='\n    '.join(rdr_links)
+            layout=layout_attribute,
+            nodes=nodes(),
+            ports=ports(),
+            links=links()
         )
-        return graph
 
 
 __all__ = [
@@ -23,13 +23,14 @@ from __future__ import unicode_literals, absolute_import
 from __future__ import print_function, division
 
 from copy import copy
-from datetime import datetime
 from collections import OrderedDict
 from abc import ABCMeta, abstractmethod
 from xml.etree import ElementTree as etree  # noqa
 
-from six import add_metaclass
-from rfc3986 import is_valid_uri
+from six import add_metaclass, itervalues, text_type
+from .validators import is_valid_uri
+from .timestamps import now, resolve
+from .intervals import IntervalSet
 
 from .exceptions import (
     RelationExistsDuringError,
@@ -51,6 +52,9 @@ from .exceptions import (
     RelationHasPortError,
     RelationHasLinkError,
     RelationIsSerialCompoundLinkError,
+    RelationFirstError,
+    RelationItemError,
+    RelationNextError,
     AttributeNameError,
     AttributeIdError,
     AttributeEncodingError
@@ -66,6 +70,39 @@ for xmlns, uri in NAMESPACES.items():
 unset = type(str('Unset'), (object,), {})()
 
 
+def notify(subject, relation, removed, added):
+    """
+    Notify the observers of a change in a relation of a NML object.
+
+    The add_* and set_* methods of the NML objects call this function, only if
+    the object has any observer, after the relation is changed. Observers are
+    the weak references in the ``_observers`` tuple of the object, usually to
+    the managers of the namespaces the object is registered in, and are
+    notified by calling their ``relation_changed`` method with the same
+    arguments.
+
+    :param NMLObject subject: Object whose relation changed.
+    :param str relation: Name of the relation, for example ``hasInboundPort``.
+    :param tuple removed: Objects no longer related. It may contain `None`
+     for the unset positions of a relation with fixed cardinality.
+    :param tuple added: Objects related.
+    """
+    alive = True
+    for reference in subject._observers:
+        observer = reference()
+        if observer is None:
+            alive = False
+        else:
+            observer.relation_changed(subject, relation, removed, added)
+
+    # Forget the observers already collected
+    if not alive:
+        subject._observers = tuple(
+            reference for reference in subject._observers
+            if reference() is not None
+        )
+
+
 @add_metaclass(ABCMeta)
 class NMLObject(object):
     """
@@ -75,11 +112,77 @@ class NMLObject(object):
     (see GRASP) of refactored functionality of all objects.
     """
 
+    __slots__ = ('_metadata', '_observers')
+
+    attributes = ()
+    nml_attributes = OrderedDict()
+    relation_methods = OrderedDict()
+
     @abstractmethod
     def __init__(self, **kwargs):
-        self.attributes = []
-        self.relations = OrderedDict()
-        self.metadata = kwargs
+        self._initialize()
+        if kwargs:
+            self._metadata = kwargs
+
+    @property
+    def metadata(self):
+        """
+        Get all kwargs passed to the constructor.
+
+        The dictionary is created the first time it is needed.
+
+        :rtype: dict
+        """
+        try:
+            return self._metadata
+        except AttributeError:
+            self._metadata = {}
+            return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata):
+        """
+        Set all kwargs passed to the constructor.
+
+        :param dict metadata: Metadata of this object.
+        """
+        self._metadata = metadata
+
+    def _initialize(self):
+        """
+        Initialize an object without attributes, metadata or relations.
+
+        Called by the constructor, and by the managers that build objects
+        without calling it, see :meth:`pynml.manager.NMLManager.bulk_create`.
+        """
+        self._observers = ()
+
+    @property
+    def relations(self):
+        """
+        Get the getter of every relation of this object.
+
+        :rtype: :py:class:`OrderedDict`
+        :return: The methods to get the objects related with this object,
+         by relation name.
+        """
+        return OrderedDict(
+            (relname, getattr(self, 'get_' + suffix))
+            for relname, suffix in self.relation_methods.items()
+        )
+
+    def iter_relations(self):
+        """
+        Iterate over the relations of this object.
+
+        Related objects are iterated without copying the relation collections,
+        so relations must not be modified while iterating.
+
+        :return: An iterator of tuples of the form (relation name, iterator
+         over the objects related with this object with that relation).
+        """
+        for relname, suffix in self.relation_methods.items():
+            yield relname, getattr(self, 'iter_' + suffix)()
 
     def _describe_object(self):
         """
@@ -91,7 +194,7 @@ class NMLObject(object):
         name = self.__class__.__name__
         attributes = [
             (attr, getattr(self, attr))
-            for attr in self.attributes + ['metadata']
+            for attr in self.attributes + ('metadata', )
             if hasattr(self, attr)
         ]
         formatted_attributes = ', '.join([
@@ -132,32 +235,24 @@ class NMLObject(object):
         """
         this = self._tree_element(this, parent)
 
-        # Attributes
+        # Attributes, sets of labels in range syntax like 1-100,200-300
         for attr_name in self.attributes:
             attr = getattr(self, attr_name)
-            if attr is not unset:
-                this.attrib[attr_name] = attr
+            if attr is not unset and attr is not None:
+                this.attrib[attr_name] = text_type(attr)
 
         # Relations
-        for relname, relgetter in self.relations.items():
-
-            # Composition elements are tuples
-            # Aggregation elements are OrderedDict
-            associated = relgetter()
-            if isinstance(associated, OrderedDict):
-                associated = associated.values()
-
-            # Ignore empty relations
-            if not associated or not all(associated):
-                continue
-
-            # Create subelement
-            relation = etree.SubElement(
-                this, 'Relation',
-                type='{}#{}'.format(NAMESPACES['nml'], relname)
-            )
+        for relname, associated in self.iter_relations():
+
+            # Create subelement only for non empty relations
+            relation = None
 
             for associated in associated:
+                if relation is None:
+                    relation = etree.SubElement(
+                        this, 'Relation',
+                        type='{}#{}'.format(NAMESPACES['nml'], relname)
+                    )
                 etree.SubElement(
                     relation, associated.__class__.__name__,
                     id=associated.identifier
@@ -178,6 +273,33 @@ class NetworkObject(NMLObject):
     :param str version: Time stamp formatted as ISO 8601.
     """
 
+    __slots__ = (
+        '_name',
+        '_identifier',
+        '_version',
+        '_exists_during_lifetimes',
+        '_is_alias_network_objects',
+        '_located_at_locations',
+    )
+
+    attributes = (
+        'name',
+        'identifier',
+        'version',
+    )
+
+    nml_attributes = OrderedDict([
+        ('name', 'name'),
+        ('id', 'identifier'),
+        ('version', 'version'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+    ])
+
     @abstractmethod
     def __init__(
             self, name=None, identifier=None, version=None, **kwargs):
@@ -185,34 +307,20 @@ class NetworkObject(NMLObject):
 
         # Attributes
 
-        self.attributes.append('name')
         if name is None:
             name = '{}({})'.format(
                 self.__class__.__name__, str(id(self))
             )
         self.name = name
 
-        self.attributes.append('identifier')
         if identifier is None:
             identifier = str(id(self))
         self.identifier = identifier
 
-        self.attributes.append('version')
         if version is None:
-            version = datetime.now().replace(microsecond=0).isoformat()
+            version = now()
         self.version = version
 
-        # Relations
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['isAlias'] = \
-            self.get_is_alias
-        self._is_alias_network_objects = OrderedDict()
-        self.relations['locatedAt'] = \
-            self.get_located_at
-        self._located_at_locations = (None, )
-
     @property
     def name(self):
         """
@@ -234,6 +342,18 @@ class NetworkObject(NMLObject):
             raise AttributeNameError()
         self._name = name
 
+    @staticmethod
+    def validate_name(name):
+        """
+        Validate a value of attribute name without setting it.
+
+        :param str name: Human readable string name.
+        :return: The value the setter stores for given value.
+        """
+        if name is not unset and not name:
+            raise AttributeNameError()
+        return name
+
     @property
     def identifier(self):
         """
@@ -255,6 +375,18 @@ class NetworkObject(NMLObject):
             raise AttributeIdError()
         self._identifier = identifier
 
+    @staticmethod
+    def validate_identifier(identifier):
+        """
+        Validate a value of attribute identifier without setting it.
+
+        :param str identifier: Persistent globally unique URI.
+        :return: The value the setter stores for given value.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        return identifier
+
     @property
     def version(self):
         """
@@ -263,7 +395,7 @@ class NetworkObject(NMLObject):
         :return: Time stamp formatted as ISO 8601.
         :rtype: str
         """
-        return self._version
+        return resolve(self._version)
 
     @version.setter
     def version(self, version):
@@ -274,6 +406,16 @@ class NetworkObject(NMLObject):
         """
         self._version = version
 
+    @staticmethod
+    def validate_version(version):
+        """
+        Validate a value of attribute version without setting it.
+
+        :param str version: Time stamp formatted as ISO 8601.
+        :return: The value the setter stores for given value.
+        """
+        return version
+
     def exists_during(self, lifetime):
         """
         Check `existsDuring` relation with given `lifetime` object.
@@ -290,7 +432,7 @@ class NetworkObject(NMLObject):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -303,8 +445,14 @@ class NetworkObject(NMLObject):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -313,7 +461,23 @@ class NetworkObject(NMLObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
+
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
 
     def is_alias(self, network_object):
         """
@@ -331,7 +495,7 @@ class NetworkObject(NMLObject):
             raise RelationIsAliasError()
 
         return network_object.identifier in \
-            self._is_alias_network_objects
+            getattr(self, '_is_alias_network_objects', ())
 
     def add_is_alias(self, network_object):
         """
@@ -344,8 +508,14 @@ class NetworkObject(NMLObject):
                 NetworkObject, ):
             raise RelationIsAliasError()
 
-        self._is_alias_network_objects[network_object.identifier] = \
-            network_object
+        try:
+            related = self._is_alias_network_objects
+        except AttributeError:
+            related = self._is_alias_network_objects = OrderedDict()
+        related[network_object.identifier] = network_object
+
+        if self._observers:
+            notify(self, 'isAlias', (), (network_object, ))
 
     def get_is_alias(self):
         """
@@ -354,7 +524,23 @@ class NetworkObject(NMLObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._is_alias_network_objects)
+        return OrderedDict(
+            getattr(self, '_is_alias_network_objects', ())
+        )
+
+    def iter_is_alias(self):
+        """
+        Iterate over the objects related with this object with relation
+        `isAlias`.
+
+        Unlike :meth:`get_is_alias` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_is_alias_network_objects', {})
+        )
 
     def located_at(self, location):
         """
@@ -372,7 +558,7 @@ class NetworkObject(NMLObject):
             raise RelationLocatedAtError()
 
         return location in \
-            self._located_at_locations
+            getattr(self, '_located_at_locations', (None, ))
 
     def set_located_at(self, location):
         """
@@ -387,8 +573,12 @@ class NetworkObject(NMLObject):
             if arg.__class__ not in (Location, ):
                 raise RelationLocatedAtError()
 
+        removed = getattr(self, '_located_at_locations', (None, ))
         self._located_at_locations = arg_tuple
 
+        if self._observers:
+            notify(self, 'locatedAt', removed, arg_tuple)
+
     def get_located_at(self):
         """
         Get all objects related with this object with relation `locatedAt`.
@@ -396,7 +586,20 @@ class NetworkObject(NMLObject):
         :rtype: set
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._located_at_locations)
+        return copy(getattr(self, '_located_at_locations', (None, )))
+
+    def iter_located_at(self):
+        """
+        Iterate over the objects related with this object with relation
+        `locatedAt`.
+
+        Unlike :meth:`get_located_at` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_located_at_locations', (None, ))
+        return (obj for obj in related if obj is not None)
 
 
 class Node(NetworkObject):
@@ -406,24 +609,27 @@ class Node(NetworkObject):
     Physical or virtual devices can be represented by instances of this class.
     """
 
+    __slots__ = (
+        '_has_inbound_port_ports',
+        '_has_outbound_port_ports',
+        '_has_service_switching_services',
+        '_implemented_by_nodes',
+    )
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasInboundPort', 'has_inbound_port'),
+        ('hasOutboundPort', 'has_outbound_port'),
+        ('hasService', 'has_service'),
+        ('implementedBy', 'implemented_by'),
+    ])
+
     def __init__(
             self, **kwargs):
         super(Node, self).__init__(**kwargs)
 
-        # Relations
-        self.relations['hasInboundPort'] = \
-            self.get_has_inbound_port
-        self._has_inbound_port_ports = OrderedDict()
-        self.relations['hasOutboundPort'] = \
-            self.get_has_outbound_port
-        self._has_outbound_port_ports = OrderedDict()
-        self.relations['hasService'] = \
-            self.get_has_service
-        self._has_service_switching_services = OrderedDict()
-        self.relations['implementedBy'] = \
-            self.get_implemented_by
-        self._implemented_by_nodes = OrderedDict()
-
     def has_inbound_port(self, port):
         """
         Check `hasInboundPort` relation with given `port` object.
@@ -441,7 +647,7 @@ class Node(NetworkObject):
             raise RelationHasInboundPortError()
 
         return port.identifier in \
-            self._has_inbound_port_ports
+            getattr(self, '_has_inbound_port_ports', ())
 
     def add_has_inbound_port(self, port):
         """
@@ -455,8 +661,14 @@ class Node(NetworkObject):
                 PortGroup, ):
             raise RelationHasInboundPortError()
 
-        self._has_inbound_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_inbound_port_ports
+        except AttributeError:
+            related = self._has_inbound_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'hasInboundPort', (), (port, ))
 
     def get_has_inbound_port(self):
         """
@@ -466,7 +678,23 @@ class Node(NetworkObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_inbound_port_ports)
+        return OrderedDict(
+            getattr(self, '_has_inbound_port_ports', ())
+        )
+
+    def iter_has_inbound_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasInboundPort`.
+
+        Unlike :meth:`get_has_inbound_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_inbound_port_ports', {})
+        )
 
     def has_outbound_port(self, port):
         """
@@ -485,7 +713,7 @@ class Node(NetworkObject):
             raise RelationHasOutboundPortError()
 
         return port.identifier in \
-            self._has_outbound_port_ports
+            getattr(self, '_has_outbound_port_ports', ())
 
     def add_has_outbound_port(self, port):
         """
@@ -499,8 +727,14 @@ class Node(NetworkObject):
                 PortGroup, ):
             raise RelationHasOutboundPortError()
 
-        self._has_outbound_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_outbound_port_ports
+        except AttributeError:
+            related = self._has_outbound_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'hasOutboundPort', (), (port, ))
 
     def get_has_outbound_port(self):
         """
@@ -510,7 +744,23 @@ class Node(NetworkObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_outbound_port_ports)
+        return OrderedDict(
+            getattr(self, '_has_outbound_port_ports', ())
+        )
+
+    def iter_has_outbound_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasOutboundPort`.
+
+        Unlike :meth:`get_has_outbound_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_outbound_port_ports', {})
+        )
 
     def has_service(self, switching_service):
         """
@@ -530,7 +780,7 @@ class Node(NetworkObject):
             raise RelationHasServiceError()
 
         return switching_service.identifier in \
-            self._has_service_switching_services
+            getattr(self, '_has_service_switching_services', ())
 
     def add_has_service(self, switching_service):
         """
@@ -543,8 +793,14 @@ class Node(NetworkObject):
                 SwitchingService, ):
             raise RelationHasServiceError()
 
-        self._has_service_switching_services[switching_service.identifier] = \
-            switching_service
+        try:
+            related = self._has_service_switching_services
+        except AttributeError:
+            related = self._has_service_switching_services = OrderedDict()
+        related[switching_service.identifier] = switching_service
+
+        if self._observers:
+            notify(self, 'hasService', (), (switching_service, ))
 
     def get_has_service(self):
         """
@@ -553,7 +809,23 @@ class Node(NetworkObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_service_switching_services)
+        return OrderedDict(
+            getattr(self, '_has_service_switching_services', ())
+        )
+
+    def iter_has_service(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasService`.
+
+        Unlike :meth:`get_has_service` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_service_switching_services', {})
+        )
 
     def implemented_by(self, node):
         """
@@ -571,7 +843,7 @@ class Node(NetworkObject):
             raise RelationImplementedByError()
 
         return node.identifier in \
-            self._implemented_by_nodes
+            getattr(self, '_implemented_by_nodes', ())
 
     def add_implemented_by(self, node):
         """
@@ -584,8 +856,14 @@ class Node(NetworkObject):
                 Node, ):
             raise RelationImplementedByError()
 
-        self._implemented_by_nodes[node.identifier] = \
-            node
+        try:
+            related = self._implemented_by_nodes
+        except AttributeError:
+            related = self._implemented_by_nodes = OrderedDict()
+        related[node.identifier] = node
+
+        if self._observers:
+            notify(self, 'implementedBy', (), (node, ))
 
     def get_implemented_by(self):
         """
@@ -594,7 +872,23 @@ class Node(NetworkObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._implemented_by_nodes)
+        return OrderedDict(
+            getattr(self, '_implemented_by_nodes', ())
+        )
+
+    def iter_implemented_by(self):
+        """
+        Iterate over the objects related with this object with relation
+        `implementedBy`.
+
+        Unlike :meth:`get_implemented_by` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_implemented_by_nodes', {})
+        )
 
 
 class Port(NetworkObject):
@@ -608,31 +902,48 @@ class Port(NetworkObject):
      URI.
     """
 
+    __slots__ = (
+        '_encoding',
+        '_has_label_labels',
+        '_has_service_adaptation_services',
+        '_is_sink_links',
+        '_is_source_links',
+    )
+
+    attributes = (
+        'name',
+        'identifier',
+        'version',
+        'encoding',
+    )
+
+    nml_attributes = OrderedDict([
+        ('name', 'name'),
+        ('id', 'identifier'),
+        ('version', 'version'),
+        ('encoding', 'encoding'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasLabel', 'has_label'),
+        ('hasService', 'has_service'),
+        ('isSink', 'is_sink'),
+        ('isSource', 'is_source'),
+    ])
+
     def __init__(
             self, encoding=None, **kwargs):
         super(Port, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('encoding')
         if encoding is None:
             encoding = unset
         self.encoding = encoding
 
-        # Relations
-        self.relations['hasLabel'] = \
-            self.get_has_label
-        self._has_label_labels = (None, )
-        self.relations['hasService'] = \
-            self.get_has_service
-        self._has_service_adaptation_services = OrderedDict()
-        self.relations['isSink'] = \
-            self.get_is_sink
-        self._is_sink_links = OrderedDict()
-        self.relations['isSource'] = \
-            self.get_is_source
-        self._is_source_links = OrderedDict()
-
     @property
     def encoding(self):
         """
@@ -655,6 +966,19 @@ class Port(NetworkObject):
             raise AttributeEncodingError()
         self._encoding = encoding
 
+    @staticmethod
+    def validate_encoding(encoding):
+        """
+        Validate a value of attribute encoding without setting it.
+
+        :param str encoding: Format of the data streaming through the port as
+         an URI.
+        :return: The value the setter stores for given value.
+        """
+        if encoding is not unset and not is_valid_uri(encoding):
+            raise AttributeEncodingError()
+        return encoding
+
     def has_label(self, label):
         """
         Check `hasLabel` relation with given `label` object.
@@ -671,7 +995,7 @@ class Port(NetworkObject):
             raise RelationHasLabelError()
 
         return label in \
-            self._has_label_labels
+            getattr(self, '_has_label_labels', (None, ))
 
     def set_has_label(self, label):
         """
@@ -686,8 +1010,12 @@ class Port(NetworkObject):
             if arg.__class__ not in (Label, ):
                 raise RelationHasLabelError()
 
+        removed = getattr(self, '_has_label_labels', (None, ))
         self._has_label_labels = arg_tuple
 
+        if self._observers:
+            notify(self, 'hasLabel', removed, arg_tuple)
+
     def get_has_label(self):
         """
         Get all objects related with this object with relation `hasLabel`.
@@ -695,7 +1023,20 @@ class Port(NetworkObject):
         :rtype: set
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_label_labels)
+        return copy(getattr(self, '_has_label_labels', (None, )))
+
+    def iter_has_label(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasLabel`.
+
+        Unlike :meth:`get_has_label` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_has_label_labels', (None, ))
+        return (obj for obj in related if obj is not None)
 
     def has_service(self, adaptation_service):
         """
@@ -716,7 +1057,7 @@ class Port(NetworkObject):
             raise RelationHasServiceError()
 
         return adaptation_service.identifier in \
-            self._has_service_adaptation_services
+            getattr(self, '_has_service_adaptation_services', ())
 
     def add_has_service(self, adaptation_service):
         """
@@ -730,9 +1071,14 @@ class Port(NetworkObject):
                 DeAdaptationService, ):
             raise RelationHasServiceError()
 
-        self._has_service_adaptation_services[
-            adaptation_service.identifier
-        ] = adaptation_service
+        try:
+            related = self._has_service_adaptation_services
+        except AttributeError:
+            related = self._has_service_adaptation_services = OrderedDict()
+        related[adaptation_service.identifier] = adaptation_service
+
+        if self._observers:
+            notify(self, 'hasService', (), (adaptation_service, ))
 
     def get_has_service(self):
         """
@@ -741,7 +1087,23 @@ class Port(NetworkObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_service_adaptation_services)
+        return OrderedDict(
+            getattr(self, '_has_service_adaptation_services', ())
+        )
+
+    def iter_has_service(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasService`.
+
+        Unlike :meth:`get_has_service` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_service_adaptation_services', {})
+        )
 
     def is_sink(self, link):
         """
@@ -759,7 +1121,7 @@ class Port(NetworkObject):
             raise RelationIsSinkError()
 
         return link.identifier in \
-            self._is_sink_links
+            getattr(self, '_is_sink_links', ())
 
     def add_is_sink(self, link):
         """
@@ -772,8 +1134,14 @@ class Port(NetworkObject):
                 Link, ):
             raise RelationIsSinkError()
 
-        self._is_sink_links[link.identifier] = \
-            link
+        try:
+            related = self._is_sink_links
+        except AttributeError:
+            related = self._is_sink_links = OrderedDict()
+        related[link.identifier] = link
+
+        if self._observers:
+            notify(self, 'isSink', (), (link, ))
 
     def get_is_sink(self):
         """
@@ -782,7 +1150,23 @@ class Port(NetworkObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._is_sink_links)
+        return OrderedDict(
+            getattr(self, '_is_sink_links', ())
+        )
+
+    def iter_is_sink(self):
+        """
+        Iterate over the objects related with this object with relation
+        `isSink`.
+
+        Unlike :meth:`get_is_sink` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_is_sink_links', {})
+        )
 
     def is_source(self, link):
         """
@@ -800,7 +1184,7 @@ class Port(NetworkObject):
             raise RelationIsSourceError()
 
         return link.identifier in \
-            self._is_source_links
+            getattr(self, '_is_source_links', ())
 
     def add_is_source(self, link):
         """
@@ -813,8 +1197,14 @@ class Port(NetworkObject):
                 Link, ):
             raise RelationIsSourceError()
 
-        self._is_source_links[link.identifier] = \
-            link
+        try:
+            related = self._is_source_links
+        except AttributeError:
+            related = self._is_source_links = OrderedDict()
+        related[link.identifier] = link
+
+        if self._observers:
+            notify(self, 'isSource', (), (link, ))
 
     def get_is_source(self):
         """
@@ -823,7 +1213,23 @@ class Port(NetworkObject):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._is_source_links)
+        return OrderedDict(
+            getattr(self, '_is_source_links', ())
+        )
+
+    def iter_is_source(self):
+        """
+        Iterate over the objects related with this object with relation
+        `isSource`.
+
+        Unlike :meth:`get_is_source` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_is_source_links', {})
+        )
 
 
 class Link(NetworkObject):
@@ -837,22 +1243,42 @@ class Link(NetworkObject):
      URI.
     """
 
+    __slots__ = (
+        '_encoding',
+        '_has_label_labels',
+    )
+
+    attributes = (
+        'name',
+        'identifier',
+        'version',
+        'encoding',
+    )
+
+    nml_attributes = OrderedDict([
+        ('name', 'name'),
+        ('id', 'identifier'),
+        ('version', 'version'),
+        ('encoding', 'encoding'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasLabel', 'has_label'),
+    ])
+
     def __init__(
             self, encoding=None, **kwargs):
         super(Link, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('encoding')
         if encoding is None:
             encoding = unset
         self.encoding = encoding
 
-        # Relations
-        self.relations['hasLabel'] = \
-            self.get_has_label
-        self._has_label_labels = (None, )
-
     @property
     def encoding(self):
         """
@@ -875,6 +1301,19 @@ class Link(NetworkObject):
             raise AttributeEncodingError()
         self._encoding = encoding
 
+    @staticmethod
+    def validate_encoding(encoding):
+        """
+        Validate a value of attribute encoding without setting it.
+
+        :param str encoding: Format of the data streaming through the link as
+         an URI.
+        :return: The value the setter stores for given value.
+        """
+        if encoding is not unset and not is_valid_uri(encoding):
+            raise AttributeEncodingError()
+        return encoding
+
     def has_label(self, label):
         """
         Check `hasLabel` relation with given `label` object.
@@ -891,7 +1330,7 @@ class Link(NetworkObject):
             raise RelationHasLabelError()
 
         return label in \
-            self._has_label_labels
+            getattr(self, '_has_label_labels', (None, ))
 
     def set_has_label(self, label):
         """
@@ -906,8 +1345,12 @@ class Link(NetworkObject):
             if arg.__class__ not in (Label, ):
                 raise RelationHasLabelError()
 
+        removed = getattr(self, '_has_label_labels', (None, ))
         self._has_label_labels = arg_tuple
 
+        if self._observers:
+            notify(self, 'hasLabel', removed, arg_tuple)
+
     def get_has_label(self):
         """
         Get all objects related with this object with relation `hasLabel`.
@@ -915,7 +1358,20 @@ class Link(NetworkObject):
         :rtype: set
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_label_labels)
+        return copy(getattr(self, '_has_label_labels', (None, )))
+
+    def iter_has_label(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasLabel`.
+
+        Unlike :meth:`get_has_label` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_has_label_labels', (None, ))
+        return (obj for obj in related if obj is not None)
 
 
 @add_metaclass(ABCMeta)
@@ -926,6 +1382,8 @@ class Service(NetworkObject):
     No Service instances can be created because this class is abstract.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(
             self, **kwargs):
@@ -943,29 +1401,54 @@ class SwitchingService(Service):
 
     :param str encoding: Format of the data streaming through the service as an
      URI.
+    :param None label_swapping: If the service can change the label of the data
+     streaming between its inbound and outbound ports.
     """
 
+    __slots__ = (
+        '_encoding',
+        'label_swapping',
+        '_has_inbound_port_ports',
+        '_has_outbound_port_ports',
+        '_provides_link_links',
+    )
+
+    attributes = (
+        'name',
+        'identifier',
+        'version',
+        'encoding',
+        'label_swapping',
+    )
+
+    nml_attributes = OrderedDict([
+        ('name', 'name'),
+        ('id', 'identifier'),
+        ('version', 'version'),
+        ('encoding', 'encoding'),
+        ('labelSwapping', 'label_swapping'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasInboundPort', 'has_inbound_port'),
+        ('hasOutboundPort', 'has_outbound_port'),
+        ('providesLink', 'provides_link'),
+    ])
+
     def __init__(
-            self, encoding=None, **kwargs):
+            self, encoding=None, label_swapping=None, **kwargs):
         super(SwitchingService, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('encoding')
         if encoding is None:
             encoding = unset
         self.encoding = encoding
 
-        # Relations
-        self.relations['hasInboundPort'] = \
-            self.get_has_inbound_port
-        self._has_inbound_port_ports = OrderedDict()
-        self.relations['hasOutboundPort'] = \
-            self.get_has_outbound_port
-        self._has_outbound_port_ports = OrderedDict()
-        self.relations['providesLink'] = \
-            self.get_provides_link
-        self._provides_link_links = OrderedDict()
+        self.label_swapping = label_swapping
 
     @property
     def encoding(self):
@@ -989,6 +1472,19 @@ class SwitchingService(Service):
             raise AttributeEncodingError()
         self._encoding = encoding
 
+    @staticmethod
+    def validate_encoding(encoding):
+        """
+        Validate a value of attribute encoding without setting it.
+
+        :param str encoding: Format of the data streaming through the service
+         as an URI.
+        :return: The value the setter stores for given value.
+        """
+        if encoding is not unset and not is_valid_uri(encoding):
+            raise AttributeEncodingError()
+        return encoding
+
     def has_inbound_port(self, port):
         """
         Check `hasInboundPort` relation with given `port` object.
@@ -1006,7 +1502,7 @@ class SwitchingService(Service):
             raise RelationHasInboundPortError()
 
         return port.identifier in \
-            self._has_inbound_port_ports
+            getattr(self, '_has_inbound_port_ports', ())
 
     def add_has_inbound_port(self, port):
         """
@@ -1020,8 +1516,14 @@ class SwitchingService(Service):
                 PortGroup, ):
             raise RelationHasInboundPortError()
 
-        self._has_inbound_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_inbound_port_ports
+        except AttributeError:
+            related = self._has_inbound_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'hasInboundPort', (), (port, ))
 
     def get_has_inbound_port(self):
         """
@@ -1031,7 +1533,23 @@ class SwitchingService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_inbound_port_ports)
+        return OrderedDict(
+            getattr(self, '_has_inbound_port_ports', ())
+        )
+
+    def iter_has_inbound_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasInboundPort`.
+
+        Unlike :meth:`get_has_inbound_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_inbound_port_ports', {})
+        )
 
     def has_outbound_port(self, port):
         """
@@ -1050,7 +1568,7 @@ class SwitchingService(Service):
             raise RelationHasOutboundPortError()
 
         return port.identifier in \
-            self._has_outbound_port_ports
+            getattr(self, '_has_outbound_port_ports', ())
 
     def add_has_outbound_port(self, port):
         """
@@ -1064,8 +1582,14 @@ class SwitchingService(Service):
                 PortGroup, ):
             raise RelationHasOutboundPortError()
 
-        self._has_outbound_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_outbound_port_ports
+        except AttributeError:
+            related = self._has_outbound_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'hasOutboundPort', (), (port, ))
 
     def get_has_outbound_port(self):
         """
@@ -1075,7 +1599,23 @@ class SwitchingService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_outbound_port_ports)
+        return OrderedDict(
+            getattr(self, '_has_outbound_port_ports', ())
+        )
+
+    def iter_has_outbound_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasOutboundPort`.
+
+        Unlike :meth:`get_has_outbound_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_outbound_port_ports', {})
+        )
 
     def provides_link(self, link):
         """
@@ -1094,7 +1634,7 @@ class SwitchingService(Service):
             raise RelationProvidesLinkError()
 
         return link.identifier in \
-            self._provides_link_links
+            getattr(self, '_provides_link_links', ())
 
     def add_provides_link(self, link):
         """
@@ -1108,8 +1648,14 @@ class SwitchingService(Service):
                 LinkGroup, ):
             raise RelationProvidesLinkError()
 
-        self._provides_link_links[link.identifier] = \
-            link
+        try:
+            related = self._provides_link_links
+        except AttributeError:
+            related = self._provides_link_links = OrderedDict()
+        related[link.identifier] = link
+
+        if self._observers:
+            notify(self, 'providesLink', (), (link, ))
 
     def get_provides_link(self):
         """
@@ -1118,7 +1664,23 @@ class SwitchingService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._provides_link_links)
+        return OrderedDict(
+            getattr(self, '_provides_link_links', ())
+        )
+
+    def iter_provides_link(self):
+        """
+        Iterate over the objects related with this object with relation
+        `providesLink`.
+
+        Unlike :meth:`get_provides_link` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_provides_link_links', {})
+        )
 
 
 class AdaptationService(Service):
@@ -1134,26 +1696,42 @@ class AdaptationService(Service):
     :param None adaptation_function: Function for multiplexing.
     """
 
+    __slots__ = (
+        'adaptation_function',
+        '_can_provide_port_ports',
+        '_provides_port_ports',
+    )
+
+    attributes = (
+        'name',
+        'identifier',
+        'version',
+        'adaptation_function',
+    )
+
+    nml_attributes = OrderedDict([
+        ('name', 'name'),
+        ('id', 'identifier'),
+        ('version', 'version'),
+        ('adaptationFunction', 'adaptation_function'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('canProvidePort', 'can_provide_port'),
+        ('providesPort', 'provides_port'),
+    ])
+
     def __init__(
             self, adaptation_function=None, **kwargs):
         super(AdaptationService, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('adaptation_function')
         self.adaptation_function = adaptation_function
 
-        # Relations
-        self.relations['canProvidePort'] = \
-            self.get_can_provide_port
-        self._can_provide_port_ports = OrderedDict()
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['providesPort'] = \
-            self.get_provides_port
-        self._provides_port_ports = OrderedDict()
-
     def can_provide_port(self, port):
         """
         Check `canProvidePort` relation with given `port` object.
@@ -1171,7 +1749,7 @@ class AdaptationService(Service):
             raise RelationCanProvidePortError()
 
         return port.identifier in \
-            self._can_provide_port_ports
+            getattr(self, '_can_provide_port_ports', ())
 
     def add_can_provide_port(self, port):
         """
@@ -1185,8 +1763,14 @@ class AdaptationService(Service):
                 PortGroup, ):
             raise RelationCanProvidePortError()
 
-        self._can_provide_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._can_provide_port_ports
+        except AttributeError:
+            related = self._can_provide_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'canProvidePort', (), (port, ))
 
     def get_can_provide_port(self):
         """
@@ -1196,7 +1780,23 @@ class AdaptationService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._can_provide_port_ports)
+        return OrderedDict(
+            getattr(self, '_can_provide_port_ports', ())
+        )
+
+    def iter_can_provide_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `canProvidePort`.
+
+        Unlike :meth:`get_can_provide_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_can_provide_port_ports', {})
+        )
 
     def exists_during(self, lifetime):
         """
@@ -1214,7 +1814,7 @@ class AdaptationService(Service):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -1227,8 +1827,14 @@ class AdaptationService(Service):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -1237,7 +1843,23 @@ class AdaptationService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
+
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
 
     def provides_port(self, port):
         """
@@ -1256,7 +1878,7 @@ class AdaptationService(Service):
             raise RelationProvidesPortError()
 
         return port.identifier in \
-            self._provides_port_ports
+            getattr(self, '_provides_port_ports', ())
 
     def add_provides_port(self, port):
         """
@@ -1270,8 +1892,14 @@ class AdaptationService(Service):
                 PortGroup, ):
             raise RelationProvidesPortError()
 
-        self._provides_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._provides_port_ports
+        except AttributeError:
+            related = self._provides_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'providesPort', (), (port, ))
 
     def get_provides_port(self):
         """
@@ -1280,7 +1908,23 @@ class AdaptationService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._provides_port_ports)
+        return OrderedDict(
+            getattr(self, '_provides_port_ports', ())
+        )
+
+    def iter_provides_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `providesPort`.
+
+        Unlike :meth:`get_provides_port` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_provides_port_ports', {})
+        )
 
 
 class DeAdaptationService(Service):
@@ -1296,26 +1940,42 @@ class DeAdaptationService(Service):
     :param None adaptation_function: Function for multiplexing.
     """
 
+    __slots__ = (
+        'adaptation_function',
+        '_can_provide_port_ports',
+        '_provides_port_ports',
+    )
+
+    attributes = (
+        'name',
+        'identifier',
+        'version',
+        'adaptation_function',
+    )
+
+    nml_attributes = OrderedDict([
+        ('name', 'name'),
+        ('id', 'identifier'),
+        ('version', 'version'),
+        ('adaptationFunction', 'adaptation_function'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('canProvidePort', 'can_provide_port'),
+        ('providesPort', 'provides_port'),
+    ])
+
     def __init__(
             self, adaptation_function=None, **kwargs):
         super(DeAdaptationService, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('adaptation_function')
         self.adaptation_function = adaptation_function
 
-        # Relations
-        self.relations['canProvidePort'] = \
-            self.get_can_provide_port
-        self._can_provide_port_ports = OrderedDict()
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['providesPort'] = \
-            self.get_provides_port
-        self._provides_port_ports = OrderedDict()
-
     def can_provide_port(self, port):
         """
         Check `canProvidePort` relation with given `port` object.
@@ -1333,7 +1993,7 @@ class DeAdaptationService(Service):
             raise RelationCanProvidePortError()
 
         return port.identifier in \
-            self._can_provide_port_ports
+            getattr(self, '_can_provide_port_ports', ())
 
     def add_can_provide_port(self, port):
         """
@@ -1347,8 +2007,14 @@ class DeAdaptationService(Service):
                 PortGroup, ):
             raise RelationCanProvidePortError()
 
-        self._can_provide_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._can_provide_port_ports
+        except AttributeError:
+            related = self._can_provide_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'canProvidePort', (), (port, ))
 
     def get_can_provide_port(self):
         """
@@ -1358,7 +2024,23 @@ class DeAdaptationService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._can_provide_port_ports)
+        return OrderedDict(
+            getattr(self, '_can_provide_port_ports', ())
+        )
+
+    def iter_can_provide_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `canProvidePort`.
+
+        Unlike :meth:`get_can_provide_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_can_provide_port_ports', {})
+        )
 
     def exists_during(self, lifetime):
         """
@@ -1376,7 +2058,7 @@ class DeAdaptationService(Service):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -1389,8 +2071,14 @@ class DeAdaptationService(Service):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -1399,7 +2087,23 @@ class DeAdaptationService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
+
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
 
     def provides_port(self, port):
         """
@@ -1418,7 +2122,7 @@ class DeAdaptationService(Service):
             raise RelationProvidesPortError()
 
         return port.identifier in \
-            self._provides_port_ports
+            getattr(self, '_provides_port_ports', ())
 
     def add_provides_port(self, port):
         """
@@ -1432,8 +2136,14 @@ class DeAdaptationService(Service):
                 PortGroup, ):
             raise RelationProvidesPortError()
 
-        self._provides_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._provides_port_ports
+        except AttributeError:
+            related = self._provides_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'providesPort', (), (port, ))
 
     def get_provides_port(self):
         """
@@ -1442,7 +2152,23 @@ class DeAdaptationService(Service):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._provides_port_ports)
+        return OrderedDict(
+            getattr(self, '_provides_port_ports', ())
+        )
+
+    def iter_provides_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `providesPort`.
+
+        Unlike :meth:`get_provides_port` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_provides_port_ports', {})
+        )
 
 
 @add_metaclass(ABCMeta)
@@ -1454,6 +2180,8 @@ class Group(NetworkObject):
     part of multiple Groups.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def __init__(
             self, **kwargs):
@@ -1468,30 +2196,29 @@ class Topology(Group):
     the Topology Network Objects.
     """
 
+    __slots__ = (
+        '_has_node_nodes',
+        '_has_inbound_port_ports',
+        '_has_outbound_port_ports',
+        '_has_service_switching_services',
+        '_has_topology_topologies',
+    )
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasNode', 'has_node'),
+        ('hasInboundPort', 'has_inbound_port'),
+        ('hasOutboundPort', 'has_outbound_port'),
+        ('hasService', 'has_service'),
+        ('hasTopology', 'has_topology'),
+    ])
+
     def __init__(
             self, **kwargs):
         super(Topology, self).__init__(**kwargs)
 
-        # Relations
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['hasNode'] = \
-            self.get_has_node
-        self._has_node_nodes = OrderedDict()
-        self.relations['hasInboundPort'] = \
-            self.get_has_inbound_port
-        self._has_inbound_port_ports = OrderedDict()
-        self.relations['hasOutboundPort'] = \
-            self.get_has_outbound_port
-        self._has_outbound_port_ports = OrderedDict()
-        self.relations['hasService'] = \
-            self.get_has_service
-        self._has_service_switching_services = OrderedDict()
-        self.relations['hasTopology'] = \
-            self.get_has_topology
-        self._has_topology_topologies = OrderedDict()
-
     def exists_during(self, lifetime):
         """
         Check `existsDuring` relation with given `lifetime` object.
@@ -1508,7 +2235,7 @@ class Topology(Group):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -1521,8 +2248,14 @@ class Topology(Group):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -1531,7 +2264,23 @@ class Topology(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
+
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
 
     def has_node(self, node):
         """
@@ -1549,7 +2298,7 @@ class Topology(Group):
             raise RelationHasNodeError()
 
         return node.identifier in \
-            self._has_node_nodes
+            getattr(self, '_has_node_nodes', ())
 
     def add_has_node(self, node):
         """
@@ -1562,8 +2311,14 @@ class Topology(Group):
                 Node, ):
             raise RelationHasNodeError()
 
-        self._has_node_nodes[node.identifier] = \
-            node
+        try:
+            related = self._has_node_nodes
+        except AttributeError:
+            related = self._has_node_nodes = OrderedDict()
+        related[node.identifier] = node
+
+        if self._observers:
+            notify(self, 'hasNode', (), (node, ))
 
     def get_has_node(self):
         """
@@ -1572,7 +2327,23 @@ class Topology(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_node_nodes)
+        return OrderedDict(
+            getattr(self, '_has_node_nodes', ())
+        )
+
+    def iter_has_node(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasNode`.
+
+        Unlike :meth:`get_has_node` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_node_nodes', {})
+        )
 
     def has_inbound_port(self, port):
         """
@@ -1591,7 +2362,7 @@ class Topology(Group):
             raise RelationHasInboundPortError()
 
         return port.identifier in \
-            self._has_inbound_port_ports
+            getattr(self, '_has_inbound_port_ports', ())
 
     def add_has_inbound_port(self, port):
         """
@@ -1605,8 +2376,14 @@ class Topology(Group):
                 PortGroup, ):
             raise RelationHasInboundPortError()
 
-        self._has_inbound_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_inbound_port_ports
+        except AttributeError:
+            related = self._has_inbound_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'hasInboundPort', (), (port, ))
 
     def get_has_inbound_port(self):
         """
@@ -1616,7 +2393,23 @@ class Topology(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_inbound_port_ports)
+        return OrderedDict(
+            getattr(self, '_has_inbound_port_ports', ())
+        )
+
+    def iter_has_inbound_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasInboundPort`.
+
+        Unlike :meth:`get_has_inbound_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_inbound_port_ports', {})
+        )
 
     def has_outbound_port(self, port):
         """
@@ -1635,7 +2428,7 @@ class Topology(Group):
             raise RelationHasOutboundPortError()
 
         return port.identifier in \
-            self._has_outbound_port_ports
+            getattr(self, '_has_outbound_port_ports', ())
 
     def add_has_outbound_port(self, port):
         """
@@ -1649,8 +2442,14 @@ class Topology(Group):
                 PortGroup, ):
             raise RelationHasOutboundPortError()
 
-        self._has_outbound_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_outbound_port_ports
+        except AttributeError:
+            related = self._has_outbound_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'hasOutboundPort', (), (port, ))
 
     def get_has_outbound_port(self):
         """
@@ -1660,9 +2459,25 @@ class Topology(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_outbound_port_ports)
+        return OrderedDict(
+            getattr(self, '_has_outbound_port_ports', ())
+        )
 
-    def has_service(self, switching_service):
+    def iter_has_outbound_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasOutboundPort`.
+
+        Unlike :meth:`get_has_outbound_port` the collection is not copied, so
+        the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_outbound_port_ports', {})
+        )
+
+    def has_service(self, switching_service):
         """
         Check `hasService` relation with given `switching_service` object.
 
@@ -1680,7 +2495,7 @@ class Topology(Group):
             raise RelationHasServiceError()
 
         return switching_service.identifier in \
-            self._has_service_switching_services
+            getattr(self, '_has_service_switching_services', ())
 
     def add_has_service(self, switching_service):
         """
@@ -1693,8 +2508,14 @@ class Topology(Group):
                 SwitchingService, ):
             raise RelationHasServiceError()
 
-        self._has_service_switching_services[switching_service.identifier] = \
-            switching_service
+        try:
+            related = self._has_service_switching_services
+        except AttributeError:
+            related = self._has_service_switching_services = OrderedDict()
+        related[switching_service.identifier] = switching_service
+
+        if self._observers:
+            notify(self, 'hasService', (), (switching_service, ))
 
     def get_has_service(self):
         """
@@ -1703,7 +2524,23 @@ class Topology(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_service_switching_services)
+        return OrderedDict(
+            getattr(self, '_has_service_switching_services', ())
+        )
+
+    def iter_has_service(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasService`.
+
+        Unlike :meth:`get_has_service` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_service_switching_services', {})
+        )
 
     def has_topology(self, topology):
         """
@@ -1721,7 +2558,7 @@ class Topology(Group):
             raise RelationHasTopologyError()
 
         return topology.identifier in \
-            self._has_topology_topologies
+            getattr(self, '_has_topology_topologies', ())
 
     def add_has_topology(self, topology):
         """
@@ -1734,8 +2571,14 @@ class Topology(Group):
                 Topology, ):
             raise RelationHasTopologyError()
 
-        self._has_topology_topologies[topology.identifier] = \
-            topology
+        try:
+            related = self._has_topology_topologies
+        except AttributeError:
+            related = self._has_topology_topologies = OrderedDict()
+        related[topology.identifier] = topology
+
+        if self._observers:
+            notify(self, 'hasTopology', (), (topology, ))
 
     def get_has_topology(self):
         """
@@ -1744,7 +2587,23 @@ class Topology(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_topology_topologies)
+        return OrderedDict(
+            getattr(self, '_has_topology_topologies', ())
+        )
+
+    def iter_has_topology(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasTopology`.
+
+        Unlike :meth:`get_has_topology` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_topology_topologies', {})
+        )
 
 
 class PortGroup(Group):
@@ -1754,27 +2613,27 @@ class PortGroup(Group):
     FIXME: Document PortGroup.
     """
 
+    __slots__ = (
+        '_has_label_group_label_groups',
+        '_has_port_ports',
+        '_is_sink_link_groups',
+        '_is_source_link_groups',
+    )
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasLabelGroup', 'has_label_group'),
+        ('hasPort', 'has_port'),
+        ('isSink', 'is_sink'),
+        ('isSource', 'is_source'),
+    ])
+
     def __init__(
             self, **kwargs):
         super(PortGroup, self).__init__(**kwargs)
 
-        # Relations
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['hasLabelGroup'] = \
-            self.get_has_label_group
-        self._has_label_group_lifetimes = (None, )
-        self.relations['hasPort'] = \
-            self.get_has_port
-        self._has_port_ports = OrderedDict()
-        self.relations['isSink'] = \
-            self.get_is_sink
-        self._is_sink_link_groups = OrderedDict()
-        self.relations['isSource'] = \
-            self.get_is_source
-        self._is_source_link_groups = OrderedDict()
-
     def exists_during(self, lifetime):
         """
         Check `existsDuring` relation with given `lifetime` object.
@@ -1791,7 +2650,7 @@ class PortGroup(Group):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -1804,8 +2663,14 @@ class PortGroup(Group):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -1814,40 +2679,61 @@ class PortGroup(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
+
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
 
-    def has_label_group(self, lifetime):
+        :return: An iterator over the objects related with this object.
         """
-        Check `hasLabelGroup` relation with given `lifetime` object.
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
+
+    def has_label_group(self, label_group):
+        """
+        Check `hasLabelGroup` relation with given `label_group` object.
 
         FIXME: Document hasLabelGroup relation.
 
-        :param lifetime: Object to validate relation `hasLabelGroup` with.
-        :type lifetime: Lifetime
-        :return: True if `lifetime` is related to `self` with `hasLabelGroup`.
+        :param label_group: Object to validate relation `hasLabelGroup` with.
+        :type label_group: LabelGroup
+        :return: True if `label_group` is related to `self` with
+         `hasLabelGroup`.
         :rtype: bool
         """
-        if lifetime.__class__ not in (
-                Lifetime, ):
+        if label_group.__class__ not in (
+                LabelGroup, ):
             raise RelationHasLabelGroupError()
 
-        return lifetime in \
-            self._has_label_group_lifetimes
+        return label_group in \
+            getattr(self, '_has_label_group_label_groups', (None, ))
 
-    def set_has_label_group(self, lifetime):
+    def set_has_label_group(self, label_group):
         """
         Set the `hasLabelGroup` relation to given objects.
 
-        :param lifetime: Object to set to the `hasLabelGroup` relation.
-        :type lifetime: Lifetime
+        :param label_group: Object to set to the `hasLabelGroup` relation.
+        :type label_group: LabelGroup
         """
-        arg_tuple = (lifetime, )
+        arg_tuple = (label_group, )
 
         for arg in arg_tuple:
-            if arg.__class__ not in (Lifetime, ):
+            if arg.__class__ not in (LabelGroup, ):
                 raise RelationHasLabelGroupError()
 
-        self._has_label_group_lifetimes = arg_tuple
+        removed = getattr(self, '_has_label_group_label_groups', (None, ))
+        self._has_label_group_label_groups = arg_tuple
+
+        if self._observers:
+            notify(self, 'hasLabelGroup', removed, arg_tuple)
 
     def get_has_label_group(self):
         """
@@ -1856,7 +2742,20 @@ class PortGroup(Group):
         :rtype: set
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_label_group_lifetimes)
+        return copy(getattr(self, '_has_label_group_label_groups', (None, )))
+
+    def iter_has_label_group(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasLabelGroup`.
+
+        Unlike :meth:`get_has_label_group` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_has_label_group_label_groups', (None, ))
+        return (obj for obj in related if obj is not None)
 
     def has_port(self, port):
         """
@@ -1875,7 +2774,7 @@ class PortGroup(Group):
             raise RelationHasPortError()
 
         return port.identifier in \
-            self._has_port_ports
+            getattr(self, '_has_port_ports', ())
 
     def add_has_port(self, port):
         """
@@ -1889,8 +2788,14 @@ class PortGroup(Group):
                 PortGroup, ):
             raise RelationHasPortError()
 
-        self._has_port_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_port_ports
+        except AttributeError:
+            related = self._has_port_ports = OrderedDict()
+        related[port.identifier] = port
+
+        if self._observers:
+            notify(self, 'hasPort', (), (port, ))
 
     def get_has_port(self):
         """
@@ -1899,7 +2804,23 @@ class PortGroup(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_port_ports)
+        return OrderedDict(
+            getattr(self, '_has_port_ports', ())
+        )
+
+    def iter_has_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasPort`.
+
+        Unlike :meth:`get_has_port` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_port_ports', {})
+        )
 
     def is_sink(self, link_group):
         """
@@ -1917,7 +2838,7 @@ class PortGroup(Group):
             raise RelationIsSinkError()
 
         return link_group.identifier in \
-            self._is_sink_link_groups
+            getattr(self, '_is_sink_link_groups', ())
 
     def add_is_sink(self, link_group):
         """
@@ -1930,8 +2851,14 @@ class PortGroup(Group):
                 LinkGroup, ):
             raise RelationIsSinkError()
 
-        self._is_sink_link_groups[link_group.identifier] = \
-            link_group
+        try:
+            related = self._is_sink_link_groups
+        except AttributeError:
+            related = self._is_sink_link_groups = OrderedDict()
+        related[link_group.identifier] = link_group
+
+        if self._observers:
+            notify(self, 'isSink', (), (link_group, ))
 
     def get_is_sink(self):
         """
@@ -1940,7 +2867,23 @@ class PortGroup(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._is_sink_link_groups)
+        return OrderedDict(
+            getattr(self, '_is_sink_link_groups', ())
+        )
+
+    def iter_is_sink(self):
+        """
+        Iterate over the objects related with this object with relation
+        `isSink`.
+
+        Unlike :meth:`get_is_sink` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_is_sink_link_groups', {})
+        )
 
     def is_source(self, link_group):
         """
@@ -1958,7 +2901,7 @@ class PortGroup(Group):
             raise RelationIsSourceError()
 
         return link_group.identifier in \
-            self._is_source_link_groups
+            getattr(self, '_is_source_link_groups', ())
 
     def add_is_source(self, link_group):
         """
@@ -1971,8 +2914,14 @@ class PortGroup(Group):
                 LinkGroup, ):
             raise RelationIsSourceError()
 
-        self._is_source_link_groups[link_group.identifier] = \
-            link_group
+        try:
+            related = self._is_source_link_groups
+        except AttributeError:
+            related = self._is_source_link_groups = OrderedDict()
+        related[link_group.identifier] = link_group
+
+        if self._observers:
+            notify(self, 'isSource', (), (link_group, ))
 
     def get_is_source(self):
         """
@@ -1981,7 +2930,23 @@ class PortGroup(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._is_source_link_groups)
+        return OrderedDict(
+            getattr(self, '_is_source_link_groups', ())
+        )
+
+    def iter_is_source(self):
+        """
+        Iterate over the objects related with this object with relation
+        `isSource`.
+
+        Unlike :meth:`get_is_source` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_is_source_link_groups', {})
+        )
 
 
 class LinkGroup(Group):
@@ -1991,24 +2956,25 @@ class LinkGroup(Group):
     FIXME: Document LinkGroup.
     """
 
+    __slots__ = (
+        '_has_label_group_label_groups',
+        '_has_link_links',
+        '_is_serial_compound_link_ordered_lists',
+    )
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasLabelGroup', 'has_label_group'),
+        ('hasLink', 'has_link'),
+        ('isSerialCompoundLink', 'is_serial_compound_link'),
+    ])
+
     def __init__(
             self, **kwargs):
         super(LinkGroup, self).__init__(**kwargs)
 
-        # Relations
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['hasLabelGroup'] = \
-            self.get_has_label_group
-        self._has_label_group_lifetimes = (None, )
-        self.relations['hasLink'] = \
-            self.get_has_link
-        self._has_link_ports = OrderedDict()
-        self.relations['isSerialCompoundLink'] = \
-            self.get_is_serial_compound_link
-        self._is_serial_compound_link_ports = OrderedDict()
-
     def exists_during(self, lifetime):
         """
         Check `existsDuring` relation with given `lifetime` object.
@@ -2025,7 +2991,7 @@ class LinkGroup(Group):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -2038,8 +3004,14 @@ class LinkGroup(Group):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -2048,40 +3020,61 @@ class LinkGroup(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
 
-    def has_label_group(self, lifetime):
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
+
+    def has_label_group(self, label_group):
         """
-        Check `hasLabelGroup` relation with given `lifetime` object.
+        Check `hasLabelGroup` relation with given `label_group` object.
 
         FIXME: Document hasLabelGroup relation.
 
-        :param lifetime: Object to validate relation `hasLabelGroup` with.
-        :type lifetime: Lifetime
-        :return: True if `lifetime` is related to `self` with `hasLabelGroup`.
+        :param label_group: Object to validate relation `hasLabelGroup` with.
+        :type label_group: LabelGroup
+        :return: True if `label_group` is related to `self` with
+         `hasLabelGroup`.
         :rtype: bool
         """
-        if lifetime.__class__ not in (
-                Lifetime, ):
+        if label_group.__class__ not in (
+                LabelGroup, ):
             raise RelationHasLabelGroupError()
 
-        return lifetime in \
-            self._has_label_group_lifetimes
+        return label_group in \
+            getattr(self, '_has_label_group_label_groups', (None, ))
 
-    def set_has_label_group(self, lifetime):
+    def set_has_label_group(self, label_group):
         """
         Set the `hasLabelGroup` relation to given objects.
 
-        :param lifetime: Object to set to the `hasLabelGroup` relation.
-        :type lifetime: Lifetime
+        :param label_group: Object to set to the `hasLabelGroup` relation.
+        :type label_group: LabelGroup
         """
-        arg_tuple = (lifetime, )
+        arg_tuple = (label_group, )
 
         for arg in arg_tuple:
-            if arg.__class__ not in (Lifetime, ):
+            if arg.__class__ not in (LabelGroup, ):
                 raise RelationHasLabelGroupError()
 
-        self._has_label_group_lifetimes = arg_tuple
+        removed = getattr(self, '_has_label_group_label_groups', (None, ))
+        self._has_label_group_label_groups = arg_tuple
+
+        if self._observers:
+            notify(self, 'hasLabelGroup', removed, arg_tuple)
 
     def get_has_label_group(self):
         """
@@ -2090,41 +3083,60 @@ class LinkGroup(Group):
         :rtype: set
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_label_group_lifetimes)
+        return copy(getattr(self, '_has_label_group_label_groups', (None, )))
+
+    def iter_has_label_group(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasLabelGroup`.
+
+        Unlike :meth:`get_has_label_group` the collection is not copied, so the
+        relation must not be modified while iterating.
 
-    def has_link(self, port):
+        :return: An iterator over the objects related with this object.
         """
-        Check `hasLink` relation with given `port` object.
+        related = getattr(self, '_has_label_group_label_groups', (None, ))
+        return (obj for obj in related if obj is not None)
+
+    def has_link(self, link):
+        """
+        Check `hasLink` relation with given `link` object.
 
         FIXME: Document hasLink relation.
 
-        :param port: Object to validate relation `hasLink` with.
-        :type port: Port or PortGroup
-        :return: True if `port` is related to `self` with `hasLink`.
+        :param link: Object to validate relation `hasLink` with.
+        :type link: Link or LinkGroup
+        :return: True if `link` is related to `self` with `hasLink`.
         :rtype: bool
         """
-        if port.__class__ not in (
-                Port,
-                PortGroup, ):
+        if link.__class__ not in (
+                Link,
+                LinkGroup, ):
             raise RelationHasLinkError()
 
-        return port.identifier in \
-            self._has_link_ports
+        return link.identifier in \
+            getattr(self, '_has_link_links', ())
 
-    def add_has_link(self, port):
+    def add_has_link(self, link):
         """
-        Add given `port` to this object `hasLink` relations.
+        Add given `link` to this object `hasLink` relations.
 
-        :param port: Object to add to the `hasLink` relation.
-        :type port: Port or PortGroup
+        :param link: Object to add to the `hasLink` relation.
+        :type link: Link or LinkGroup
         """
-        if port.__class__ not in (
-                Port,
-                PortGroup, ):
+        if link.__class__ not in (
+                Link,
+                LinkGroup, ):
             raise RelationHasLinkError()
 
-        self._has_link_ports[port.identifier] = \
-            port
+        try:
+            related = self._has_link_links
+        except AttributeError:
+            related = self._has_link_links = OrderedDict()
+        related[link.identifier] = link
+
+        if self._observers:
+            notify(self, 'hasLink', (), (link, ))
 
     def get_has_link(self):
         """
@@ -2133,42 +3145,67 @@ class LinkGroup(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_link_ports)
+        return OrderedDict(
+            getattr(self, '_has_link_links', ())
+        )
 
-    def is_serial_compound_link(self, port):
+    def iter_has_link(self):
         """
-        Check `isSerialCompoundLink` relation with given `port` object.
+        Iterate over the objects related with this object with relation
+        `hasLink`.
 
-        FIXME: Document isSerialCompoundLink relation.
+        Unlike :meth:`get_has_link` the collection is not copied, so the
+        relation must not be modified while iterating.
 
-        :param port: Object to validate relation `isSerialCompoundLink` with.
-        :type port: Port or PortGroup
-        :return: True if `port` is related to `self` with
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_has_link_links', {})
+        )
+
+    def is_serial_compound_link(self, ordered_list):
+        """
+        Check `isSerialCompoundLink` relation with given `ordered_list` object.
+
+        The OrderedList of Links or LinkGroups this LinkGroup is the serial
+        concatenation of.
+
+        :param ordered_list: Object to validate relation `isSerialCompoundLink`
+         with.
+        :type ordered_list: OrderedList
+        :return: True if `ordered_list` is related to `self` with
          `isSerialCompoundLink`.
         :rtype: bool
         """
-        if port.__class__ not in (
-                Port,
-                PortGroup, ):
+        if ordered_list.__class__ not in (
+                OrderedList, ):
             raise RelationIsSerialCompoundLinkError()
 
-        return port.identifier in \
-            self._is_serial_compound_link_ports
+        return ordered_list.identifier in \
+            getattr(self, '_is_serial_compound_link_ordered_lists', ())
 
-    def add_is_serial_compound_link(self, port):
+    def add_is_serial_compound_link(self, ordered_list):
         """
-        Add given `port` to this object `isSerialCompoundLink` relations.
+        Add given `ordered_list` to this object `isSerialCompoundLink`
+        relations.
 
-        :param port: Object to add to the `isSerialCompoundLink` relation.
-        :type port: Port or PortGroup
+        :param ordered_list: Object to add to the `isSerialCompoundLink`
+         relation.
+        :type ordered_list: OrderedList
         """
-        if port.__class__ not in (
-                Port,
-                PortGroup, ):
+        if ordered_list.__class__ not in (
+                OrderedList, ):
             raise RelationIsSerialCompoundLinkError()
 
-        self._is_serial_compound_link_ports[port.identifier] = \
-            port
+        try:
+            related = self._is_serial_compound_link_ordered_lists
+        except AttributeError:
+            related = OrderedDict()
+            self._is_serial_compound_link_ordered_lists = related
+        related[ordered_list.identifier] = ordered_list
+
+        if self._observers:
+            notify(self, 'isSerialCompoundLink', (), (ordered_list, ))
 
     def get_is_serial_compound_link(self):
         """
@@ -2178,7 +3215,23 @@ class LinkGroup(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._is_serial_compound_link_ports)
+        return OrderedDict(
+            getattr(self, '_is_serial_compound_link_ordered_lists', ())
+        )
+
+    def iter_is_serial_compound_link(self):
+        """
+        Iterate over the objects related with this object with relation
+        `isSerialCompoundLink`.
+
+        Unlike :meth:`get_is_serial_compound_link` the collection is not
+        copied, so the relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_is_serial_compound_link_ordered_lists', {})
+        )
 
 
 class BidirectionalPort(Group):
@@ -2190,18 +3243,21 @@ class BidirectionalPort(Group):
     specification.
     """
 
+    __slots__ = (
+        '_has_port_ports',
+    )
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasPort', 'has_port'),
+    ])
+
     def __init__(
             self, **kwargs):
         super(BidirectionalPort, self).__init__(**kwargs)
 
-        # Relations
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['hasPort'] = \
-            self.get_has_port
-        self._has_port_ports = (None, None, )
-
     def exists_during(self, lifetime):
         """
         Check `existsDuring` relation with given `lifetime` object.
@@ -2218,7 +3274,7 @@ class BidirectionalPort(Group):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -2231,8 +3287,14 @@ class BidirectionalPort(Group):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -2241,7 +3303,23 @@ class BidirectionalPort(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
+
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
 
     def has_port(self, port):
         """
@@ -2260,7 +3338,7 @@ class BidirectionalPort(Group):
             raise RelationHasPortError()
 
         return port in \
-            self._has_port_ports
+            getattr(self, '_has_port_ports', (None, None, ))
 
     def set_has_port(self, port1, port2):
         """
@@ -2279,8 +3357,12 @@ class BidirectionalPort(Group):
         if len(set(arg_tuple)) != len(arg_tuple):
             raise Exception('Non unique objects')  # FIXME
 
+        removed = getattr(self, '_has_port_ports', (None, None, ))
         self._has_port_ports = arg_tuple
 
+        if self._observers:
+            notify(self, 'hasPort', removed, arg_tuple)
+
     def get_has_port(self):
         """
         Get all objects related with this object with relation `hasPort`.
@@ -2288,7 +3370,20 @@ class BidirectionalPort(Group):
         :rtype: set
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_port_ports)
+        return copy(getattr(self, '_has_port_ports', (None, None, )))
+
+    def iter_has_port(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasPort`.
+
+        Unlike :meth:`get_has_port` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_has_port_ports', (None, None, ))
+        return (obj for obj in related if obj is not None)
 
 
 class BidirectionalLink(Group):
@@ -2300,18 +3395,21 @@ class BidirectionalLink(Group):
     specification.
     """
 
+    __slots__ = (
+        '_has_link_links',
+    )
+
+    relation_methods = OrderedDict([
+        ('existsDuring', 'exists_during'),
+        ('isAlias', 'is_alias'),
+        ('locatedAt', 'located_at'),
+        ('hasLink', 'has_link'),
+    ])
+
     def __init__(
             self, **kwargs):
         super(BidirectionalLink, self).__init__(**kwargs)
 
-        # Relations
-        self.relations['existsDuring'] = \
-            self.get_exists_during
-        self._exists_during_lifetimes = OrderedDict()
-        self.relations['hasLink'] = \
-            self.get_has_link
-        self._has_link_links = (None, None, )
-
     def exists_during(self, lifetime):
         """
         Check `existsDuring` relation with given `lifetime` object.
@@ -2328,7 +3426,7 @@ class BidirectionalLink(Group):
             raise RelationExistsDuringError()
 
         return lifetime.identifier in \
-            self._exists_during_lifetimes
+            getattr(self, '_exists_during_lifetimes', ())
 
     def add_exists_during(self, lifetime):
         """
@@ -2341,8 +3439,14 @@ class BidirectionalLink(Group):
                 Lifetime, ):
             raise RelationExistsDuringError()
 
-        self._exists_during_lifetimes[lifetime.identifier] = \
-            lifetime
+        try:
+            related = self._exists_during_lifetimes
+        except AttributeError:
+            related = self._exists_during_lifetimes = OrderedDict()
+        related[lifetime.identifier] = lifetime
+
+        if self._observers:
+            notify(self, 'existsDuring', (), (lifetime, ))
 
     def get_exists_during(self):
         """
@@ -2351,7 +3455,23 @@ class BidirectionalLink(Group):
         :rtype: :py:class:`OrderedDict`
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._exists_during_lifetimes)
+        return OrderedDict(
+            getattr(self, '_exists_during_lifetimes', ())
+        )
+
+    def iter_exists_during(self):
+        """
+        Iterate over the objects related with this object with relation
+        `existsDuring`.
+
+        Unlike :meth:`get_exists_during` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        return itervalues(
+            getattr(self, '_exists_during_lifetimes', {})
+        )
 
     def has_link(self, link):
         """
@@ -2370,7 +3490,7 @@ class BidirectionalLink(Group):
             raise RelationHasLinkError()
 
         return link in \
-            self._has_link_links
+            getattr(self, '_has_link_links', (None, None, ))
 
     def set_has_link(self, link1, link2):
         """
@@ -2389,8 +3509,12 @@ class BidirectionalLink(Group):
         if len(set(arg_tuple)) != len(arg_tuple):
             raise Exception('Non unique objects')  # FIXME
 
+        removed = getattr(self, '_has_link_links', (None, None, ))
         self._has_link_links = arg_tuple
 
+        if self._observers:
+            notify(self, 'hasLink', removed, arg_tuple)
+
     def get_has_link(self):
         """
         Get all objects related with this object with relation `hasLink`.
@@ -2398,7 +3522,20 @@ class BidirectionalLink(Group):
         :rtype: set
         :return: A copy of the collection of objects related with this object.
         """
-        return copy(self._has_link_links)
+        return copy(getattr(self, '_has_link_links', (None, None, )))
+
+    def iter_has_link(self):
+        """
+        Iterate over the objects related with this object with relation
+        `hasLink`.
+
+        Unlike :meth:`get_has_link` the collection is not copied, so the
+        relation must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_has_link_links', (None, None, ))
+        return (obj for obj in related if obj is not None)
 
 
 class Location(NMLObject):
@@ -2417,6 +3554,36 @@ class Location(NMLObject):
     :param str address: A vCard ADR property.
     """
 
+    __slots__ = (
+        '_name',
+        '_identifier',
+        '_longitude',
+        '_latitude',
+        '_altitude',
+        '_unlocode',
+        '_address',
+    )
+
+    attributes = (
+        'name',
+        'identifier',
+        'longitude',
+        'latitude',
+        'altitude',
+        'unlocode',
+        'address',
+    )
+
+    nml_attributes = OrderedDict([
+        ('name', 'name'),
+        ('id', 'identifier'),
+        ('long', 'longitude'),
+        ('lat', 'latitude'),
+        ('alt', 'altitude'),
+        ('unlocode', 'unlocode'),
+        ('address', 'address'),
+    ])
+
     def __init__(
             self, name=None, identifier=None, longitude=None, latitude=None,
             altitude=None, unlocode=None, address=None, **kwargs):
@@ -2424,39 +3591,32 @@ class Location(NMLObject):
 
         # Attributes
 
-        self.attributes.append('name')
         if name is None:
             name = '{}<{}>'.format(
                 self.__class__.__name__, str(id(self))
             )
         self.name = name
 
-        self.attributes.append('identifier')
         if identifier is None:
             identifier = str(id(self))
         self.identifier = identifier
 
-        self.attributes.append('longitude')
         if longitude is None:
             longitude = unset
         self.longitude = longitude
 
-        self.attributes.append('latitude')
         if latitude is None:
             latitude = unset
         self.latitude = latitude
 
-        self.attributes.append('altitude')
         if altitude is None:
             altitude = unset
         self.altitude = altitude
 
-        self.attributes.append('unlocode')
         if unlocode is None:
             unlocode = unset
         self.unlocode = unlocode
 
-        self.attributes.append('address')
         if address is None:
             address = unset
         self.address = address
@@ -2482,6 +3642,18 @@ class Location(NMLObject):
             raise AttributeNameError()
         self._name = name
 
+    @staticmethod
+    def validate_name(name):
+        """
+        Validate a value of attribute name without setting it.
+
+        :param str name: Human readable string name.
+        :return: The value the setter stores for given value.
+        """
+        if name is not unset and not name:
+            raise AttributeNameError()
+        return name
+
     @property
     def identifier(self):
         """
@@ -2503,6 +3675,18 @@ class Location(NMLObject):
             raise AttributeIdError()
         self._identifier = identifier
 
+    @staticmethod
+    def validate_identifier(identifier):
+        """
+        Validate a value of attribute identifier without setting it.
+
+        :param str identifier: Persistent globally unique URI.
+        :return: The value the setter stores for given value.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        return identifier
+
     @property
     def longitude(self):
         """
@@ -2522,6 +3706,16 @@ class Location(NMLObject):
         """
         self._longitude = longitude
 
+    @staticmethod
+    def validate_longitude(longitude):
+        """
+        Validate a value of attribute longitude without setting it.
+
+        :param str longitude: Longitude in WGS84 and in decimal degrees.
+        :return: The value the setter stores for given value.
+        """
+        return longitude
+
     @property
     def latitude(self):
         """
@@ -2541,6 +3735,16 @@ class Location(NMLObject):
         """
         self._latitude = latitude
 
+    @staticmethod
+    def validate_latitude(latitude):
+        """
+        Validate a value of attribute latitude without setting it.
+
+        :param str latitude: Latitude in WGS84 and in decimal degrees.
+        :return: The value the setter stores for given value.
+        """
+        return latitude
+
     @property
     def altitude(self):
         """
@@ -2560,6 +3764,16 @@ class Location(NMLObject):
         """
         self._altitude = altitude
 
+    @staticmethod
+    def validate_altitude(altitude):
+        """
+        Validate a value of attribute altitude without setting it.
+
+        :param str altitude: Altitude in WGS84 and in decimal meters.
+        :return: The value the setter stores for given value.
+        """
+        return altitude
+
     @property
     def unlocode(self):
         """
@@ -2579,6 +3793,16 @@ class Location(NMLObject):
         """
         self._unlocode = unlocode
 
+    @staticmethod
+    def validate_unlocode(unlocode):
+        """
+        Validate a value of attribute unlocode without setting it.
+
+        :param str unlocode: UN/LOCODE location identifier.
+        :return: The value the setter stores for given value.
+        """
+        return unlocode
+
     @property
     def address(self):
         """
@@ -2598,6 +3822,16 @@ class Location(NMLObject):
         """
         self._address = address
 
+    @staticmethod
+    def validate_address(address):
+        """
+        Validate a value of attribute address without setting it.
+
+        :param str address: A vCard ADR property.
+        :return: The value the setter stores for given value.
+        """
+        return address
+
 
 class Lifetime(NMLObject):
     """
@@ -2612,20 +3846,33 @@ class Lifetime(NMLObject):
      representation with UTC timezone (YYYYMMDDThhmmssZ).
     """
 
+    __slots__ = (
+        '_start',
+        '_end',
+    )
+
+    attributes = (
+        'start',
+        'end',
+    )
+
+    nml_attributes = OrderedDict([
+        ('start', 'start'),
+        ('end', 'end'),
+    ])
+
     def __init__(
             self, start=None, end=None, **kwargs):
         super(Lifetime, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('start')
         if start is None:
-            start = datetime.now().replace(microsecond=0).isoformat()
+            start = now()
         self.start = start
 
-        self.attributes.append('end')
         if end is None:
-            end = datetime.now().replace(microsecond=0).isoformat()
+            end = now()
         self.end = end
 
     @property
@@ -2637,7 +3884,7 @@ class Lifetime(NMLObject):
          representation with UTC timezone (YYYYMMDDThhmmssZ).
         :rtype: str
         """
-        return self._start
+        return resolve(self._start)
 
     @start.setter
     def start(self, start):
@@ -2649,6 +3896,17 @@ class Lifetime(NMLObject):
         """
         self._start = start
 
+    @staticmethod
+    def validate_start(start):
+        """
+        Validate a value of attribute start without setting it.
+
+        :param str start: Date and time formatted as ISO 8601 calendar date
+         compact representation with UTC timezone (YYYYMMDDThhmmssZ).
+        :return: The value the setter stores for given value.
+        """
+        return start
+
     @property
     def end(self):
         """
@@ -2658,7 +3916,7 @@ class Lifetime(NMLObject):
          representation with UTC timezone (YYYYMMDDThhmmssZ).
         :rtype: str
         """
-        return self._end
+        return resolve(self._end)
 
     @end.setter
     def end(self, end):
@@ -2670,6 +3928,17 @@ class Lifetime(NMLObject):
         """
         self._end = end
 
+    @staticmethod
+    def validate_end(end):
+        """
+        Validate a value of attribute end without setting it.
+
+        :param str end: Date and time formatted as ISO 8601 calendar date
+         compact representation with UTC timezone (YYYYMMDDThhmmssZ).
+        :return: The value the setter stores for given value.
+        """
+        return end
+
 
 class Label(NMLObject):
     """
@@ -2678,22 +3947,76 @@ class Label(NMLObject):
     A Label is technology-specific, so a Label used to identify a VLAN would be
     different from a Label used to identify a wavelength.
 
+    :param str identifier: Persistent globally unique URI.
     :param None labeltype: A technology-specific labelset.
     :param None value: A specific value taken from a labelset.
     """
 
+    __slots__ = (
+        '_identifier',
+        'labeltype',
+        'value',
+    )
+
+    attributes = (
+        'identifier',
+        'labeltype',
+        'value',
+    )
+
+    nml_attributes = OrderedDict([
+        ('id', 'identifier'),
+        ('labeltype', 'labeltype'),
+        ('value', 'value'),
+    ])
+
     def __init__(
-            self, labeltype=None, value=None, **kwargs):
+            self, identifier=None, labeltype=None, value=None, **kwargs):
         super(Label, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('labeltype')
+        if identifier is None:
+            identifier = str(id(self))
+        self.identifier = identifier
+
         self.labeltype = labeltype
 
-        self.attributes.append('value')
         self.value = value
 
+    @property
+    def identifier(self):
+        """
+        Get attribute identifier.
+
+        :return: Persistent globally unique URI.
+        :rtype: str
+        """
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, identifier):
+        """
+        Set attribute identifier.
+
+        :param str identifier: Persistent globally unique URI.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        self._identifier = identifier
+
+    @staticmethod
+    def validate_identifier(identifier):
+        """
+        Validate a value of attribute identifier without setting it.
+
+        :param str identifier: Persistent globally unique URI.
+        :return: The value the setter stores for given value.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        return identifier
+
 
 class LabelGroup(NMLObject):
     """
@@ -2701,22 +4024,119 @@ class LabelGroup(NMLObject):
 
     FIXME: Document LabelGroup.
 
+    :param str identifier: Persistent globally unique URI.
     :param None labeltype: A technology-specific labelset.
-    :param None value: A specific value taken from a labelset.
+    :param IntervalSet value: The values taken from a labelset, as a set of
+     intervals. Strings in NML range syntax, like "1-100,200-300", are parsed,
+     other values, like wavelengths, are kept as they are.
     """
 
+    __slots__ = (
+        '_identifier',
+        'labeltype',
+        '_value',
+    )
+
+    attributes = (
+        'identifier',
+        'labeltype',
+        'value',
+    )
+
+    nml_attributes = OrderedDict([
+        ('id', 'identifier'),
+        ('labeltype', 'labeltype'),
+        ('value', 'value'),
+    ])
+
     def __init__(
-            self, labeltype=None, value=None, **kwargs):
+            self, identifier=None, labeltype=None, value=None, **kwargs):
         super(LabelGroup, self).__init__(**kwargs)
 
         # Attributes
 
-        self.attributes.append('labeltype')
+        if identifier is None:
+            identifier = str(id(self))
+        self.identifier = identifier
+
         self.labeltype = labeltype
 
-        self.attributes.append('value')
+        if value is None:
+            value = unset
         self.value = value
 
+    @property
+    def identifier(self):
+        """
+        Get attribute identifier.
+
+        :return: Persistent globally unique URI.
+        :rtype: str
+        """
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, identifier):
+        """
+        Set attribute identifier.
+
+        :param str identifier: Persistent globally unique URI.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        self._identifier = identifier
+
+    @staticmethod
+    def validate_identifier(identifier):
+        """
+        Validate a value of attribute identifier without setting it.
+
+        :param str identifier: Persistent globally unique URI.
+        :return: The value the setter stores for given value.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        return identifier
+
+    @property
+    def value(self):
+        """
+        Get attribute value.
+
+        :return: The values taken from a labelset, as a set of intervals.
+         Strings in NML range syntax, like "1-100,200-300", are parsed, other
+         values, like wavelengths, are kept as they are.
+        :rtype: IntervalSet
+        """
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        """
+        Set attribute value.
+
+        :param IntervalSet value: The values taken from a labelset, as a set of
+         intervals. Strings in NML range syntax, like "1-100,200-300", are
+         parsed, other values, like wavelengths, are kept as they are.
+        """
+        if value is not unset:
+            value = IntervalSet.coerce(value)
+        self._value = value
+
+    @staticmethod
+    def validate_value(value):
+        """
+        Validate a value of attribute value without setting it.
+
+        :param IntervalSet value: The values taken from a labelset, as a set of
+         intervals. Strings in NML range syntax, like "1-100,200-300", are
+         parsed, other values, like wavelengths, are kept as they are.
+        :return: The value the setter stores for given value.
+        """
+        if value is not unset:
+            value = IntervalSet.coerce(value)
+        return value
+
 
 class OrderedList(NMLObject):
     """
@@ -2724,24 +4144,318 @@ class OrderedList(NMLObject):
 
     Instances of this class are used to describe a path in the network along
     with the isSerialCompoundLink relation.
+
+    :param str identifier: Persistent globally unique URI.
     """
 
+    __slots__ = (
+        '_identifier',
+        '_first_list_items',
+    )
+
+    attributes = (
+        'identifier',
+    )
+
+    nml_attributes = OrderedDict([
+        ('id', 'identifier'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('first', 'first'),
+    ])
+
     def __init__(
-            self, **kwargs):
+            self, identifier=None, **kwargs):
         super(OrderedList, self).__init__(**kwargs)
 
+        # Attributes
+
+        if identifier is None:
+            identifier = str(id(self))
+        self.identifier = identifier
+
+    @property
+    def identifier(self):
+        """
+        Get attribute identifier.
+
+        :return: Persistent globally unique URI.
+        :rtype: str
+        """
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, identifier):
+        """
+        Set attribute identifier.
+
+        :param str identifier: Persistent globally unique URI.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        self._identifier = identifier
+
+    @staticmethod
+    def validate_identifier(identifier):
+        """
+        Validate a value of attribute identifier without setting it.
+
+        :param str identifier: Persistent globally unique URI.
+        :return: The value the setter stores for given value.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        return identifier
+
+    def first(self, list_item):
+        """
+        Check `first` relation with given `list_item` object.
+
+        The first ListItem of this OrderedList.
+
+        :param list_item: Object to validate relation `first` with.
+        :type list_item: ListItem
+        :return: True if `list_item` is related to `self` with `first`.
+        :rtype: bool
+        """
+        if list_item.__class__ not in (
+                ListItem, ):
+            raise RelationFirstError()
+
+        return list_item in \
+            getattr(self, '_first_list_items', (None, ))
+
+    def set_first(self, list_item):
+        """
+        Set the `first` relation to given objects.
+
+        :param list_item: Object to set to the `first` relation.
+        :type list_item: ListItem
+        """
+        arg_tuple = (list_item, )
+
+        for arg in arg_tuple:
+            if arg.__class__ not in (ListItem, ):
+                raise RelationFirstError()
+
+        removed = getattr(self, '_first_list_items', (None, ))
+        self._first_list_items = arg_tuple
+
+        if self._observers:
+            notify(self, 'first', removed, arg_tuple)
+
+    def get_first(self):
+        """
+        Get all objects related with this object with relation `first`.
+
+        :rtype: set
+        :return: A copy of the collection of objects related with this object.
+        """
+        return copy(getattr(self, '_first_list_items', (None, )))
+
+    def iter_first(self):
+        """
+        Iterate over the objects related with this object with relation
+        `first`.
+
+        Unlike :meth:`get_first` the collection is not copied, so the relation
+        must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_first_list_items', (None, ))
+        return (obj for obj in related if obj is not None)
+
 
 class ListItem(NMLObject):
     """
     An element of an OrderedList.
 
     Is a syntax-dependent object used to represent elements in an OrderedList.
+
+    :param str identifier: Persistent globally unique URI.
     """
 
+    __slots__ = (
+        '_identifier',
+        '_item_links',
+        '_next_list_items',
+    )
+
+    attributes = (
+        'identifier',
+    )
+
+    nml_attributes = OrderedDict([
+        ('id', 'identifier'),
+    ])
+
+    relation_methods = OrderedDict([
+        ('item', 'item'),
+        ('next', 'next'),
+    ])
+
     def __init__(
-            self, **kwargs):
+            self, identifier=None, **kwargs):
         super(ListItem, self).__init__(**kwargs)
 
+        # Attributes
+
+        if identifier is None:
+            identifier = str(id(self))
+        self.identifier = identifier
+
+    @property
+    def identifier(self):
+        """
+        Get attribute identifier.
+
+        :return: Persistent globally unique URI.
+        :rtype: str
+        """
+        return self._identifier
+
+    @identifier.setter
+    def identifier(self, identifier):
+        """
+        Set attribute identifier.
+
+        :param str identifier: Persistent globally unique URI.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        self._identifier = identifier
+
+    @staticmethod
+    def validate_identifier(identifier):
+        """
+        Validate a value of attribute identifier without setting it.
+
+        :param str identifier: Persistent globally unique URI.
+        :return: The value the setter stores for given value.
+        """
+        if identifier is not unset and not is_valid_uri(identifier):
+            raise AttributeIdError()
+        return identifier
+
+    def item(self, link):
+        """
+        Check `item` relation with given `link` object.
+
+        The Network Object in this position of the list.
+
+        :param link: Object to validate relation `item` with.
+        :type link: Link or LinkGroup
+        :return: True if `link` is related to `self` with `item`.
+        :rtype: bool
+        """
+        if link.__class__ not in (
+                Link,
+                LinkGroup, ):
+            raise RelationItemError()
+
+        return link in \
+            getattr(self, '_item_links', (None, ))
+
+    def set_item(self, link):
+        """
+        Set the `item` relation to given objects.
+
+        :param link: Object to set to the `item` relation.
+        :type link: Link or LinkGroup
+        """
+        arg_tuple = (link, )
+
+        for arg in arg_tuple:
+            if arg.__class__ not in (Link, LinkGroup, ):
+                raise RelationItemError()
+
+        removed = getattr(self, '_item_links', (None, ))
+        self._item_links = arg_tuple
+
+        if self._observers:
+            notify(self, 'item', removed, arg_tuple)
+
+    def get_item(self):
+        """
+        Get all objects related with this object with relation `item`.
+
+        :rtype: set
+        :return: A copy of the collection of objects related with this object.
+        """
+        return copy(getattr(self, '_item_links', (None, )))
+
+    def iter_item(self):
+        """
+        Iterate over the objects related with this object with relation `item`.
+
+        Unlike :meth:`get_item` the collection is not copied, so the relation
+        must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_item_links', (None, ))
+        return (obj for obj in related if obj is not None)
+
+    def next(self, list_item):
+        """
+        Check `next` relation with given `list_item` object.
+
+        The following ListItem, if any.
+
+        :param list_item: Object to validate relation `next` with.
+        :type list_item: ListItem
+        :return: True if `list_item` is related to `self` with `next`.
+        :rtype: bool
+        """
+        if list_item.__class__ not in (
+                ListItem, ):
+            raise RelationNextError()
+
+        return list_item in \
+            getattr(self, '_next_list_items', (None, ))
+
+    def set_next(self, list_item):
+        """
+        Set the `next` relation to given objects.
+
+        :param list_item: Object to set to the `next` relation.
+        :type list_item: ListItem
+        """
+        arg_tuple = (list_item, )
+
+        for arg in arg_tuple:
+            if arg.__class__ not in (ListItem, ):
+                raise RelationNextError()
+
+        removed = getattr(self, '_next_list_items', (None, ))
+        self._next_list_items = arg_tuple
+
+        if self._observers:
+            notify(self, 'next', removed, arg_tuple)
+
+    def get_next(self):
+        """
+        Get all objects related with this object with relation `next`.
+
+        :rtype: set
+        :return: A copy of the collection of objects related with this object.
+        """
+        return copy(getattr(self, '_next_list_items', (None, )))
+
+    def iter_next(self):
+        """
+        Iterate over the objects related with this object with relation `next`.
+
+        Unlike :meth:`get_next` the collection is not copied, so the relation
+        must not be modified while iterating.
+
+        :return: An iterator over the objects related with this object.
+        """
+        related = getattr(self, '_next_list_items', (None, ))
+        return (obj for obj in related if obj is not None)
+
 
 __all__ = [
     'NetworkObject',
@@ -79,9 +79,7 @@ NML_SPEC = {
                     'nml_attribute': 'version',
                     'semantic_type': 'timestamp',
                     'type': 'str',
-                    'default': (
-                        'datetime.now().replace(microsecond=0).isoformat()'
-                    ),
+                    'default': 'now()',
                     'default_arg': 'None',
                     'validation': None,  # FIXME
                     'doc': 'Time stamp formatted as ISO 8601'
@@ -276,6 +274,20 @@ NML_SPEC = {
                         'an URI'
                     )
                 },
+                {
+                    'name': 'label_swapping',
+                    'property': False,
+                    'nml_attribute': 'labelSwapping',
+                    'semantic_type': None,
+                    'type': None,
+                    'default': None,
+                    'default_arg': None,
+                    'validation': None,
+                    'doc': (
+                        'If the service can change the label of the data '
+                        'streaming between its inbound and outbound ports'
+                    )
+                },
             ],
             'relations': [
                 {
@@ -477,7 +489,7 @@ NML_SPEC = {
                 },
                 {
                     'name': 'hasLabelGroup',
-                    'with': ['Lifetime'],
+                    'with': ['Label Group'],
                     'cardinality': '1',
                     'doc': 'FIXME: Document hasLabelGroup relation'
                 },
@@ -518,21 +530,24 @@ NML_SPEC = {
                 },
                 {
                     'name': 'hasLabelGroup',
-                    'with': ['Lifetime'],
+                    'with': ['Label Group'],
                     'cardinality': '1',
                     'doc': 'FIXME: Document hasLabelGroup relation'
                 },
                 {
                     'name': 'hasLink',
-                    'with': ['Port', 'Port Group'],
+                    'with': ['Link', 'Link Group'],
                     'cardinality': '+',
                     'doc': 'FIXME: Document hasLink relation'
                 },
                 {
                     'name': 'isSerialCompoundLink',
-                    'with': ['Port', 'Port Group'],
+                    'with': ['Ordered List'],
                     'cardinality': '+',
-                    'doc': 'FIXME: Document isSerialCompoundLink relation'
+                    'doc': (
+                        'The OrderedList of Links or LinkGroups this '
+                        'LinkGroup is the serial concatenation of'
+                    )
                 }
             ]
         },
@@ -705,9 +720,7 @@ NML_SPEC = {
                     'nml_attribute': 'start',
                     'semantic_type': 'timestamp',
                     'type': 'str',
-                    'default': (
-                        'datetime.now().replace(microsecond=0).isoformat()'
-                    ),
+                    'default': 'now()',
                     'default_arg': 'None',
                     'validation': None,  # FIXME Add ISO 8601 validation
                     'doc': (
@@ -722,9 +735,7 @@ NML_SPEC = {
                     'nml_attribute': 'end',
                     'semantic_type': 'timestamp',
                     'type': 'str',
-                    'default': (
-                        'datetime.now().replace(microsecond=0).isoformat()'
-                    ),
+                    'default': 'now()',
                     'default_arg': 'None',
                     'validation': None,  # FIXME Add ISO 8601 validation
                     'doc': (
@@ -748,6 +759,17 @@ NML_SPEC = {
             ),
             'abstract': False,
             'attributes': [
+                {
+                    'name': 'identifier',
+                    'property': True,
+                    'nml_attribute': 'id',
+                    'semantic_type': 'URI',
+                    'type': 'str',
+                    'default': 'str(id(self))',
+                    'default_arg': 'None',
+                    'validation': 'is_valid_uri(%s)',
+                    'doc': 'Persistent globally unique URI'
+                },
                 {
                     'name': 'labeltype',
                     'property': False,
@@ -781,6 +803,17 @@ NML_SPEC = {
             'doc': 'FIXME: Document LabelGroup',
             'abstract': False,
             'attributes': [
+                {
+                    'name': 'identifier',
+                    'property': True,
+                    'nml_attribute': 'id',
+                    'semantic_type': 'URI',
+                    'type': 'str',
+                    'default': 'str(id(self))',
+                    'default_arg': 'None',
+                    'validation': 'is_valid_uri(%s)',
+                    'doc': 'Persistent globally unique URI'
+                },
                 {
                     'name': 'labeltype',
                     'property': False,
@@ -794,14 +827,19 @@ NML_SPEC = {
                 },
                 {
                     'name': 'value',
-                    'property': False,
+                    'property': True,
                     'nml_attribute': 'value',
-                    'semantic_type': None,
-                    'type': None,
-                    'default': None,
-                    'default_arg': None,
+                    'semantic_type': 'interval set',
+                    'type': 'IntervalSet',
+                    'default': 'unset',
+                    'default_arg': 'None',
                     'validation': None,
-                    'doc': 'A specific value taken from a labelset'
+                    'doc': (
+                        'The values taken from a labelset, as a set of '
+                        'intervals. Strings in NML range syntax, like '
+                        '"1-100,200-300", are parsed, other values, like '
+                        'wavelengths, are kept as they are'
+                    )
                 }
             ],
             'relations': [
@@ -817,8 +855,25 @@ NML_SPEC = {
             ),
             'abstract': False,
             'attributes': [
+                {
+                    'name': 'identifier',
+                    'property': True,
+                    'nml_attribute': 'id',
+                    'semantic_type': 'URI',
+                    'type': 'str',
+                    'default': 'str(id(self))',
+                    'default_arg': 'None',
+                    'validation': 'is_valid_uri(%s)',
+                    'doc': 'Persistent globally unique URI'
+                }
             ],
             'relations': [
+                {
+                    'name': 'first',
+                    'with': ['List Item'],
+                    'cardinality': '1',
+                    'doc': 'The first ListItem of this OrderedList'
+                }
             ]
         },
         {
@@ -831,8 +886,31 @@ NML_SPEC = {
             ),
             'abstract': False,
             'attributes': [
+                {
+                    'name': 'identifier',
+                    'property': True,
+                    'nml_attribute': 'id',
+                    'semantic_type': 'URI',
+                    'type': 'str',
+                    'default': 'str(id(self))',
+                    'default_arg': 'None',
+                    'validation': 'is_valid_uri(%s)',
+                    'doc': 'Persistent globally unique URI'
+                }
             ],
             'relations': [
+                {
+                    'name': 'item',
+                    'with': ['Link', 'Link Group'],
+                    'cardinality': '1',
+                    'doc': 'The Network Object in this position of the list'
+                },
+                {
+                    'name': 'next',
+                    'with': ['List Item'],
+                    'cardinality': '1',
+                    'doc': 'The following ListItem, if any'
+                }
             ]
         },
     ]
@@ -849,9 +927,17 @@ NML_TEMPLATE = """\
 {%- endfor %}
 {%- endif %}
 {%- endmacro -%}
+{%- macro collection(rel) -%}
+{%- set relation_collection =  rel.name|variablize + '_' + rel.with.0|pluralize|variablize -%}
+{%- if slots -%}
+getattr(self, '_{{ relation_collection }}', {% if rel.cardinality == '+' %}(){% else %}({{ 'None, ' * rel.cardinality|int }}){% endif %})
+{%- else -%}
+self._{{ relation_collection }}
+{%- endif -%}
+{%- endmacro -%}
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2015 Hewlett Packard Enterprise Development LP
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -874,13 +960,14 @@ from __future__ import unicode_literals, absolute_import
 from __future__ import print_function, division
 
 from copy import copy
-from datetime import datetime
 from collections import OrderedDict
 from abc import ABCMeta, abstractmethod
 from xml.etree import ElementTree as etree  # noqa
 
-from six import add_metaclass
-from rfc3986 import is_valid_uri
+from six import add_metaclass, itervalues, text_type
+from .validators import is_valid_uri
+from .timestamps import now, resolve
+from .intervals import IntervalSet
 
 from .exceptions import (
     {%- for exc in exceptions %}
@@ -898,6 +985,39 @@ for xmlns, uri in NAMESPACES.items():
 unset = type(str('Unset'), (object,), {})()
 
 
+def notify(subject, relation, removed, added):
+    \"""
+    Notify the observers of a change in a relation of a NML object.
+
+    The add_* and set_* methods of the NML objects call this function, only if
+    the object has any observer, after the relation is changed. Observers are
+    the weak references in the ``_observers`` tuple of the object, usually to
+    the managers of the namespaces the object is registered in, and are
+    notified by calling their ``relation_changed`` method with the same
+    arguments.
+
+    :param NMLObject subject: Object whose relation changed.
+    :param str relation: Name of the relation, for example ``hasInboundPort``.
+    :param tuple removed: Objects no longer related. It may contain `None`
+     for the unset positions of a relation with fixed cardinality.
+    :param tuple added: Objects related.
+    \"""
+    alive = True
+    for reference in subject._observers:
+        observer = reference()
+        if observer is None:
+            alive = False
+        else:
+            observer.relation_changed(subject, relation, removed, added)
+
+    # Forget the observers already collected
+    if not alive:
+        subject._observers = tuple(
+            reference for reference in subject._observers
+            if reference() is not None
+        )
+
+
 @add_metaclass(ABCMeta)
 class NMLObject(object):
     \"""
@@ -907,11 +1027,87 @@ class NMLObject(object):
     (see GRASP) of refactored functionality of all objects.
     \"""
 
+{%- if slots %}
+
+    __slots__ = ('_metadata', '_observers')
+    {%- endif %}
+
+    attributes = ()
+    nml_attributes = OrderedDict()
+    relation_methods = OrderedDict()
+
     @abstractmethod
     def __init__(self, **kwargs):
-        self.attributes = []
-        self.relations = OrderedDict()
+        self._initialize()
+        {%- if slots %}
+        if kwargs:
+            self._metadata = kwargs
+
+    @property
+    def metadata(self):
+        \"""
+        Get all kwargs passed to the constructor.
+
+        The dictionary is created the first time it is needed.
+
+        :rtype: dict
+        \"""
+        try:
+            return self._metadata
+        except AttributeError:
+            self._metadata = {}
+            return self._metadata
+
+    @metadata.setter
+    def metadata(self, metadata):
+        \"""
+        Set all kwargs passed to the constructor.
+
+        :param dict metadata: Metadata of this object.
+        \"""
+        self._metadata = metadata
+        {%- else %}
         self.metadata = kwargs
+        {%- endif %}
+
+    def _initialize(self):
+        \"""
+        Initialize an object without attributes, metadata or relations.
+
+        Called by the constructor, and by the managers that build objects
+        without calling it, see :meth:`pynml.manager.NMLManager.bulk_create`.
+        \"""
+        self._observers = ()
+        {%- if not slots %}
+        self.metadata = {}
+        {%- endif %}
+
+    @property
+    def relations(self):
+        \"""
+        Get the getter of every relation of this object.
+
+        :rtype: :py:class:`OrderedDict`
+        :return: The methods to get the objects related with this object,
+         by relation name.
+        \"""
+        return OrderedDict(
+            (relname, getattr(self, 'get_' + suffix))
+            for relname, suffix in self.relation_methods.items()
+        )
+
+    def iter_relations(self):
+        \"""
+        Iterate over the relations of this object.
+
+        Related objects are iterated without copying the relation collections,
+        so relations must not be modified while iterating.
+
+        :return: An iterator of tuples of the form (relation name, iterator
+         over the objects related with this object with that relation).
+        \"""
+        for relname, suffix in self.relation_methods.items():
+            yield relname, getattr(self, 'iter_' + suffix)()
 
     def _describe_object(self):
         \"""
@@ -923,7 +1119,7 @@ class NMLObject(object):
         name = self.__class__.__name__
         attributes = [
             (attr, getattr(self, attr))
-            for attr in self.attributes + ['metadata']
+            for attr in self.attributes + ('metadata', )
             if hasattr(self, attr)
         ]
         formatted_attributes = ', '.join([
@@ -964,32 +1160,24 @@ class NMLObject(object):
         \"""
         this = self._tree_element(this, parent)
 
-        # Attributes
+        # Attributes, sets of labels in range syntax like 1-100,200-300
         for attr_name in self.attributes:
             attr = getattr(self, attr_name)
-            if attr is not unset:
-                this.attrib[attr_name] = attr
+            if attr is not unset and attr is not None:
+                this.attrib[attr_name] = text_type(attr)
 
         # Relations
-        for relname, relgetter in self.relations.items():
-
-            # Composition elements are tuples
-            # Aggregation elements are OrderedDict
-            associated = relgetter()
-            if isinstance(associated, OrderedDict):
-                associated = associated.values()
-
-            # Ignore empty relations
-            if not associated or not all(associated):
-                continue
-
-            # Create subelement
-            relation = etree.SubElement(
-                this, 'Relation',
-                type='{}#{}'.format(NAMESPACES['nml'], relname)
-            )
+        for relname, associated in self.iter_relations():
+
+            # Create subelement only for non empty relations
+            relation = None
 
             for associated in associated:
+                if relation is None:
+                    relation = etree.SubElement(
+                        this, 'Relation',
+                        type='{}#{}'.format(NAMESPACES['nml'], relname)
+                    )
                 etree.SubElement(
                     relation, associated.__class__.__name__,
                     id=associated.identifier
@@ -1014,6 +1202,37 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
     {{ ':param %s %s: %s.'|format(attr.type, attr.name, attr.doc)|wordwrap(75)|indent(5) }}
     {% endfor -%}
     \"""
+    {%- set cls_layout = layout[cls.name] %}
+    {%- if slots %}
+
+    __slots__ = ({% if cls_layout.slots %}
+    {%- for slot in cls_layout.slots %}
+        '{{ slot }}',
+    {%- endfor %}
+    {% endif %})
+    {%- endif %}
+    {%- if cls.attributes %}
+
+    attributes = (
+    {%- for attr in cls_layout.attributes %}
+        '{{ attr }}',
+    {%- endfor %}
+    )
+
+    nml_attributes = OrderedDict([
+    {%- for nml_attribute, attr in cls_layout.nml_attributes %}
+        ('{{ nml_attribute }}', '{{ attr }}'),
+    {%- endfor %}
+    ])
+    {%- endif %}
+    {%- if cls.relations %}
+
+    relation_methods = OrderedDict([
+    {%- for relname, suffix in cls_layout.relations %}
+        ('{{ relname }}', '{{ suffix }}'),
+    {%- endfor %}
+    ])
+    {%- endif %}
 {##}
     {%- if cls.abstract %}
     @abstractmethod
@@ -1026,8 +1245,7 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
         # Attributes
         {%- endif -%}
         {%- for attr in cls.attributes %}
-
-        self.attributes.append('{{ attr.name }}')
+{##}
         {%- if attr.property %}
         if {{ attr.name }} is {{ attr.default_arg }}:
             {{ attr.name }} = {{ attr.default }}
@@ -1036,13 +1254,16 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
         self.{{ attr.name }} = {{ attr.name }}
         {%- endif %}
         {%- endfor %}
-        {%- if cls.relations %}
-{##}
+    {%- if cls.relations and not slots %}
+
+    def _initialize(self):
+        \"""
+        Initialize an object with empty relations.
+        \"""
+        super({{ cls.name|objectize }}, self)._initialize()
+
         # Relations
-        {%- endif -%}
         {%- for rel in cls.relations %}
-        self.relations['{{ rel.name }}'] = \\
-            self.get_{{ rel.name|methodize }}
         {%- set relation_collection =  rel.name|variablize + '_' + rel.with.0|pluralize|variablize %}
         self._{{ relation_collection }} = {##}
         {%- if rel.cardinality == '+' -%}
@@ -1051,6 +1272,7 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
         ({{ 'None, ' * rel.cardinality|int }})
         {%- endif %}
         {%- endfor %}
+    {%- endif %}
     {%- for attr in cls.attributes %}
     {%- if attr.property %}
 
@@ -1062,7 +1284,11 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
         {{ ':return: %s.'|format(attr.doc)|wordwrap(71)|indent(9) }}
         :rtype: {{ attr.type }}
         \"""
+        {%- if attr.semantic_type == 'timestamp' %}
+        return resolve(self._{{ attr.name }})
+        {%- else %}
         return self._{{ attr.name }}
+        {%- endif %}
 
     @{{ attr.name }}.setter
     def {{ attr.name }}(self, {{ attr.name }}):
@@ -1071,6 +1297,10 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
 
         {{ ':param %s %s: %s.'|format(attr.type, attr.name, attr.doc)|wordwrap(71)|indent(9) }}
         \"""
+        {%- if attr.semantic_type == 'interval set' %}
+        if {{ attr.name }} is not unset:
+            {{ attr.name }} = IntervalSet.coerce({{ attr.name }})
+        {%- endif %}
         {%- if attr.validation is not none %}
         if {{ attr.name }} is not unset and not {{ attr.validation|format(attr.name) }}:
             raise Attribute{{ attr.nml_attribute|objectize }}Error()
@@ -1078,6 +1308,24 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
         {%- else %}
         self._{{ attr.name }} = {{ attr.name }}
         {%- endif %}
+
+    @staticmethod
+    def validate_{{ attr.name }}({{ attr.name }}):
+        \"""
+        Validate a value of attribute {{ attr.name }} without setting it.
+
+        {{ ':param %s %s: %s.'|format(attr.type, attr.name, attr.doc)|wordwrap(71)|indent(9) }}
+        :return: The value the setter stores for given value.
+        \"""
+        {%- if attr.semantic_type == 'interval set' %}
+        if {{ attr.name }} is not unset:
+            {{ attr.name }} = IntervalSet.coerce({{ attr.name }})
+        {%- endif %}
+        {%- if attr.validation is not none %}
+        if {{ attr.name }} is not unset and not {{ attr.validation|format(attr.name) }}:
+            raise Attribute{{ attr.nml_attribute|objectize }}Error()
+        {%- endif %}
+        return {{ attr.name }}
     {%- endif -%}
     {%- endfor -%}
     {%- for rel in cls.relations %}
@@ -1103,12 +1351,12 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
 
         return {{ argument }}
         {%- if rel.cardinality == '+' %}.identifier{% endif %} in \\
-            self._{{ relation_collection }}
+            {{ collection(rel) }}
     {%- if rel.cardinality == '+' %}
 
     def add_{{ rel.name|variablize }}(self, {{ argument }}):
         \"""
-        Add given `{{ argument }}` to this object `{{ rel.name }}` relations.
+        {{ 'Add given `%s` to this object `%s` relations.'|format(argument, rel.name)|wordwrap(71)|indent(8) }}
 
         {{ ':param %s: Object to add to the `%s` relation.'|format(argument, rel.name)|wordwrap(71)|indent(9) }}
         :type {{ argument }}: {{ rel.with|map('objectize')|join(' or ') }}
@@ -1118,9 +1366,29 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
                 {{ with|objectize }}{% if not loop.last %},{% endif %}
             {%- endfor %}, ):
             raise Relation{{ rel.name|objectize }}Error()
-
+{##}
+        {%- if slots %}
+        try:
+            related = self._{{ relation_collection }}
+        except AttributeError:
+            {%- if relation_collection|length > 35 %}
+            related = OrderedDict()
+            self._{{ relation_collection }} = related
+            {%- else %}
+            related = self._{{ relation_collection }} = OrderedDict()
+            {%- endif %}
+        related[{{ argument }}.identifier] = {{ argument }}
+        {%- elif (relation_collection + argument)|length > 48 %}
+        self._{{ relation_collection }}[
+            {{ argument }}.identifier
+        ] = {{ argument }}
+        {%- else %}
         self._{{ relation_collection }}[{{ argument }}.identifier] = \\
             {{ argument }}
+        {%- endif %}
+
+        if self._observers:
+            notify(self, '{{ rel.name }}', (), ({{ argument }}, ))
     {%- else %}
     {%- if rel.cardinality|int > 1 %}
     {%- set arguments = argument + range(1, rel.cardinality|int + 1)|join(', ' + argument) %}
@@ -1153,7 +1421,11 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
             raise Exception('Non unique objects')  # FIXME
         {%- endif %}
 
+        removed = {{ collection(rel) }}
         self._{{ relation_collection }} = arg_tuple
+
+        if self._observers:
+            notify(self, '{{ rel.name }}', removed, arg_tuple)
     {%- endif %}
 {##}
     def get_{{ rel.name|methodize }}(self):
@@ -1163,7 +1435,34 @@ class {{ cls.name|objectize }}({{ cls.parent|objectize|default('NMLObject', True
         :rtype: {% if rel.cardinality == '+' %}:py:class:`OrderedDict`{% else %}set{% endif %}
         :return: A copy of the collection of objects related with this object.
         \"""
-        return copy(self._{{ relation_collection }})
+        {%- if slots and rel.cardinality == '+' %}
+        return OrderedDict(
+            {{ collection(rel) }}
+        )
+        {%- else %}
+        return copy({{ collection(rel) }})
+        {%- endif %}
+
+    def iter_{{ rel.name|methodize }}(self):
+        \"""
+        {{ 'Iterate over the objects related with this object with relation `%s`.'|format(rel.name)|wordwrap(71)|indent(8) }}
+
+        {{ 'Unlike :meth:`get_%s` the collection is not copied, so the relation must not be modified while iterating.'|format(rel.name|methodize)|wordwrap(71)|indent(8) }}
+
+        :return: An iterator over the objects related with this object.
+        \"""
+        {%- if rel.cardinality == '+' %}
+        {%- if slots %}
+        return itervalues(
+            getattr(self, '_{{ relation_collection }}', {})
+        )
+        {%- else %}
+        return itervalues(self._{{ relation_collection }})
+        {%- endif %}
+        {%- else %}
+        related = {{ collection(rel) }}
+        return (obj for obj in related if obj is not None)
+        {%- endif %}
     {%- endfor %}
 
 
@@ -1180,7 +1479,7 @@ __all__ = [
 EXCEPTIONS_TEMPLATE = """\
 # -*- coding: utf-8 -*-
 #
-# Copyright (C) 2015 Hewlett Packard Enterprise Development LP
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
 #
 # Licensed under the Apache License, Version 2.0 (the "License");
 # you may not use this file except in compliance with the License.
@@ -1255,9 +1554,82 @@ def filter_pluralize(token):
     return pluralize(token)
 
 
-def build():
+def layout(spec):
     """
-    Build NML Python module from specification.
+    Compute the memory layout of the classes of the NML specification.
+
+    :param dict spec: NML specification to compute the layout for.
+    :rtype: dict
+    :return: A dictionary mapping each class name to a dictionary with the
+     ``slots`` that the class adds to its parent, and all the
+     ``attributes``, ``nml_attributes`` (as a list of tuples with the NML XML
+     name and the name of each attribute) and ``relations`` (as a list of
+     tuples with the relation name and the suffix of its methods) of the
+     class, including the ones inherited.
+    """
+    classes = OrderedDict(
+        (cls['name'], cls) for cls in spec['classes']
+    )
+    layouts = {}
+
+    def compute(cls):
+        if cls['name'] in layouts:
+            return layouts[cls['name']]
+
+        if cls['parent'] is None:
+            parent = {
+                'slots': [], 'attributes': [], 'nml_attributes': [],
+                'relations': []
+            }
+            inherited = ['_metadata']
+        else:
+            parent = compute(classes[cls['parent']])
+            inherited = parent['inherited']
+
+        slots = []
+        attributes = list(parent['attributes'])
+        nml_attributes = OrderedDict(parent['nml_attributes'])
+        for attr in cls['attributes']:
+            slot = '_' + attr['name'] if attr['property'] else attr['name']
+            if slot not in inherited:
+                slots.append(slot)
+            if attr['name'] not in attributes:
+                attributes.append(attr['name'])
+            nml_attributes[attr['nml_attribute']] = attr['name']
+
+        relations = OrderedDict(parent['relations'])
+        for rel in cls['relations']:
+            slot = '_{}_{}'.format(
+                filter_variablize(rel['name']),
+                filter_variablize(filter_pluralize(rel['with'][0]))
+            )
+            if slot not in inherited and slot not in slots:
+                slots.append(slot)
+            relations[rel['name']] = filter_methodize(rel['name'])
+
+        layouts[cls['name']] = {
+            'slots': slots,
+            'attributes': attributes,
+            'nml_attributes': list(nml_attributes.items()),
+            'relations': list(relations.items()),
+            'inherited': inherited + slots
+        }
+        return layouts[cls['name']]
+
+    for cls in classes.values():
+        compute(cls)
+    return layouts
+
+
+def render(slots=True):
+    """
+    Render NML Python modules from specification.
+
+    :param bool slots: Render classes that use ``__slots__``, class level
+     attribute and relation tables and relation collections created on
+     first use, instead of classes that store all of them per instance.
+    :rtype: :py:class:`OrderedDict`
+    :return: The source code of the rendered modules, by module name.
     """
     # Gather data
     exceptions = OrderedDict()
@@ -1305,18 +1677,29 @@ def build():
     for ftr in ['objectize', 'methodize', 'variablize', 'pluralize']:
         env.filters[ftr] = globals()['filter_' + ftr]
 
+    # Render templates
+    rendered = OrderedDict()
     for tpl in ['nml', 'exceptions']:
-
-        # Render template
         template = env.get_template(tpl)
-        rendered = template.render(
+        rendered[tpl] = template.render(
             spec=NML_SPEC,
-            exceptions=exceptions
+            exceptions=exceptions,
+            layout=layout(NML_SPEC),
+            slots=slots
         )
+    return rendered
+
+
+def build(slots=True):
+    """
+    Build NML Python module from specification.
 
-        # Write output
-        root = dirname(normpath(abspath(__file__)))
+    :param bool slots: Build classes that use ``__slots__``. See
+     :func:`render`.
+    """
+    root = dirname(normpath(abspath(__file__)))
 
+    for tpl, rendered in render(slots=slots).items():
         with open(join(root, '{}.py'.format(tpl)), 'w') as module:
             module.write(rendered)
 
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Default timestamps for the attributes of the NML objects.
+
+NML objects created without an explicit timestamp, like the ``version`` of a
+:class:`pynml.nml.NetworkObject`, share a lazy :class:`Timestamp` with all
+the objects created in the same second. The timestamp is formatted as an ISO
+8601 string only once, when it's first read.
+
+A timestamp can also be pinned for all the objects created in a batch using
+the :func:`pinned` context manager.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from time import time
+from datetime import datetime
+from contextlib import contextmanager
+
+
+class Timestamp(object):
+    """
+    Timestamp with a resolution of seconds, formatted on first use.
+
+    :param int seconds: Seconds since the epoch.
+    """
+
+    __slots__ = ('seconds', '_isoformat')
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def isoformat(self):
+        """
+        Format this timestamp.
+
+        :rtype: str
+        :return: This timestamp in local time formatted as ISO 8601.
+        """
+        try:
+            return self._isoformat
+        except AttributeError:
+            self._isoformat = datetime.fromtimestamp(self.seconds).isoformat()
+            return self._isoformat
+
+    def __repr__(self):
+        return 'Timestamp({})'.format(self.seconds)
+
+
+_last = [Timestamp(0)]
+_pinned = []
+
+
+def now():
+    """
+    Get the default timestamp for new objects.
+
+    :rtype: :class:`Timestamp` or str
+    :return: The pinned timestamp if any, or the current time.
+    """
+    if _pinned:
+        return _pinned[-1]
+
+    seconds = int(time())
+    last = _last[0]
+    if last.seconds != seconds:
+        last = _last[0] = Timestamp(seconds)
+    return last
+
+
+def resolve(timestamp):
+    """
+    Get the value of a timestamp attribute.
+
+    :param timestamp: Value of the attribute.
+    :return: The ISO 8601 string of given :class:`Timestamp`, or the value as
+     is for any other type.
+    """
+    if timestamp.__class__ is Timestamp:
+        return timestamp.isoformat()
+    return timestamp
+
+
+def create(value=None):
+    """
+    Get a timestamp to use as default for new objects.
+
+    :param value: Timestamp, as an ISO 8601 string or a
+     :py:class:`datetime.datetime`. If `None`, the current time is used.
+    :return: A :class:`Timestamp` for the current time, or the ISO 8601
+     string of given value.
+    """
+    if value is None:
+        return Timestamp(int(time()))
+    if isinstance(value, datetime):
+        return value.replace(microsecond=0).isoformat()
+    return value
+
+
+@contextmanager
+def pinned(timestamp=None):
+    """
+    Context manager that pins the default timestamp of new objects.
+
+    ::
+
+        with pinned() as timestamp:
+            nodes = [Node() for i in range(1000)]
+
+    Contexts can be nested. This state is global to all threads, see
+    :meth:`pynml.manager.NMLManager.pinned_timestamp` to pin the timestamp of
+    the objects built by a single manager.
+
+    :param timestamp: Timestamp to pin, as an ISO 8601 string or a
+     :py:class:`datetime.datetime`. If `None`, the current time is used.
+    :return: The pinned timestamp.
+    """
+    timestamp = create(timestamp)
+    _pinned.append(timestamp)
+    try:
+        yield timestamp
+    finally:
+        _pinned.pop()
+
+
+__all__ = ['Timestamp', 'now', 'create', 'resolve', 'pinned']
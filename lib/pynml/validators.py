@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Validators for the attributes of the NML objects.
+
+URIs are validated using a precompiled matcher for the common forms, like
+``urn:ogf:network:example.net:2013:port1`` or relative references like
+``sw1p1``, falling back to :func:`rfc3986.is_valid_uri` for anything else.
+Results are stored in a bounded LRU cache and the prefixes of the valid URIs
+(up to their last ``:``) are remembered, so URIs sharing a known prefix only
+need their last segment to be checked.
+
+Loaders that already validated a whole document can skip the validation
+using the :func:`trusted` context manager.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from re import compile as regex
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from six import string_types
+from rfc3986 import is_valid_uri as rfc3986_is_valid_uri
+
+
+CACHE_SIZE = 4096
+"""
+Maximum number of values stored in the cache of validated URIs.
+"""
+
+PREFIXES_SIZE = 64
+"""
+Maximum number of URI prefixes stored in the cache of valid prefixes.
+"""
+
+
+# Characters allowed in a path segment, as percent-encoded octets or in plain
+PCHAR = r"(?:[A-Za-z0-9._~!$&'()*+,;=:@-]|%[0-9A-Fa-f]{2})"
+SEGMENT_NC = r"(?:[A-Za-z0-9._~!$&'()*+,;=@-]|%[0-9A-Fa-f]{2})"
+QUERY = r'(?:\?(?:{pchar}|[/?])*)?(?:#(?:{pchar}|[/?])*)?'.format(
+    pchar=PCHAR
+)
+
+# URIs without authority, with a scheme or a relative path
+URI_RE = regex(
+    r'^(?:'
+    r'[A-Za-z][A-Za-z0-9+.-]*:(?!//)(?:{pchar}|/)*'
+    r'|'
+    r'(?!//){segment}*(?:/(?:{pchar}|/)*)?'
+    r'){query}$'.format(pchar=PCHAR, segment=SEGMENT_NC, query=QUERY)
+)
+
+# Last segment of an URI whose prefix is known to be valid
+SUFFIX = r'(?!//)(?:{pchar}|/)*{query}'.format(pchar=PCHAR, query=QUERY)
+SUFFIX_RE = regex(r'^{suffix}$'.format(suffix=SUFFIX))
+
+# Last segments of many URIs, one per line, and a faster matcher for the
+# common case of segments made only of plain characters
+SUFFIXES_RE = regex(r'{suffix}(?:\n{suffix})*\Z'.format(suffix=SUFFIX))
+PLAIN_SUFFIXES_RE = regex(r"[A-Za-z0-9._~!$&'()*+,;=@\n-]*\Z")
+
+
+# Prefixes are only remembered up to the path
+PREFIX_STOP = frozenset('/?#')
+
+
+_cache = OrderedDict()
+_prefixes = OrderedDict()
+_trusted = [0]
+
+
+def _validate(uri):
+    """
+    Validate an URI that is not in the cache.
+
+    :param str uri: URI to validate.
+    :rtype: bool
+    :return: True if the URI is valid, False otherwise.
+    """
+    prefix, separator, suffix = uri.rpartition(':')
+
+    if separator and prefix in _prefixes:
+        if SUFFIX_RE.match(suffix) is not None:
+            return True
+
+    elif URI_RE.match(uri) is not None:
+        if separator and not PREFIX_STOP.intersection(prefix):
+            if len(_prefixes) >= PREFIXES_SIZE:
+                _prefixes.popitem(last=False)
+            _prefixes[prefix] = True
+        return True
+
+    return rfc3986_is_valid_uri(uri)
+
+
+def is_valid_uri(uri):
+    """
+    Check if given value is a valid URI, as :func:`rfc3986.is_valid_uri` does.
+
+    :param str uri: URI to validate.
+    :rtype: bool
+    :return: True if the URI is valid or if the validation is disabled by
+     :func:`trusted`, False otherwise.
+    """
+    if _trusted[0]:
+        return True
+
+    if not isinstance(uri, string_types):
+        return rfc3986_is_valid_uri(uri)
+
+    try:
+        valid = _cache.pop(uri)
+    except KeyError:
+        valid = _validate(uri)
+        if len(_cache) >= CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    _cache[uri] = valid
+    return valid
+
+
+def all_valid_uris(uris):
+    """
+    Check if all the given values are valid URIs.
+
+    URIs sharing a known valid prefix are checked all at once, matching
+    their last segments joined by newlines, which can't be part of an URI.
+    The rest are checked one by one, as :func:`is_valid_uri` does.
+
+    :param uris: URIs to validate.
+    :rtype: bool
+    :return: True if all the URIs are valid or if the validation is disabled
+     by :func:`trusted`, False otherwise.
+    """
+    if _trusted[0]:
+        return True
+
+    suffixes = OrderedDict()
+    for uri in uris:
+        if not isinstance(uri, string_types):
+            return False
+        prefix, separator, suffix = uri.rpartition(':')
+        if not separator:
+            prefix = None
+        if prefix not in suffixes:
+            suffixes[prefix] = []
+        suffixes[prefix].append((uri, suffix))
+
+    for prefix, group in suffixes.items():
+        # The first URI makes its prefix known, if it's valid
+        if not is_valid_uri(group[0][0]):
+            return False
+
+        # A newline inside a suffix would split it in two
+        if prefix in _prefixes:
+            joined = '\n'.join(suffix for uri, suffix in group)
+            if joined.count('\n') == len(group) - 1 and (
+                    PLAIN_SUFFIXES_RE.match(joined) is not None or
+                    SUFFIXES_RE.match(joined) is not None):
+                continue
+
+        # Otherwise, or for the URIs matching none of the common forms,
+        # check them one by one
+        if not all(is_valid_uri(uri) for uri, suffix in group):
+            return False
+
+    return True
+
+
+def clear_cache():
+    """
+    Forget all the URIs and prefixes validated so far.
+    """
+    _cache.clear()
+    _prefixes.clear()
+
+
+@contextmanager
+def trusted():
+    """
+    Context manager that disables the validation of URIs.
+
+    Use it only for input that has already been validated, for example::
+
+        with trusted():
+            port = Port(identifier=identifier)
+
+    Contexts can be nested. This state is global to all threads.
+    """
+    _trusted[0] += 1
+    try:
+        yield
+    finally:
+        _trusted[0] -= 1
+
+
+__all__ = ['is_valid_uri', 'all_valid_uris', 'clear_cache', 'trusted']
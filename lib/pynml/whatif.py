@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Failure impact (what-if) analysis.
+
+A :class:`WhatIf` engine is built from a :class:`pynml.graph.CompiledGraph`
+and answers, for a set of failed nodes, ports or links, which pairs of nodes
+lose connectivity and which ones get longer paths. The namespace is never
+modified nor copied: failures are only masks over the arcs of the engine.
+
+The engine also finds the bridges and the articulation points of the
+topology, the single points of failure, in a single depth first search.
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from array import array
+from collections import deque
+from multiprocessing import Pool, cpu_count
+
+from .graph import TYPECODE
+
+
+class Impact(object):
+    """
+    Impact of a set of failures.
+
+    Pairs with a failed node are not included.
+
+    :var list disconnected: The (source, target) identifiers of the pairs of
+     nodes that lose connectivity.
+    :var list stretched: The (source, target, before, after) of the pairs of
+     nodes that are still connected but through more links, with the number
+     of links of the shortest path before and after the failures.
+    """
+
+    __slots__ = ('disconnected', 'stretched')
+
+    def __init__(self, disconnected=None, stretched=None):
+        self.disconnected = disconnected or []
+        self.stretched = stretched or []
+
+    def __bool__(self):
+        return bool(self.disconnected or self.stretched)
+
+    __nonzero__ = __bool__
+
+    def __repr__(self):
+        return 'Impact(disconnected={}, stretched={})'.format(
+            len(self.disconnected), len(self.stretched)
+        )
+
+
+class WhatIf(object):
+    """
+    What-if engine over the nodes of a compiled graph.
+
+    Nodes are joined by arcs, one for each pair of ports linked from an
+    outbound port of a node to an inbound port of another, following the
+    direction of the links. An arc fails when all its links, one of its
+    ports, or one of its nodes fail.
+
+    The shortest path tree from each source node is computed once, the
+    first time it's needed, so each set of failures only searches again
+    from the sources whose tree goes through a failed node, or through a
+    failed arc that can't be bypassed by a path of the same length.
+
+    :param graph: The compiled graph of the namespace.
+    :type graph: :class:`pynml.graph.CompiledGraph`
+    :param sources: Identifiers of the nodes whose paths are evaluated. If
+     `None`, the paths from all nodes are evaluated.
+    """
+
+    def __init__(self, graph, sources=None):
+        node_count = graph.node_count
+        offsets = graph.offsets
+        targets = graph.targets
+        link_offsets = graph.link_offsets
+
+        self.identifiers = graph.identifiers[:node_count]
+
+        # Arcs between nodes, by source node
+        self._offsets = array(TYPECODE, [0])
+        self._heads = array(TYPECODE)
+        self._tails = array(TYPECODE)
+        self._link_counts = array(TYPECODE)
+
+        # Arcs through each port and link, and reaching each node
+        self._port_arcs = {}
+        self._link_arcs = {}
+        self._incoming = {}
+
+        for identifier in graph.identifiers[node_count:]:
+            self._port_arcs[identifier] = []
+        for identifier in graph.link_identifiers:
+            self._link_arcs[identifier] = []
+
+        for node in range(node_count):
+            for port in targets[offsets[node]:offsets[node + 1]]:
+                for edge in range(offsets[port], offsets[port + 1]):
+                    first, last = link_offsets[edge], link_offsets[edge + 1]
+                    if first == last:
+                        continue
+
+                    sink = targets[edge]
+                    for head in targets[offsets[sink]:offsets[sink + 1]]:
+                        if head >= node_count:
+                            continue
+
+                        arc = len(self._heads)
+                        self._heads.append(head)
+                        self._tails.append(node)
+                        self._link_counts.append(last - first)
+
+                        for vertex in (port, sink):
+                            identifier = graph.identifiers[vertex]
+                            self._port_arcs[identifier].append(arc)
+                        for link in graph.links[first:last]:
+                            identifier = graph.link_identifiers[link]
+                            self._link_arcs[identifier].append(arc)
+                        self._incoming.setdefault(head, []).append(arc)
+
+            self._offsets.append(len(self._heads))
+
+        self._nodes = dict(
+            (identifier, node) for node, identifier in
+            enumerate(self.identifiers)
+        )
+        if sources is None:
+            self._sources = list(range(node_count))
+        else:
+            self._sources = [self._node(source) for source in sources]
+
+        self._distances = None
+        self._users = None
+        self._biconnectivity = None
+
+    def _node(self, node):
+        identifier = getattr(node, 'identifier', node)
+        try:
+            return self._nodes[identifier]
+        except KeyError:
+            raise Exception('Unknown node {}'.format(identifier))
+
+    def _search(self, source, dead_nodes=(), dead_arcs=()):
+        """
+        Breadth first search of the shortest paths from a node.
+
+        :return: A tuple (distances, arcs) with the number of arcs to each
+         node, or ``-1`` if not reachable, and the arc reaching each node in
+         the shortest path tree, or ``-1``.
+        """
+        offsets = self._offsets
+        heads = self._heads
+
+        distances = array(TYPECODE, [-1]) * len(self.identifiers)
+        arcs = array(TYPECODE, [-1]) * len(self.identifiers)
+        distances[source] = 0
+
+        pending = deque([source])
+        while pending:
+            node = pending.popleft()
+            distance = distances[node] + 1
+            for arc in range(offsets[node], offsets[node + 1]):
+                head = heads[arc]
+                if distances[head] != -1 or head in dead_nodes or \
+                        arc in dead_arcs:
+                    continue
+                distances[head] = distance
+                arcs[head] = arc
+                pending.append(head)
+
+        return distances, arcs
+
+    def baseline(self):
+        """
+        Compute the shortest paths from each source before any failure.
+
+        It's done automatically the first time it's needed.
+
+        :rtype: list
+        :return: The number of links to each node, or ``-1`` if not
+         reachable, from each source.
+        """
+        if self._distances is None:
+            self._distances = []
+            self._users = [array(TYPECODE) for arc in self._heads]
+
+            for index, source in enumerate(self._sources):
+                distances, arcs = self._search(source)
+                self._distances.append(distances)
+                for arc in arcs:
+                    if arc != -1:
+                        self._users[arc].append(index)
+
+        return self._distances
+
+    def _failures(self, failures):
+        """
+        Get the failed nodes and arcs of a set of failures.
+
+        :param failures: Failed nodes, ports and links, or their identifiers.
+        :rtype: tuple
+        :return: A tuple (nodes, arcs) of sets.
+        """
+        dead_nodes = set()
+        dead_arcs = set()
+        failed_links = {}
+
+        for identifier in set(
+                getattr(failure, 'identifier', failure)
+                for failure in failures):
+
+            if identifier in self._nodes:
+                dead_nodes.add(self._nodes[identifier])
+
+            elif identifier in self._port_arcs:
+                dead_arcs.update(self._port_arcs[identifier])
+
+            elif identifier in self._link_arcs:
+                # Arcs fail once all their parallel links fail
+                for arc in self._link_arcs[identifier]:
+                    failed_links[arc] = failed_links.get(arc, 0) + 1
+                    if failed_links[arc] == self._link_counts[arc]:
+                        dead_arcs.add(arc)
+
+            else:
+                raise Exception('Unknown failure {}'.format(identifier))
+
+        return dead_nodes, dead_arcs
+
+    def _bypassed(self, distances, arcs, dead_nodes, dead_arcs):
+        """
+        Check if the failed arcs of a shortest path tree can be bypassed
+        without making any path longer.
+
+        The failed arcs are checked from the closest to the source. The head
+        of each one must be reached by another arc, alive, from a node one
+        link closer to the source. As all the failed arcs closer to the
+        source have been bypassed, the distance to that node is preserved.
+
+        :param distances: Distances from the source before the failures.
+        :param list arcs: The failed arcs of the tree of the source.
+        :rtype: bool
+        :return: True if the distances from the source are preserved.
+        """
+        heads = self._heads
+        tails = self._tails
+
+        for arc in sorted(arcs, key=lambda arc: distances[heads[arc]]):
+            head = heads[arc]
+            distance = distances[head] - 1
+
+            for other in self._incoming[head]:
+                if distances[tails[other]] == distance and \
+                        other not in dead_arcs and \
+                        tails[other] not in dead_nodes:
+                    break
+            else:
+                return False
+
+        return True
+
+    def evaluate(self, failures):
+        """
+        Evaluate the impact of a set of simultaneous failures.
+
+        :param failures: Failed nodes, ports and links, or their identifiers.
+        :rtype: Impact
+        """
+        distances = self.baseline()
+        dead_nodes, dead_arcs = self._failures(failures)
+
+        # Sources whose shortest path tree goes through a failure
+        trees = {}
+        for arc in dead_arcs:
+            for index in self._users[arc]:
+                trees.setdefault(index, []).append(arc)
+
+        affected = set(
+            index for index, arcs in trees.items()
+            if not self._bypassed(
+                distances[index], arcs, dead_nodes, dead_arcs
+            )
+        )
+        for node in dead_nodes:
+            for arc in self._incoming.get(node, ()):
+                affected.update(self._users[arc])
+
+        impact = Impact()
+        identifiers = self.identifiers
+
+        for index in sorted(affected):
+            source = self._sources[index]
+            if source in dead_nodes:
+                continue
+
+            before = distances[index]
+            after = self._search(source, dead_nodes, dead_arcs)[0]
+            if after == before:
+                continue
+
+            for target, distance in enumerate(before):
+                if distance <= 0 or target in dead_nodes or \
+                        after[target] == distance:
+                    continue
+                if after[target] == -1:
+                    impact.disconnected.append(
+                        (identifiers[source], identifiers[target])
+                    )
+                else:
+                    impact.stretched.append((
+                        identifiers[source], identifiers[target],
+                        distance, after[target]
+                    ))
+
+        return impact
+
+    def evaluate_many(self, scenarios, workers=None):
+        """
+        Evaluate the impact of many independent sets of failures.
+
+        The scenarios are evaluated by a pool of `workers` processes. The
+        shortest paths before the failures are computed once, before
+        starting the processes.
+
+        :param list scenarios: The failures of each scenario, see
+         :meth:`evaluate`.
+        :param int workers: Number of processes to use. If `None`, the number
+         of CPUs is used. If 1, the scenarios are evaluated in this process.
+        :return: An iterator over the :class:`Impact` of each scenario, in
+         the same order. The pool is started when the first impact is
+         requested and stopped once all the impacts are yielded, or when the
+         iterator is closed, so close it if it's not consumed until the end.
+        """
+        scenarios = [
+            [getattr(failure, 'identifier', failure) for failure in failures]
+            for failures in scenarios
+        ]
+        self.baseline()
+
+        if workers is None:
+            workers = cpu_count()
+        workers = min(workers, len(scenarios))
+
+        if workers <= 1:
+            return (self.evaluate(failures) for failures in scenarios)
+
+        return _results(self, scenarios, workers)
+
+    def biconnectivity(self):
+        """
+        Find the bridges and the articulation points of the topology.
+
+        Links are taken as undirected for this analysis. Nodes joined by more
+        than one link in any direction, like two parallel
+        :class:`pynml.nml.BidirectionalLink`, are never a bridge.
+
+        A single iterative depth first search is done (Tarjan's algorithm),
+        and the result is cached.
+
+        :rtype: tuple
+        :return: A tuple (bridges, articulation_points) with the
+         (node, node) identifiers of the bridges and the identifiers of the
+         articulation points.
+        """
+        if self._biconnectivity is not None:
+            return self._biconnectivity
+
+        # Undirected multiplicity of the links between each pair of nodes
+        node_count = len(self.identifiers)
+        directed = {}
+        for node in range(node_count):
+            for arc in range(self._offsets[node], self._offsets[node + 1]):
+                head = self._heads[arc]
+                if head != node:
+                    key = (node, head)
+                    directed[key] = (
+                        directed.get(key, 0) + self._link_counts[arc]
+                    )
+
+        neighbours = [{} for node in range(node_count)]
+        for (node, head), links in directed.items():
+            multiplicity = max(links, directed.get((head, node), 0))
+            neighbours[node][head] = multiplicity
+            neighbours[head][node] = multiplicity
+
+        discovered = array(TYPECODE, [-1]) * node_count
+        low = array(TYPECODE, [0]) * node_count
+        bridges = []
+        articulations = set()
+        counter = 0
+
+        for root in range(node_count):
+            if discovered[root] != -1:
+                continue
+
+            discovered[root] = low[root] = counter
+            counter += 1
+            children = 0
+            stack = [(root, -1, iter(neighbours[root].items()))]
+
+            while stack:
+                node, parent, pending = stack[-1]
+                for neighbour, multiplicity in pending:
+                    if discovered[neighbour] == -1:
+                        discovered[neighbour] = low[neighbour] = counter
+                        counter += 1
+                        if node == root:
+                            children += 1
+                        stack.append((
+                            neighbour, node,
+                            iter(neighbours[neighbour].items())
+                        ))
+                        break
+                    if neighbour != parent or multiplicity > 1:
+                        low[node] = min(low[node], discovered[neighbour])
+                else:
+                    stack.pop()
+                    if parent == -1:
+                        continue
+                    low[parent] = min(low[parent], low[node])
+                    if low[node] > discovered[parent]:
+                        bridges.append(
+                            (self.identifiers[parent],
+                             self.identifiers[node])
+                        )
+                    if parent != root and low[node] >= discovered[parent]:
+                        articulations.add(parent)
+
+            if children > 1:
+                articulations.add(root)
+
+        self._biconnectivity = (
+            bridges,
+            [self.identifiers[node] for node in sorted(articulations)]
+        )
+        return self._biconnectivity
+
+    def bridges(self):
+        """
+        Find the bridges of the topology, see :meth:`biconnectivity`.
+
+        :rtype: list
+        :return: The (node, node) identifiers of the bridges.
+        """
+        return self.biconnectivity()[0]
+
+    def articulation_points(self):
+        """
+        Find the articulation points of the topology, see
+        :meth:`biconnectivity`.
+
+        :rtype: list
+        :return: The identifiers of the articulation points.
+        """
+        return self.biconnectivity()[1]
+
+
+# Engine of the current process of the pool of evaluate_many()
+_engine = []
+
+
+def _attach(engine):
+    """
+    Initialize a process of the pool of :meth:`WhatIf.evaluate_many`.
+    """
+    _engine[:] = [engine]
+
+
+def _evaluate(failures):
+    """
+    Evaluate a scenario in a process of the pool.
+    """
+    return _engine[0].evaluate(failures)
+
+
+def _results(engine, scenarios, workers):
+    """
+    Evaluate many scenarios in a pool of processes.
+
+    The pool is created when the first result is requested, and released
+    once all the results are yielded or when the iterator is closed.
+    """
+    pool = None
+    finished = False
+    try:
+        pool = Pool(workers, initializer=_attach, initargs=(engine, ))
+        for result in pool.imap(
+                _evaluate, scenarios,
+                chunksize=max(1, len(scenarios) // (workers * 16))):
+            yield result
+        finished = True
+    finally:
+        if pool is not None:
+            if finished:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
+
+
+__all__ = ['Impact', 'WhatIf']
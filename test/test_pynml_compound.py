@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.compound.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import pytest  # noqa
+
+from pynml.nml import Link, LinkGroup, ListItem
+from pynml.compound import serial_compound_link, segments, expand
+from pynml.manager import NMLManager
+
+
+def test_expand():
+    """
+    Check the expansion of nested serial compound links.
+    """
+    links = [Link(identifier='l{}'.format(number)) for number in range(5)]
+
+    span, _, _ = serial_compound_link(links[:2], identifier='span')
+    section, _, _ = serial_compound_link(
+        [span, links[2]], identifier='section'
+    )
+    circuit, _, items = serial_compound_link(
+        [section, links[3], span, links[4]], identifier='circuit'
+    )
+
+    assert segments(circuit) == [section, links[3], span, links[4]]
+
+    cache = {}
+    assert expand(circuit, cache) == (
+        links[0], links[1], links[2], links[3], links[0], links[1], links[4]
+    )
+    assert cache['span'] == tuple(links[:2])
+    assert cache['section'] == tuple(links[:3])
+
+    # Cached sub-expansions are reused
+    cache['span'] = (links[4], )
+    other, _, _ = serial_compound_link([span, span], identifier='other')
+    assert expand(other, cache) == (links[4], links[4])
+    assert expand(circuit) == expand(circuit, {})
+
+    # Empty and unordered LinkGroups
+    empty, _, _ = serial_compound_link([], identifier='empty')
+    assert expand(empty) == ()
+    with pytest.raises(Exception):
+        expand(LinkGroup(identifier='unordered'))
+
+    # Cycles in the list
+    items[-1].set_next(items[1])
+    with pytest.raises(Exception):
+        segments(circuit)
+
+
+def test_expand_cycle():
+    """
+    Check that serial compound links that contain themselves are detected.
+    """
+    outer, _, items = serial_compound_link(
+        [Link(identifier='l1')], identifier='outer'
+    )
+    inner, _, _ = serial_compound_link(
+        [Link(identifier='l2'), outer], identifier='inner'
+    )
+    item = ListItem()
+    item.set_item(inner)
+    items[-1].set_next(item)
+
+    with pytest.raises(Exception):
+        expand(outer)
+    with pytest.raises(Exception):
+        expand(inner)
+
+
+def test_manager_expand():
+    """
+    Check that the manager caches the expansions until the namespace
+    changes.
+    """
+    mgr = NMLManager(name='Circuits')
+    links = [Link(identifier='l{}'.format(number)) for number in range(3)]
+    span, ordered_list, items = serial_compound_link(
+        links[:2], identifier='span'
+    )
+    for obj in links + [span, ordered_list] + items:
+        mgr.register_object(obj)
+
+    expansion = mgr.expand_serial_compound_link(span)
+    assert expansion == tuple(links[:2])
+    assert mgr.expand_serial_compound_link(span) is expansion
+
+    items[-1].set_item(links[2])
+    assert mgr.expand_serial_compound_link(span) == (links[0], links[2])
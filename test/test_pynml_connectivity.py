@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.connectivity.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from random import Random
+
+import pytest  # noqa
+
+from pynml.connectivity import ConnectivityTracker
+from pynml.manager import ExtendedNMLManager
+
+
+def components(nodes, links):
+    """
+    Compute the connected components with a full traversal.
+    """
+    neighbours = dict((node, set()) for node in nodes)
+    for node_a, node_b in links:
+        neighbours[node_a].add(node_b)
+        neighbours[node_b].add(node_a)
+
+    found = set()
+    for node in nodes:
+        pending = [node]
+        component = set()
+        while pending:
+            current = pending.pop()
+            if current not in component:
+                component.add(current)
+                pending.extend(neighbours[current])
+        found.add(frozenset(component))
+    return found
+
+
+def test_tracker():
+    """
+    Check the components as links are added and removed.
+    """
+    tracker = ConnectivityTracker()
+    assert tracker.is_connected()
+
+    for node in 'abcd':
+        tracker.add_node(node)
+    assert len(tracker) == 4
+    assert not tracker.is_connected()
+
+    tracker.add_link('a', 'b')
+    tracker.add_link('a', 'b')
+    tracker.add_link('b', 'c')
+    tracker.add_link('c', 'a')
+    assert len(tracker) == 2
+    assert tracker.connected('a', 'c')
+    assert tracker.members('c') == frozenset('abc')
+
+    # Parallel links and cycles keep the nodes connected
+    tracker.remove_link('a', 'b')
+    tracker.remove_link('c', 'a')
+    assert len(tracker) == 2
+    assert tracker.connected('a', 'c')
+
+    tracker.remove_link('b', 'a')
+    assert len(tracker) == 3
+    assert tracker.members('a') == frozenset('a')
+    assert tracker.members('b') == frozenset('bc')
+
+    with pytest.raises(Exception):
+        tracker.remove_link('a', 'b')
+    with pytest.raises(Exception):
+        tracker.connected('a', 'e')
+
+    tracker.add_link('c', 'd')
+    tracker.remove_node('c')
+    assert 'c' not in tracker
+    assert len(tracker) == 3
+
+
+def test_tracker_random():
+    """
+    Check the components against a full traversal after random changes.
+    """
+    random = Random(42)
+    nodes = list(range(60))
+    links = []
+
+    tracker = ConnectivityTracker()
+    for node in nodes:
+        tracker.add_node(node)
+
+    for step in range(600):
+        if links and random.random() < 0.4:
+            link = links.pop(random.randrange(len(links)))
+            tracker.remove_link(*link)
+        else:
+            link = (random.choice(nodes), random.choice(nodes))
+            links.append(link)
+            tracker.add_link(*link)
+
+        expected = components(nodes, links)
+        assert len(tracker) == len(expected)
+        assert set(tracker.members(node) for node in nodes) == expected
+
+
+def test_manager_connectivity():
+    """
+    Check that the tracker follows the helpers of the manager.
+    """
+    mgr = ExtendedNMLManager(name='Fabric')
+    sw1 = mgr.create_node(identifier='sw1')
+    sw2 = mgr.create_node(identifier='sw2')
+    mgr.create_bilink(
+        mgr.create_biport(sw1, identifier='sw1p1'),
+        mgr.create_biport(sw2, identifier='sw2p1')
+    )
+    sw3 = mgr.create_node(identifier='sw3')
+    assert mgr.connectivity is None
+
+    # Built from the current topology
+    tracker = mgr.create_connectivity_tracker()
+    assert mgr.create_connectivity_tracker() is tracker
+    assert len(tracker) == 2
+    assert tracker.connected(sw1, sw2)
+    assert not tracker.is_connected()
+
+    mgr.create_bilink(
+        mgr.create_biport(sw2, identifier='sw2p2'),
+        mgr.create_biport(sw3, identifier='sw3p1')
+    )
+    assert tracker.is_connected()
+
+    mgr.create_node(identifier='sw4')
+    assert len(tracker) == 2
+    assert tracker.members(sw1) == frozenset(['sw1', 'sw2', 'sw3'])
+
+    mgr = ExtendedNMLManager(name='Fabric', connectivity=True)
+    assert len(mgr.connectivity) == 0
+    mgr.create_node()
+    assert len(mgr.connectivity) == 1
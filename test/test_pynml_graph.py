@@ -0,0 +1,368 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.graph.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from random import Random
+from multiprocessing import active_children
+
+import pytest  # noqa
+
+from pynml.nml import Port, Link
+from pynml.graph import compile_graph, edge_weights, reverse_edges
+from pynml.graph import shortest_path, shortest_paths, path_cost
+from pynml.graph import edge_source
+from pynml.manager import ExtendedNMLManager
+
+
+def fabric():
+    """
+    Create a topology with two parallel bilinks between sw1 and sw2 and one
+    bilink between sw2 and sw3.
+    """
+    mgr = ExtendedNMLManager(name='Fabric', reverse_index=True)
+
+    sw1 = mgr.create_node(identifier='sw1')
+    sw2 = mgr.create_node(identifier='sw2')
+    sw3 = mgr.create_node(identifier='sw3')
+
+    biports = {}
+    for node, count in ((sw1, 2), (sw2, 3), (sw3, 1)):
+        for number in range(1, count + 1):
+            identifier = '{}p{}'.format(node.identifier, number)
+            biports[identifier] = mgr.create_biport(
+                node, identifier=identifier
+            )
+
+    mgr.create_bilink(biports['sw1p1'], biports['sw2p1'], identifier='l1')
+    mgr.create_bilink(biports['sw1p2'], biports['sw2p2'], identifier='l2')
+    mgr.create_bilink(biports['sw2p3'], biports['sw3p1'], identifier='l3')
+
+    return mgr
+
+
+def test_compile_graph():
+    """
+    Check the compiled CSR graph of a namespace.
+    """
+    mgr = fabric()
+    graph = compile_graph(mgr)
+
+    # 3 nodes and 2 directed ports per biport
+    assert graph.node_count == 3
+    assert len(graph) == 3 + 12
+    assert graph.identifiers[:3] == ['sw1', 'sw2', 'sw3']
+    assert all(graph.ids[identifier] == vertex
+               for vertex, identifier in enumerate(graph.identifiers))
+    assert len(graph.link_identifiers) == 6
+
+    sw1, sw2 = graph.ids['sw1'], graph.ids['sw2']
+    assert graph.is_node(sw1)
+    assert len(graph.neighbours(sw1)) == 2
+
+    # Node -> outbound port -> inbound port -> node
+    reached = set()
+    for outbound in graph.neighbours(sw1):
+        assert not graph.is_node(outbound)
+        edge = graph.offsets[outbound]
+        assert graph.offsets[outbound + 1] - edge == 1
+        assert len(graph.edge_links(edge)) == 1
+
+        inbound = graph.targets[edge]
+        assert list(graph.neighbours(inbound)) == [sw2]
+        assert len(graph.edge_links(graph.offsets[inbound])) == 0
+        reached.add(inbound)
+    assert len(reached) == 2
+
+    # Parallel links between the same ports are a single edge
+    out_port = mgr.get_object('sw1p1').get_has_port()[1]
+    link = Link(identifier='l1-parallel')
+    mgr.register_object(link)
+    out_port.add_is_source(link)
+    mgr.get_object('sw2p1').get_has_port()[0].add_is_sink(link)
+
+    graph = compile_graph(mgr)
+    outbound = graph.ids[out_port.identifier]
+    edge = graph.offsets[outbound]
+    assert graph.offsets[outbound + 1] - edge == 1
+    assert [
+        graph.link_identifiers[link_id] for link_id in graph.edge_links(edge)
+    ][1:] == ['l1-parallel']
+
+
+def test_compile_graph_cache():
+    """
+    Check that the compiled graph is reused until the namespace changes.
+    """
+    mgr = fabric()
+    graph = mgr.compile_graph()
+    assert mgr.compile_graph() is graph
+
+    # Relations of registered objects
+    sw3 = mgr.get_object('sw3')
+    mgr.create_biport(sw3, identifier='sw3p2')
+    changed = mgr.compile_graph()
+    assert changed is not graph
+    assert len(changed) == len(graph) + 2
+    assert mgr.compile_graph() is changed
+
+    # Relations of objects not in the namespace
+    ExtendedNMLManager().create_node().add_has_inbound_port(
+        sw3.get_has_inbound_port().popitem()[1]
+    )
+    assert mgr.compile_graph() is changed
+
+
+def test_shortest_path():
+    """
+    Check the shortest paths between nodes and ports, following the
+    direction of the links.
+    """
+    mgr = fabric()
+    sw1, sw2, sw3 = (mgr.get_object(name) for name in ('sw1', 'sw2', 'sw3'))
+    l1_a_b, l1_b_a = mgr.get_object('l1').get_has_link()
+    l3_a_b, l3_b_a = mgr.get_object('l3').get_has_link()
+    sw1p1_in, sw1p1_out = mgr.get_object('sw1p1').get_has_port()
+    sw2p1_in, sw2p1_out = mgr.get_object('sw2p1').get_has_port()
+    sw2p3_in, sw2p3_out = mgr.get_object('sw2p3').get_has_port()
+    sw3p1_in, sw3p1_out = mgr.get_object('sw3p1').get_has_port()
+
+    assert mgr.shortest_path(sw1, sw1) == [sw1]
+
+    # Any of the parallel bilinks between sw1 and sw2
+    path = mgr.shortest_path(sw1, sw3)
+    assert len(path) == 9
+    assert path[0] is sw1 and path[4] is sw2
+    assert path[2] in (l1_a_b, mgr.get_object('l2').get_has_link()[0])
+    assert path[1].get_is_source()[path[2].identifier] is path[2]
+    assert path[3].get_is_sink()[path[2].identifier] is path[2]
+    assert path[4:] == [sw2, sw2p3_out, l3_a_b, sw3p1_in, sw3]
+
+    assert mgr.shortest_path(sw3p1_out, sw1p1_in) == [
+        sw3p1_out, l3_b_a, sw2p3_in,
+        sw2, sw2p1_out, l1_b_a, sw1p1_in
+    ]
+
+    # Unidirectional links
+    sw4 = mgr.create_node(identifier='sw4')
+    sw4p1 = Port(identifier='sw4p1')
+    mgr.register_object(sw4p1)
+    sw4.add_has_outbound_port(sw4p1)
+    link = Link(identifier='l4')
+    mgr.register_object(link)
+    sw4p1.add_is_source(link)
+    sw3p2 = Port(identifier='sw3p2')
+    mgr.register_object(sw3p2)
+    sw3.add_has_inbound_port(sw3p2)
+    sw3p2.add_is_sink(link)
+
+    assert mgr.shortest_path(sw4, sw3) == [sw4, sw4p1, link, sw3p2, sw3]
+    assert mgr.shortest_path(sw3, sw4) is None
+
+    with pytest.raises(Exception):
+        mgr.shortest_path(sw1, Port(identifier='unregistered'))
+
+
+def test_shortest_path_weights():
+    """
+    Check the shortest paths using the weights in the metadata of the links.
+    """
+    mgr = fabric()
+    sw1, sw2 = mgr.get_object('sw1'), mgr.get_object('sw2')
+    l1_a_b = mgr.get_object('l1').get_has_link()[0]
+    l2_a_b = mgr.get_object('l2').get_has_link()[0]
+
+    l1_a_b.metadata['cost'] = 10
+    l2_a_b.metadata['cost'] = 2.5
+
+    assert mgr.shortest_path(sw1, sw2)[2] in (l1_a_b, l2_a_b)
+    assert mgr.shortest_path(sw1, sw2, weight='cost')[2] is l2_a_b
+    assert mgr.shortest_path(sw1, sw2, weight='missing')[2] is l1_a_b
+    assert mgr.shortest_path(sw1, sw2, weight='cost', default=20)[2] \
+        is l2_a_b
+
+    l2_a_b.metadata['delay'] = -1
+    with pytest.raises(Exception):
+        mgr.shortest_path(sw1, sw2, weight='delay')
+
+
+def test_shortest_path_bidirectional():
+    """
+    Check that the bidirectional search finds paths as short as the ones
+    found by a search from the source.
+    """
+    random = Random(1)
+    mgr = ExtendedNMLManager()
+    nodes = [mgr.create_node(identifier='sw{}'.format(i)) for i in range(20)]
+    biports = [mgr.create_biport(node) for node in nodes for port in '123']
+    random.shuffle(biports)
+    for biport_a, biport_b in zip(biports[::2], biports[1::2]):
+        mgr.create_bilink(biport_a, biport_b)
+
+    graph = mgr.compile_graph()
+
+    # Edges reaching each vertex
+    offsets, edges, sources = reverse_edges(graph)
+    assert reverse_edges(graph) is graph.cache['reverse']
+    for vertex in range(len(graph)):
+        for edge in edges[offsets[vertex]:offsets[vertex + 1]]:
+            assert graph.targets[edge] == vertex
+            assert sources[edge] == edge_source(graph, edge)
+    assert sorted(edges) == list(range(len(graph.targets)))
+
+    weights = edge_weights(
+        graph, [random.randint(1, 10) for link in graph.link_identifiers]
+    )[0]
+    vertices = range(len(graph))
+    for weight in (None, weights):
+        for source in vertices[::7]:
+            expected = shortest_paths(graph, source, vertices, weights=weight)
+            for target in vertices:
+                path = shortest_path(graph, source, target, weights=weight)
+                if expected[target] is None:
+                    assert path is None
+                    continue
+
+                assert path_cost(graph, path, weight) == \
+                    path_cost(graph, expected[target], weight)
+                vertex = source
+                for edge in path:
+                    assert edge_source(graph, edge) == vertex
+                    vertex = graph.targets[edge]
+                assert vertex == target
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_paths_many(workers):
+    """
+    Check the paths found by a pool of processes, in the order of the pairs.
+    """
+    mgr = fabric()
+    sw3 = mgr.get_object('sw3')
+    sw4 = mgr.create_node(identifier='sw4')
+
+    nodes = list(mgr.nodes())
+    pairs = [
+        (source, target) for target in nodes for source in nodes
+    ] + [(sw3, sw4), (sw4, sw3)]
+
+    # Equal-cost paths may be chosen differently by the bidirectional search
+    # of shortest_path, so the ends and the links of each path are compared
+    def summary(path):
+        if path is None:
+            return None
+        return path[0], path[-1], len([
+            obj for obj in path if isinstance(obj, Link)
+        ])
+
+    for weight in (None, 'cost'):
+        paths = list(mgr.paths_many(pairs, weight=weight, workers=workers))
+        assert [summary(path) for path in paths] == [
+            summary(mgr.shortest_path(source, target, weight=weight))
+            for source, target in pairs
+        ]
+        assert paths[-2:] == [None, None]
+        assert paths[0] == [nodes[0]]
+
+    # The pool is stopped when the caller stops early
+    paths = mgr.paths_many(pairs, workers=workers)
+    assert next(paths) == [nodes[0]]
+    paths.close()
+    assert active_children() == []
+
+
+def test_equal_cost_paths():
+    """
+    Check all the equal-cost paths, with parallel links as multiplicity.
+    """
+    mgr = fabric()
+    sw1, sw2, sw3 = (mgr.get_object(name) for name in ('sw1', 'sw2', 'sw3'))
+
+    paths = list(mgr.equal_cost_paths(sw1, sw3))
+    assert len(paths) == 2
+    assert [path[2] for path in paths] == [
+        (mgr.get_object('l1').get_has_link()[0], ),
+        (mgr.get_object('l2').get_has_link()[0], ),
+    ]
+    assert all(len(path) == 9 and path[4] is sw2 for path in paths)
+    assert list(mgr.equal_cost_paths(sw1, sw1)) == [[sw1]]
+    assert list(mgr.equal_cost_paths(sw3, mgr.create_node())) == []
+
+    # Parallel bilink between the same pair of biports
+    l1b = mgr.create_bilink(
+        mgr.get_object('sw1p1'), mgr.get_object('sw2p1'), identifier='l1b'
+    )
+    paths = list(mgr.equal_cost_paths(sw1, sw3))
+    assert len(paths) == 2
+    assert paths[0][2] == (
+        mgr.get_object('l1').get_has_link()[0], l1b.get_has_link()[0]
+    )
+
+    # Weights select the lightest paths and parallel links
+    l1b.get_has_link()[0].metadata['cost'] = 2
+    paths = list(mgr.equal_cost_paths(sw1, sw3, weight='cost'))
+    assert len(paths) == 2
+    assert paths[0][2] == (mgr.get_object('l1').get_has_link()[0], )
+
+    l1b.get_has_link()[0].metadata['delay'] = 2
+    mgr.get_object('l2').get_has_link()[0].metadata['delay'] = 2
+    paths = list(mgr.equal_cost_paths(sw1, sw3, weight='delay'))
+    assert len(paths) == 1
+    assert paths[0][2] == (mgr.get_object('l1').get_has_link()[0], )
+
+
+def test_k_shortest_paths():
+    """
+    Check the loopless paths between the leaves of a leaf-spine fabric.
+    """
+    mgr = ExtendedNMLManager(name='Leaf-spine')
+    leaves = [mgr.create_node(identifier='leaf{}'.format(n)) for n in (1, 2)]
+    spines = [
+        mgr.create_node(identifier='spine{}'.format(n)) for n in (1, 2, 3)
+    ]
+    for leaf in leaves:
+        for spine in spines:
+            mgr.create_bilink(
+                mgr.create_biport(leaf), mgr.create_biport(spine)
+            )
+
+    # Spine 1 and spine 2 are also connected
+    mgr.create_bilink(
+        mgr.create_biport(spines[0]), mgr.create_biport(spines[1])
+    )
+
+    paths = list(mgr.k_shortest_paths(leaves[0], leaves[1]))
+    lengths = [len(path) for path in paths]
+    assert lengths == sorted(lengths)
+    assert lengths.count(9) == 3
+    assert len(paths) == 5
+    assert len(set(tuple(path) for path in paths)) == 5
+
+    # Loopless
+    for path in paths:
+        nodes = path[::4]
+        assert len(set(nodes)) == len(nodes)
+
+    assert list(mgr.k_shortest_paths(leaves[0], leaves[1], k=2)) == paths[:2]
+    assert list(mgr.k_shortest_paths(leaves[0], leaves[1], k=0)) == []
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.graphviz.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+
+import sys
+
+import pytest  # noqa
+
+from pynml import graphviz
+from pynml.graphviz import RenderCache, find_dot, supported_formats
+from pynml.graphviz import render, render_many
+from pynml.manager import ExtendedNMLManager
+
+
+FAKE_DOT = """\
+#!{python}
+# Fake dot executable, copies the graph from stdin to the output files
+import sys
+
+args = sys.argv[1:]
+if args == ['-T?']:
+    sys.stderr.write(
+        'Format: "?" not recognized. Use one of: pdf png svg\\n'
+    )
+    sys.exit(1)
+
+with open({calls!r}, 'a') as fd:
+    fd.write(' '.join(args) + '\\n')
+
+args = [arg for arg in args if not arg.startswith('-K')]
+graph = getattr(sys.stdin, 'buffer', sys.stdin).read()
+if b'fail' in graph:
+    sys.stderr.write('syntax error in graph\\n')
+    sys.exit(1)
+
+for format, option, path in zip(args[::3], args[1::3], args[2::3]):
+    with open(path, 'wb') as fd:
+        fd.write(format[2:].encode('utf-8') + b'\\n' + graph)
+"""
+
+
+@pytest.fixture
+def fake_dot(tmpdir, monkeypatch):
+    """
+    Use a fake dot executable that logs its calls.
+    """
+    calls = tmpdir.join('calls.log')
+    dot = tmpdir.join('dot')
+    dot.write(FAKE_DOT.format(python=sys.executable, calls=str(calls)))
+    dot.chmod(0o755)
+
+    monkeypatch.setattr(graphviz, '_dot', [str(dot)])
+    monkeypatch.setattr(graphviz, '_formats', {})
+    return calls
+
+
+def test_find_dot(monkeypatch):
+    """
+    Check that a missing dot executable is reported.
+    """
+    monkeypatch.setattr(graphviz, '_dot', [])
+    monkeypatch.setattr(graphviz, 'find_executable', lambda name: None)
+
+    with pytest.raises(Exception) as excinfo:
+        find_dot()
+    assert 'Missing Graphviz' in str(excinfo.value)
+
+
+def test_render(tmpdir, fake_dot):
+    """
+    Check that several formats are rendered piping the graph to one process.
+    """
+    assert supported_formats(find_dot()) == ['pdf', 'png', 'svg']
+
+    def write(fd):
+        fd.write('graph G {}\n')
+
+    svg = tmpdir.join('out', 'graph.svg')
+    png = tmpdir.join('out', 'graph.png')
+    render(write, [str(svg), str(png)])
+
+    assert svg.read() == 'svg\ngraph G {}\n'
+    assert png.read() == 'png\ngraph G {}\n'
+    assert len(fake_dot.readlines()) == 1
+
+    # Errors
+    with pytest.raises(Exception) as excinfo:
+        render(write, [str(tmpdir.join('graph.gif'))])
+    assert 'Unsupported format "gif"' in str(excinfo.value)
+
+    with pytest.raises(Exception) as excinfo:
+        render(lambda fd: fd.write('fail'), [str(svg)])
+    assert 'syntax error in graph' in str(excinfo.value)
+
+
+def test_save_graphviz(tmpdir, fake_dot):
+    """
+    Check that a namespace can be plotted in several formats at once.
+    """
+    mgr = ExtendedNMLManager(name='Graphviz Namespace')
+    mgr.create_node(identifier='sw1', name='My Switch 1')
+
+    pdf = tmpdir.join('graph.pdf')
+    svg = tmpdir.join('graph.svg')
+    source = mgr.save_graphviz([str(pdf), str(svg)], keep_gv=True)
+
+    assert source == str(tmpdir.join('graph.gv'))
+    assert tmpdir.join('graph.gv').read() == mgr.export_graphviz()
+    assert pdf.read() == 'pdf\n' + mgr.export_graphviz()
+    assert svg.read() == 'svg\n' + mgr.export_graphviz()
+
+    assert mgr.save_graphviz(str(svg)) is None
+    assert len(fake_dot.readlines()) == 2
+
+
+def test_render_cache(tmpdir, fake_dot):
+    """
+    Check that cached graphs are not rendered again.
+    """
+    cache = RenderCache(str(tmpdir.join('cache')))
+
+    def write(fd):
+        fd.write('graph G {}\n')
+
+    svg = tmpdir.join('graph.svg')
+    png = tmpdir.join('graph.png')
+
+    render(write, [str(svg)], cache=cache)
+    assert len(fake_dot.readlines()) == 1
+    assert len(tmpdir.join('cache').listdir()) == 1
+
+    # Hits don't call dot, misses render only the formats missing
+    svg.remove()
+    render(write, [str(svg)], cache=cache)
+    assert svg.read() == 'svg\ngraph G {}\n'
+    assert len(fake_dot.readlines()) == 1
+
+    render(write, [str(svg), str(png)], cache=cache)
+    assert png.read() == 'png\ngraph G {}\n'
+    calls = fake_dot.readlines()
+    assert len(calls) == 2
+    assert '-Tsvg' not in calls[-1]
+
+    # Other sources, formats and engines are other entries
+    render(lambda fd: fd.write('graph H {}\n'), [str(svg)], cache=cache)
+    assert svg.read() == 'svg\ngraph H {}\n'
+    render(write, [str(svg)], engine='sfdp', cache=cache)
+    assert len(fake_dot.readlines()) == 4
+    assert '-Ksfdp' in fake_dot.readlines()[-1]
+
+    # Copy instead of hard-link, keeping the source
+    copies = RenderCache(str(tmpdir.join('cache')), hardlink=False)
+    source = str(tmpdir.join('graph.gv'))
+    render(write, [str(svg)], source=source, cache=copies)
+    assert svg.read() == 'svg\ngraph G {}\n'
+    assert tmpdir.join('graph.gv').read() == 'graph G {}\n'
+    assert len(fake_dot.readlines()) == 4
+
+
+def test_render_cache_eviction(tmpdir, fake_dot):
+    """
+    Check that the least recently used entries are evicted.
+    """
+    directory = tmpdir.join('cache')
+    size = len('svg\ngraph G0 {}\n')
+    cache = RenderCache(str(directory), max_size=size * 2)
+    svg = tmpdir.join('graph.svg')
+
+    def graph(number):
+        return lambda fd: fd.write('graph G{} {{}}\n'.format(number))
+
+    for number in range(3):
+        render(graph(number), [str(svg)], cache=cache)
+        # Make sure the modification times differ
+        for entry in directory.listdir():
+            entry.setmtime(entry.mtime() - 10)
+    assert len(directory.listdir()) == 2
+
+    # G0 was evicted, G1 and G2 are hits
+    render(graph(2), [str(svg)], cache=cache)
+    render(graph(1), [str(svg)], cache=cache)
+    assert len(fake_dot.readlines()) == 3
+    render(graph(0), [str(svg)], cache=cache)
+    assert len(fake_dot.readlines()) == 4
+
+
+def test_render_many(tmpdir, fake_dot):
+    """
+    Check that many namespaces are plotted reporting failures per job.
+    """
+    jobs = []
+    for pod in range(6):
+        mgr = ExtendedNMLManager(name='Pod {}'.format(pod))
+        mgr.create_node(identifier='pod{}sw1'.format(pod), name='Switch')
+        jobs.append((mgr, str(tmpdir.join('pod{}.svg'.format(pod)))))
+
+    # An unsupported format
+    jobs[3] = (jobs[3][0], str(tmpdir.join('pod3.gif')))
+
+    errors = render_many(jobs, workers=3)
+
+    assert [error is None for error in errors] == [
+        True, True, True, False, True, True
+    ]
+    assert 'Unsupported format "gif"' in str(errors[3])
+
+    for pod, (mgr, path) in enumerate(jobs):
+        if pod != 3:
+            assert tmpdir.join('pod{}.svg'.format(pod)).read() == (
+                'svg\n' + mgr.export_graphviz()
+            )
+    assert len(fake_dot.readlines()) == 5
+
+    assert render_many([]) == []
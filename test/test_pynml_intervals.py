@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.intervals.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import pytest  # noqa
+
+from pynml.intervals import IntervalSet
+
+
+def test_interval_set():
+    """
+    Check the construction, parsing and formatting of interval sets.
+    """
+    labels = IntervalSet([(10, 20), 21, (5, 7), (15, 30), 40])
+    assert list(labels.intervals()) == [(5, 7), (10, 30), (40, 40)]
+    assert str(labels) == '5-7,10-30,40'
+    assert len(labels) == 3 + 21 + 1
+    assert labels.first() == 5
+
+    assert IntervalSet.parse(' 5-7, 10-30 ,40') == labels
+    assert IntervalSet('40,10-30,5-7') == labels
+    assert IntervalSet.parse(7) == IntervalSet([7])
+    assert IntervalSet.parse('-5--1,3') == IntervalSet([(-5, -1), 3])
+
+    assert not IntervalSet()
+    assert IntervalSet().first() is None
+    assert str(IntervalSet()) == ''
+
+    for text in ('1-', 'a', '10-5'):
+        with pytest.raises(Exception):
+            IntervalSet.parse(text)
+
+    # Values that aren't sets of integers are kept as they are
+    assert IntervalSet.coerce('1-3,5') == IntervalSet('1-3,5')
+    assert IntervalSet.coerce(7) == IntervalSet([7])
+    for value in ('1530.33', '1530.33-1560.61', 1530.33, None):
+        assert IntervalSet.coerce(value) == value
+
+
+def test_interval_set_operations():
+    """
+    Check the set operations against sets of values.
+    """
+    set_a = IntervalSet('1-10,20-30,35')
+    set_b = IntervalSet('5-25,31-40')
+    values_a, values_b = set(set_a), set(set_b)
+
+    assert set(set_a | set_b) == values_a | values_b
+    assert set(set_a & set_b) == values_a & values_b
+    assert set(set_a - set_b) == values_a - values_b
+    assert str(set_a | set_b) == '1-40'
+    assert str(set_a & set_b) == '5-10,20-25,35'
+
+    for value in range(0, 42):
+        assert (value in set_a) == (value in values_a)
+
+    assert IntervalSet('21-24') <= set_a
+    assert not IntervalSet('21-31').issubset(set_a)
+    assert IntervalSet() <= set_a
+
+
+def test_first_free():
+    """
+    Check the allocation of the lowest free values.
+    """
+    vlans = IntervalSet('1-4094')
+    allocated = IntervalSet()
+
+    for expected in (1, 2, 3):
+        vlan = vlans.first_free(allocated)
+        assert vlan == expected
+        allocated = allocated | [vlan]
+
+    allocated = IntervalSet('1-100,102-4000')
+    assert vlans.first_free(allocated) == 101
+    assert vlans.first_free(allocated, start=102) == 4001
+    assert vlans.first_free('1-4094') is None
+    assert IntervalSet('10-20,30-40').first_free('10-20', start=5) == 30
+    assert IntervalSet().first_free() is None
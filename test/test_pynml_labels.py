@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.labels.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import pytest  # noqa
+
+from pynml.nml import Port, Link, PortGroup, LinkGroup, Label, LabelGroup
+from pynml.nml import SwitchingService, AdaptationService
+from pynml.manager import ExtendedNMLManager
+
+
+def chain(labels=None, detour=False):
+    """
+    Create a topology of unidirectional links from sw1 to sw3 through sw2,
+    and optionally through sw4 too.
+
+    :param dict labels: VLAN range of each port or link, by identifier.
+    """
+    labels = labels or {}
+    mgr = ExtendedNMLManager(name='Chain')
+
+    hops = [('sw1', 'p1', 'l1', 'p2', 'sw2'), ('sw2', 'p3', 'l2', 'p4', 'sw3')]
+    if detour:
+        hops += [
+            ('sw1', 'p5', 'l3', 'p6', 'sw4'), ('sw4', 'p7', 'l4', 'p8', 'sw3')
+        ]
+
+    for source, outbound, link, inbound, sink in hops:
+        nodes = []
+        for identifier in (source, sink):
+            node = mgr.get_object(identifier)
+            if node is None:
+                node = mgr.create_node(identifier=identifier)
+            nodes.append(node)
+
+        objs = [Port(identifier=outbound), Link(identifier=link),
+                Port(identifier=inbound)]
+        for obj in objs:
+            mgr.register_object(obj)
+            if obj.identifier in labels:
+                obj.set_has_label(
+                    Label(labeltype='vlan', value=labels[obj.identifier])
+                )
+
+        nodes[0].add_has_outbound_port(objs[0])
+        objs[0].add_is_source(objs[1])
+        objs[2].add_is_sink(objs[1])
+        nodes[1].add_has_inbound_port(objs[2])
+
+    return mgr
+
+
+def identifiers(found):
+    path, labels = found
+    return [obj.identifier for obj in path], labels
+
+
+def test_label_path_continuity():
+    """
+    Check that the same label is used along the whole path.
+    """
+    mgr = chain()
+    sw1, sw3 = mgr.get_object('sw1'), mgr.get_object('sw3')
+
+    # No labels, any label can be used
+    assert identifiers(mgr.label_path(sw1, sw3)) == (
+        ['sw1', 'p1', 'l1', 'p2', 'sw2', 'p3', 'l2', 'p4', 'sw3'],
+        [None] * 9
+    )
+
+    mgr = chain({
+        'p1': '1-100', 'l1': '50-4094', 'p2': '1-4094', 'p3': '90-95,300',
+        'l2': '80-300'
+    })
+    sw1, sw3 = mgr.get_object('sw1'), mgr.get_object('sw3')
+    assert identifiers(mgr.label_path(sw1, sw3)) == (
+        ['sw1', 'p1', 'l1', 'p2', 'sw2', 'p3', 'l2', 'p4', 'sw3'],
+        [None, 90, 90, 90, None, 90, 90, 90, None]
+    )
+
+    # From and to ports
+    assert identifiers(mgr.label_path(
+        mgr.get_object('p2'), mgr.get_object('p4')
+    )) == (['p2', 'sw2', 'p3', 'l2', 'p4'], [90, None, 90, 90, 90])
+
+    # Labels of other types are ignored
+    assert mgr.label_path(sw1, sw3, labeltype='vlan') is not None
+    assert mgr.label_path(sw1, sw3, labeltype='wavelength')[1] == \
+        [None] * 9
+
+    # No common label
+    mgr = chain({'p1': '1-100', 'p4': '101-200'})
+    assert mgr.label_path(mgr.get_object('sw1'), mgr.get_object('sw3')) \
+        is None
+
+
+def test_label_path_detour():
+    """
+    Check that a longer path is found when the shortest one has no feasible
+    label.
+    """
+    mgr = chain({'p1': '1-100', 'p4': '101-200', 'p8': '1-10'}, detour=True)
+    sw1, sw3 = mgr.get_object('sw1'), mgr.get_object('sw3')
+
+    assert identifiers(mgr.label_path(sw1, sw3)) == (
+        ['sw1', 'p5', 'l3', 'p6', 'sw4', 'p7', 'l4', 'p8', 'sw3'],
+        [None, 1, 1, 1, None, 1, 1, 1, None]
+    )
+
+    # Shorter, but not feasible
+    mgr.get_object('l3').metadata['cost'] = 10
+    path, labels = mgr.label_path(sw1, sw3, weight='cost')
+    assert path[1].identifier == 'p5'
+
+
+def test_label_path_swapping():
+    """
+    Check that the label only changes where a service allows it.
+    """
+    mgr = chain({'p1': '1-100', 'p2': '50-100', 'p3': '200-300'})
+    sw1, sw2, sw3 = (mgr.get_object(name) for name in ('sw1', 'sw2', 'sw3'))
+
+    assert mgr.label_path(sw1, sw3) is None
+
+    # Service without label swapping
+    service = SwitchingService(identifier='switching')
+    sw2.add_has_service(service)
+    assert mgr.label_path(sw1, sw3) is None
+
+    # Label swapping between other ports
+    service = SwitchingService(identifier='swapping', label_swapping='true')
+    service.add_has_inbound_port(mgr.get_object('p3'))
+    mgr.register_object(service)
+    sw2.add_has_service(service)
+    assert mgr.label_path(sw1, sw3) is None
+
+    service.add_has_outbound_port(mgr.get_object('p3'))
+    service.add_has_inbound_port(mgr.get_object('p2'))
+    assert mgr.label_path(sw1, sw3)[1] == [
+        None, 50, 50, 50, None, 200, 200, 200, None
+    ]
+
+    # Adaptation
+    mgr = chain({'p1': '1-100', 'p4': '101-200'})
+    mgr.get_object('p2').add_has_service(
+        AdaptationService(identifier='adaptation')
+    )
+    assert mgr.label_path(mgr.get_object('sw1'), mgr.get_object('sw3'))[1] \
+        == [None, 1, 1, 1, None, 101, 101, 101, None]
+
+
+def test_label_path_groups():
+    """
+    Check the labels of the port and link groups.
+    """
+    mgr = chain({'p1': '1-100', 'p3': '50'})
+    sw1, sw3 = mgr.get_object('sw1'), mgr.get_object('sw3')
+
+    links = LinkGroup(identifier='links')
+    links.add_has_link(mgr.get_object('l1'))
+    links.set_has_label_group(LabelGroup(labeltype='vlan', value='20-30'))
+    mgr.register_object(links)
+    assert mgr.label_path(sw1, sw3) is None
+
+    links.set_has_label_group(LabelGroup(labeltype='vlan', value='40-60'))
+    assert mgr.label_path(sw1, sw3)[1][1:4] == [50, 50, 50]
+
+    # Nested groups, the label of the port takes precedence
+    nested = PortGroup(identifier='nested')
+    nested.add_has_port(mgr.get_object('p3'))
+    nested.add_has_port(mgr.get_object('p4'))
+    ports = PortGroup(identifier='ports')
+    ports.add_has_port(nested)
+    ports.set_has_label_group(LabelGroup(labeltype='vlan', value='1-40'))
+    mgr.register_object(nested)
+    mgr.register_object(ports)
+    assert mgr.label_path(sw1, sw3) is None
+
+    ports.set_has_label_group(LabelGroup(labeltype='vlan', value='45-55'))
+    assert mgr.label_path(sw1, sw3)[1] == [
+        None, 50, 50, 50, None, 50, 50, 50, None
+    ]
+
+
+def test_label_path_mixed_types():
+    """
+    Check that labels of different types aren't mixed.
+    """
+    mgr = chain({'p1': '10-20', 'p4': '15'})
+    sw1, sw3 = mgr.get_object('sw1'), mgr.get_object('sw3')
+    mgr.get_object('l1').set_has_label(Label(labeltype='mpls', value='30'))
+    mgr.get_object('l2').set_has_label(
+        Label(labeltype='wavelength', value='1530.33')
+    )
+
+    with pytest.raises(Exception) as excinfo:
+        mgr.label_path(sw1, sw3)
+    assert 'mpls, vlan, wavelength' in str(excinfo.value)
+
+    # The MPLS label of l1 doesn't restrict the VLANs
+    assert mgr.label_path(sw1, sw3, labeltype='vlan')[1] == [
+        None, 15, 15, 15, None, 15, 15, 15, None
+    ]
+    assert mgr.label_path(sw1, sw3, labeltype='mpls')[1] == [
+        None, 30, 30, 30, None, 30, 30, 30, None
+    ]
+
+    # Wavelengths aren't sets of integers, so they are skipped
+    assert mgr.label_path(sw1, sw3, labeltype='wavelength')[1] == [None] * 9
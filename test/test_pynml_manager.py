@@ -27,8 +27,15 @@ from __future__ import print_function, division
 from distutils.spawn import find_executable
 
 import pytest  # noqa
+from six import StringIO
 
+from pynml.nml import Node, Port, BidirectionalPort, NetworkObject, Link
+from pynml.nml import Topology, Location, PortGroup, Label, LabelGroup
+from pynml.nml import LinkGroup, unset
+from pynml import manager
 from pynml.manager import NMLManager, ExtendedNMLManager
+from pynml.intervals import IntervalSet
+from pynml.spec import render
 
 
 def common_mgr():
@@ -72,7 +79,456 @@ def test_xml_nml(tmpdir):
 
     assert xmlfile.check(file=1)
 
-    # FIXME: When parser is implemented, reparse in new namespace and assert
+    # Reparse in new namespace
+    loaded = NMLManager()
+    loaded.load_nml(str(xmlfile))
+
+    assert list(loaded.namespace.keys()) == list(mgr.namespace.keys())
+
+    for identifier, obj in mgr.namespace.items():
+        other = loaded.get_object(identifier)
+        assert other.__class__ is obj.__class__
+        assert other.name == obj.name
+        assert other.version == obj.version
+
+        for relname, relgetter in obj.relations.items():
+            related = relgetter()
+            other_related = other.relations[relname]()
+            if hasattr(related, 'values'):
+                related = related.values()
+                other_related = other_related.values()
+            assert [
+                o.identifier for o in related if o is not None
+            ] == [
+                o.identifier for o in other_related if o is not None
+            ]
+
+
+def test_write_nml():
+    """
+    Check that the streaming NML XML writer work.
+    """
+    mgr = common_mgr()
+
+    output = StringIO()
+    mgr.write_nml(output)
+
+    assert output.getvalue() == mgr.export_nml(pretty=False)
+
+    output.seek(0)
+    loaded = NMLManager()
+    loaded.load_nml(output)
+
+    assert list(loaded.namespace.keys()) == list(mgr.namespace.keys())
+
+
+def test_xml_nml_labels():
+    """
+    Check that the sets of labels are exported in range syntax.
+    """
+    mgr = NMLManager(name='Labels Namespace')
+
+    port = Port(identifier='sw1p1')
+    port.set_has_label(Label(identifier='vlan10', labeltype='vlan', value=10))
+    group = PortGroup(identifier='sw1ports')
+    group.add_has_port(port)
+    group.set_has_label_group(LabelGroup(
+        identifier='vlans', labeltype='vlan', value='200-300,1-100,101'
+    ))
+    link = Link(identifier='l1')
+    link.set_has_label(Label(labeltype='wavelength', value='1530.33'))
+    links = LinkGroup(identifier='links')
+    links.add_has_link(link)
+    links.set_has_label_group(LabelGroup(
+        identifier='cband', labeltype='wavelength', value='1530.33,1531.12'
+    ))
+    for obj in (port.get_has_label()[0], group.get_has_label_group()[0],
+                port, group, link.get_has_label()[0],
+                links.get_has_label_group()[0], link, links):
+        mgr.register_object(obj)
+
+    assert 'value="1-101,200-300"' in mgr.export_nml()
+
+    output = StringIO()
+    mgr.write_nml(output)
+    output.seek(0)
+    loaded = NMLManager()
+    loaded.load_nml(output)
+
+    labels = loaded.get_object('sw1ports').get_has_label_group()[0]
+    assert labels is loaded.get_object('vlans')
+    assert str(labels.value) == '1-101,200-300'
+    assert 250 in labels.value and 150 not in labels.value
+    assert loaded.get_object('sw1p1').get_has_label()[0].value == '10'
+
+    # Labels that aren't integers are kept as they are
+    wavelengths = loaded.get_object('cband')
+    assert wavelengths.value == '1530.33,1531.12'
+    assert loaded.get_object('l1').get_has_label()[0].value == '1530.33'
+
+
+def test_xml_nml_pretty(tmpdir):
+    """
+    Check that the NML XML export honours the pretty argument.
+    """
+    mgr = common_mgr()
+
+    pretty = mgr.export_nml(pretty=True).splitlines()
+    assert pretty[1].startswith('<Namespace ')
+    assert pretty[2].startswith('    <nml:Node ')
+    assert pretty[3].startswith('        <Relation ')
+    assert pretty[4].startswith('            <Port ')
+    assert pretty[-1] == '</Namespace>'
+
+    xmlfile = tmpdir.join('topology.xml')
+    mgr.save_nml(str(xmlfile), pretty=False)
+    assert len(xmlfile.readlines()) == 2
+
+    loaded = NMLManager()
+    loaded.load_nml(str(xmlfile))
+    assert list(loaded.namespace.keys()) == list(mgr.namespace.keys())
+
+
+def test_xml_nml_undefined(tmpdir):
+    """
+    Check that the NML XML parser fails on references to undefined objects.
+    """
+    mgr = NMLManager()
+    node = Node(identifier='sw1', name='My Switch 1')
+    node.add_has_inbound_port(Port(identifier='sw1p1'))
+    mgr.register_object(node)
+
+    xmlfile = tmpdir.join('topology.xml')
+    mgr.save_nml(str(xmlfile))
+
+    with pytest.raises(Exception) as excinfo:
+        NMLManager().load_nml(str(xmlfile))
+    assert 'sw1p1' in str(excinfo.value)
+
+
+def test_xml_nml_trusted(tmpdir):
+    """
+    Check that the validation of URIs can be skipped for trusted files.
+    """
+    xmlfile = tmpdir.join('topology.xml')
+    xmlfile.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Namespace xmlns:nml="http://schemas.ogf.org/nml/2013/05/base">'
+        '<nml:Node identifier="http://[sw1" name="Node" version="v"/>'
+        '</Namespace>\n'
+    )
+
+    with pytest.raises(Exception):
+        NMLManager().load_nml(str(xmlfile))
+
+    mgr = NMLManager()
+    mgr.load_nml(str(xmlfile), trusted=True)
+    assert list(mgr.namespace.keys()) == ['http://[sw1']
+
+
+def test_xml_nml_spec(tmpdir):
+    """
+    Check that NML XML files using the attribute names and the relations of
+    the NML specification are loaded.
+    """
+    xmlfile = tmpdir.join('topology.xml')
+    xmlfile.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Namespace xmlns:nml="http://schemas.ogf.org/nml/2013/05/base">'
+        '<nml:Node id="urn:ogf:network:example.net:2013:sw1" name="sw1">'
+        '<nml:Relation type='
+        '"http://schemas.ogf.org/nml/2013/05/base#hasInboundPort">'
+        '<nml:Port id="urn:ogf:network:example.net:2013:sw1p1"/>'
+        '</nml:Relation>'
+        '</nml:Node>'
+        '<nml:Port id="urn:ogf:network:example.net:2013:sw1p1"/>'
+        '<nml:Location id="urn:ogf:network:example.net:2013:dc1" '
+        'lat="52.3" long="4.9"/>'
+        '</Namespace>\n'
+    )
+
+    mgr = NMLManager()
+    mgr.load_nml(str(xmlfile))
+    sw1 = mgr.get_object('urn:ogf:network:example.net:2013:sw1')
+    sw1p1 = mgr.get_object('urn:ogf:network:example.net:2013:sw1p1')
+    assert sw1.name == 'sw1'
+    assert sw1.metadata == {}
+    assert list(sw1.iter_has_inbound_port()) == [sw1p1]
+
+    dc1 = mgr.get_object('urn:ogf:network:example.net:2013:dc1')
+    assert (dc1.latitude, dc1.longitude) == ('52.3', '4.9')
+
+    # Unknown attributes
+    xmlfile.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Namespace xmlns:nml="http://schemas.ogf.org/nml/2013/05/base">'
+        '<nml:Node id="sw1" speed="10"/>'
+        '</Namespace>\n'
+    )
+    with pytest.raises(Exception) as excinfo:
+        NMLManager().load_nml(str(xmlfile))
+    assert 'speed' in str(excinfo.value)
+
+    # Attributes as child elements
+    xmlfile.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Namespace xmlns:nml="http://schemas.ogf.org/nml/2013/05/base">'
+        '<nml:Location id="urn:ogf:network:example.net:2013:dc1">'
+        '<nml:name>DC 1</nml:name>'
+        '<nml:lat>52.3</nml:lat>'
+        '<nml:long>4.9</nml:long>'
+        '<nml:alt>2</nml:alt>'
+        '<nml:unlocode>NLAMS</nml:unlocode>'
+        '</nml:Location>'
+        '</Namespace>\n'
+    )
+    mgr = NMLManager()
+    mgr.load_nml(str(xmlfile))
+    dc1 = mgr.get_object('urn:ogf:network:example.net:2013:dc1')
+    assert dc1.name == 'DC 1'
+    assert (dc1.latitude, dc1.longitude, dc1.altitude) == ('52.3', '4.9', '2')
+    assert dc1.unlocode == 'NLAMS'
+
+    xmlfile.write(
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<Namespace xmlns:nml="http://schemas.ogf.org/nml/2013/05/base">'
+        '<nml:Node id="sw1"><nml:speed>10</nml:speed></nml:Node>'
+        '</Namespace>\n'
+    )
+    with pytest.raises(Exception) as excinfo:
+        NMLManager().load_nml(str(xmlfile))
+    assert 'speed' in str(excinfo.value)
+
+
+def test_bulk_create():
+    """
+    Check the creation of many objects at once.
+    """
+    mgr = NMLManager()
+    ports = mgr.bulk_create(Port, {
+        'identifier': ['sw1p{}'.format(i) for i in range(4)],
+        'name': ['Port {}'.format(i) for i in range(3)] + [None],
+        'encoding': ['http://schemas.ogf.org/nml/2012/10/ethernet'] * 4,
+    })
+
+    assert list(mgr.namespace.values()) == ports
+    assert all(isinstance(port, Port) for port in ports)
+    assert ports[0].identifier == 'sw1p0'
+    assert ports[0].name == 'Port 0'
+    assert ports[3].name.startswith('Port(')
+    assert ports[0].version == ports[3].version
+    assert ports[1].encoding == 'http://schemas.ogf.org/nml/2012/10/ethernet'
+    assert ports[1].metadata == {}
+
+    # Duplicated or existing identifiers register nothing
+    for identifiers in [['sw2', 'sw2'], ['sw2', 'sw1p0']]:
+        with pytest.raises(Exception):
+            mgr.bulk_create(Node, {'identifier': identifiers})
+    assert len(mgr.namespace) == 4
+
+    # Invalid values register nothing
+    with pytest.raises(Exception):
+        mgr.bulk_create(Node, {'identifier': ['sw2', 'http://[bad']})
+    with pytest.raises(Exception):
+        mgr.bulk_create(Node, {'identifier': ['urn:a:sw2', 'urn:a:[sw3']})
+    assert len(mgr.namespace) == 4
+
+    # Default identifiers, as the constructor does
+    nodes = mgr.bulk_create(Node, {'identifier': [None, 'sw2']})
+    assert nodes[0].identifier == str(id(nodes[0]))
+    assert mgr.get_object(nodes[0].identifier) is nodes[0]
+    assert None not in mgr.namespace
+
+    # Values are stored as the setters would
+    assert LabelGroup.validate_value('1-3,5') == IntervalSet('1-3,5')
+    assert Port.validate_name('Port 1') == 'Port 1'
+    with pytest.raises(Exception):
+        Port.validate_identifier('http://[bad')
+
+
+def test_bulk_relate():
+    """
+    Check the creation of many relations at once.
+    """
+    mgr = NMLManager()
+    mgr.bulk_create(Node, {'identifier': ['sw1', 'sw2']})
+    mgr.bulk_create(Port, {
+        'identifier': ['sw1p1', 'sw1p2', 'sw2p1', 'sw2p2']
+    })
+    mgr.bulk_create(BidirectionalPort, {'identifier': ['sw1bp1']})
+
+    mgr.bulk_relate('hasInboundPort', (
+        ['sw1', 'sw1', 'sw2', 'sw2'], ['sw1p1', 'sw1p2', 'sw2p1', 'sw2p2']
+    ))
+    sw1 = mgr.get_object('sw1')
+    assert list(sw1.iter_has_inbound_port()) == [
+        mgr.get_object('sw1p1'), mgr.get_object('sw1p2')
+    ]
+
+    mgr.bulk_relate('hasPort', (['sw1bp1', 'sw1bp1'], ['sw1p1', 'sw1p2']))
+    assert mgr.get_object('sw1bp1').get_has_port() == (
+        mgr.get_object('sw1p1'), mgr.get_object('sw1p2')
+    )
+
+    # Errors
+    with pytest.raises(Exception):
+        mgr.bulk_relate('hasPort', (['sw1bp1'], ['sw2p1']))
+    with pytest.raises(Exception):
+        mgr.bulk_relate('hasInboundPort', (['sw1'], ['sw3p1']))
+    with pytest.raises(Exception):
+        mgr.bulk_relate('hasInboundPort', (['sw1'], ['sw2']))
+
+
+def test_bulk_create_without_slots(monkeypatch):
+    """
+    Check the creation of many objects of classes rendered without slots.
+    """
+    namespace = {'__name__': 'pynml.nml_without_slots', '__package__': 'pynml'}
+    code = compile(render(slots=False)['nml'], 'nml.py', 'exec')
+    exec(code, namespace)  # noqa
+    monkeypatch.setattr(manager, 'NetworkObject', namespace['NetworkObject'])
+
+    mgr = NMLManager()
+    sw1, = mgr.bulk_create(namespace['Node'], {'identifier': ['sw1']})
+    ports = mgr.bulk_create(namespace['Port'], {
+        'identifier': ['sw1p1', 'sw1p2'],
+    })
+    assert sw1.metadata == {}
+    assert list(sw1.iter_has_inbound_port()) == []
+
+    mgr.bulk_relate('hasInboundPort', (['sw1', 'sw1'], ['sw1p1', 'sw1p2']))
+    assert list(sw1.iter_has_inbound_port()) == ports
+
+    # Plain attributes without class level default
+    service, = mgr.bulk_create(namespace['SwitchingService'], {
+        'identifier': ['sw1s1'], 'label_swapping': [True],
+    })
+    assert service.label_swapping is True
+
+
+def test_indexes():
+    """
+    Check the lookup of objects by class and attribute values.
+    """
+    ethernet = 'http://schemas.ogf.org/nml/2012/10/ethernet'
+
+    mgr = NMLManager(indexes=['encoding'])
+    sw1 = Node(identifier='sw1', name='sw1')
+    mgr.register_object(sw1)
+    ports = mgr.bulk_create(Port, {
+        'identifier': ['sw1p1', 'sw1p2', 'sw1p3'],
+        'name': ['p1', 'p2', 'p3'],
+        'encoding': [ethernet, ethernet, None],
+    })
+    biport = BidirectionalPort(identifier='sw1bp1', name='p1')
+    mgr.register_object(biport)
+
+    assert list(mgr.objects_of(Node)) == [sw1]
+    assert list(mgr.objects_of(Port)) == ports
+    assert list(mgr.objects_of(NetworkObject)) == [sw1] + ports + [biport]
+
+    assert list(mgr.find(Port, encoding=ethernet)) == ports[:2]
+    assert list(mgr.find(Port, encoding=ethernet, name='p2')) == ports[1:2]
+    assert list(mgr.find(NetworkObject, name='p1')) == [ports[0], biport]
+    assert list(mgr.find(Node, encoding=ethernet)) == []
+
+    # Indexes created later include the objects already registered
+    mgr.create_index('name')
+    assert list(mgr.find(NetworkObject, name='p1')) == [ports[0], biport]
+    assert list(mgr.find(Port, name='p4')) == []
+
+    # Lazy timestamps are indexed without being formatted
+    mgr = NMLManager(indexes=['version', 'name'])
+    with mgr.pinned_timestamp() as timestamp:
+        sw1, = mgr.bulk_create(Node, {'identifier': ['sw1']})
+    assert not hasattr(timestamp, '_isoformat')
+    sw2 = Node(identifier='sw2', version=timestamp.isoformat())
+    mgr.register_object(sw2)
+    assert list(mgr.find(Node, version=timestamp.isoformat())) == [sw1, sw2]
+
+    # Unhashable values are found without the index
+    sw3 = Node(identifier='sw3', name=['sw3'])
+    mgr.register_object(sw3)
+    assert list(mgr.find(Node, name=['sw3'])) == [sw3]
+    assert list(mgr.find(Node, name='sw3')) == []
+
+    # Extended managers only iterate the nodes made with create_node
+    mgr = ExtendedNMLManager()
+    sw1 = mgr.create_node(identifier='sw1')
+    sw2 = Node(identifier='sw2')
+    mgr.register_object(sw2)
+    assert list(mgr.nodes()) == [sw1]
+    assert list(mgr.objects_of(Node)) == [sw1, sw2]
+
+
+def test_reverse_index():
+    """
+    Check the lookup of the objects related to a given object.
+    """
+    mgr = NMLManager()
+    sw1 = Node(identifier='sw1')
+    sw1p1 = Port(identifier='sw1p1')
+    sw1.add_has_inbound_port(sw1p1)
+    mgr.register_object(sw1)
+    mgr.register_object(sw1p1)
+
+    with pytest.raises(Exception):
+        mgr.referrers(sw1p1, 'hasInboundPort')
+
+    mgr.create_reverse_index()
+    assert list(mgr.referrers(sw1p1, 'hasInboundPort')) == [sw1]
+    assert list(mgr.referrers(sw1p1, 'hasOutboundPort')) == []
+
+    # Relations changed after the index is created
+    link = Link(identifier='link1')
+    mgr.register_object(link)
+    sw1p1.add_is_sink(link)
+    assert list(mgr.referrers(link, 'isSink')) == [sw1p1]
+
+    sw1p2, sw1p3 = Port(identifier='sw1p2'), Port(identifier='sw1p3')
+    biport = BidirectionalPort(identifier='sw1bp1')
+    biport.set_has_port(sw1p1, sw1p2)
+    mgr.register_object(biport)
+    assert list(mgr.referrers(sw1p2, 'hasPort')) == [biport]
+
+    biport.set_has_port(sw1p1, sw1p3)
+    assert list(mgr.referrers(sw1p2, 'hasPort')) == []
+    assert list(mgr.referrers(sw1p3, 'hasPort')) == [biport]
+
+    # Removed relations don't leave empty entries behind
+    assert ('sw1p2', 'hasPort') not in mgr._reverse
+    mgr.relation_changed(biport, 'hasPort', (sw1p2, ), ())
+    assert ('sw1p2', 'hasPort') not in mgr._reverse
+
+    # Relations of objects not in the namespace aren't indexed
+    Node(identifier='sw2').add_has_inbound_port(sw1p1)
+    assert list(mgr.referrers(sw1p1, 'hasInboundPort')) == [sw1]
+
+    # Objects replaced by others with the same identifier
+    other_sw1p1 = Port(identifier='sw1p1')
+    sw1.add_has_inbound_port(other_sw1p1)
+    assert list(mgr.referrers(sw1p1, 'hasInboundPort')) == []
+    assert list(mgr.referrers(other_sw1p1, 'hasInboundPort')) == [sw1]
+
+    biport.set_has_port(other_sw1p1, sw1p3)
+    assert list(mgr.referrers(sw1p1, 'hasPort')) == []
+    assert list(mgr.referrers(other_sw1p1, 'hasPort')) == [biport]
+    biport.set_has_port(sw1p1, sw1p3)
+    assert list(mgr.referrers(sw1p1, 'hasPort')) == [biport]
+    assert list(mgr.referrers(other_sw1p1, 'hasPort')) == []
+
+    # Only the managers of an object are notified, and they are not kept
+    # alive by the objects
+    other = NMLManager(reverse_index=True)
+    other.register_object(Node(identifier='sw2'))
+    assert len(sw1._observers) == 1
+    assert other.get_object('sw2')._observers == (other._observed, )
+
+    observed = mgr._observed
+    del mgr
+    assert observed() is None
+    sw1.add_has_inbound_port(sw1p2)
+    assert sw1._observers == ()
 
 
 def test_graphviz(tmpdir):
@@ -122,3 +578,136 @@ def test_graphviz_extended(tmpdir):
     # Check files were created
     assert plotfile.check(file=1)
     assert srcfile.check(file=1)
+
+
+def test_write_graphviz_extended(monkeypatch):
+    """
+    Check the Graphviz source written by the ExtendedNMLManager.
+    """
+    mgr = common_mgr()
+
+    output = StringIO()
+    mgr.write_graphviz(output)
+    graph = output.getvalue()
+
+    assert graph == mgr.export_graphviz()
+    assert graph.startswith('graph G {\n')
+    assert graph.endswith('}\n')
+
+    # Same output as the Graphviz export was before it was streamed
+    assert graph.splitlines() == [
+        'graph G {',
+        '    // Style',
+        '    graph [fontname="Verdana" fontsize=8]',
+        '    node [fontname="Verdana" fontsize=7]',
+        '    edge [fontname="Verdana" fontsize=7]',
+        '    graph [nodesep=0.05 pad=0.0 margin=0.0 ranksep=0.25]',
+        '    node [style=filled shape=box margin=0.05 width=0.25 height=0.25]',
+        '',
+        '    label="Graphviz Namespace"',
+        '',
+        '    // Nodes',
+        '    subgraph clusterNode1 {',
+        '        label="My Switch 1"',
+        '        n1p1',
+        '        n1p2',
+        '        n1p3',
+        '    }',
+        '    ',
+        '    subgraph clusterNode2 {',
+        '        label="My Switch 2"',
+        '        n2p1',
+        '        n2p2',
+        '        n2p3',
+        '    }',
+        '    ',
+        '',
+        '    // Ports',
+        '    n1p1 [label="p1"]',
+        '    n1p2 [label="p2"]',
+        '    n1p3 [label="p3"]',
+        '    n2p1 [label="p1"]',
+        '    n2p2 [label="p2"]',
+        '    n2p3 [label="p3"]',
+        '',
+        '    // Links',
+        '    n1p1 -- n2p1',
+        '    n1p2 -- n2p2',
+        '}',
+    ]
+
+    # Layout only for large graphs or when given
+    monkeypatch.setattr(manager, 'LAYOUT_THRESHOLD', 8)
+    assert 'layout=' not in mgr.export_graphviz()
+    assert 'graph [layout=neato, nodesep=0.05 pad=0.0 margin=0.0 ' \
+        'ranksep=0.25]' in mgr.export_graphviz(layout='neato')
+    monkeypatch.setattr(manager, 'LAYOUT_THRESHOLD', 7)
+    assert 'layout=sfdp' in mgr.export_graphviz()
+
+
+def test_graphviz_summary(monkeypatch):
+    """
+    Check the summary Graphviz graph of a namespace.
+    """
+    mgr = common_mgr()
+    sw1, sw2 = mgr.get_object('sw1'), mgr.get_object('sw2')
+    sw3 = mgr.create_node(identifier='sw3', name='My Switch 3')
+    mgr.create_bilink(mgr.create_biport(sw2), mgr.create_biport(sw3))
+
+    graph = mgr.export_graphviz(summary=True)
+    lines = [line.strip() for line in graph.splitlines()]
+
+    assert 'graph [layout=fdp, overlap=prism outputorder=edgesfirst]' in lines
+    assert 'n1 [label="My Switch 1 (3 ports)"]' in lines
+    assert 'n3 [label="My Switch 3 (1 ports)"]' in lines
+    assert [line for line in lines if ' -- ' in line] == [
+        'n1 -- n2 [weight=2 label="2"]',
+        'n2 -- n3 [weight=1 label="1"]',
+    ]
+    assert 'subgraph cluster1 {' not in lines
+
+    # Clusters
+    topology = Topology(identifier='pod1', name='Pod 1')
+    topology.add_has_node(sw1)
+    topology.add_has_node(sw2)
+    mgr.register_object(topology)
+
+    lines = mgr.export_graphviz(summary=True, cluster='topology').splitlines()
+    cluster = lines.index('    subgraph cluster1 {')
+    assert lines[cluster + 1:cluster + 5] == [
+        '        label="Pod 1"', '        n1', '        n2', '    }'
+    ]
+
+    location = Location(identifier='dc1', name='DC 1')
+    sw3.set_located_at(location)
+    lines = mgr.export_graphviz(summary=True, cluster='location').splitlines()
+    cluster = lines.index('    subgraph cluster1 {')
+    assert lines[cluster + 1:cluster + 4] == [
+        '        label="DC 1"', '        n3', '    }'
+    ]
+
+    # Objects without name are labeled by their identifier
+    location.name = unset
+    lines = mgr.export_graphviz(summary=True, cluster='location').splitlines()
+    assert '        label="dc1"' in lines
+
+    # Unidirectional ports count one by one
+    sw3p9 = Port(identifier='sw3p9')
+    mgr.register_object(sw3p9)
+    sw3.add_has_inbound_port(sw3p9)
+    lines = [
+        line.strip() for line in mgr.export_graphviz(summary=True).splitlines()
+    ]
+    assert 'n3 [label="My Switch 3 (2 ports)"]' in lines
+
+    with pytest.raises(Exception):
+        mgr.export_graphviz(summary=True, cluster='rack')
+
+    # Layout
+    monkeypatch.setattr(manager, 'LAYOUT_THRESHOLD', 2)
+    assert 'layout=sfdp' in mgr.export_graphviz(summary=True)
+    assert 'layout=neato' in mgr.export_graphviz(summary=True, layout='neato')
+
+    plain = NMLManager()
+    plain.bulk_create(Node, {'identifier': ['sw1', 'sw2', 'sw3']})
+    assert 'layout=sfdp' in plain.export_graphviz()
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.nml.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from io import open
+
+import pytest  # noqa
+
+from pynml import nml, exceptions
+from pynml.spec import render
+from pynml.nml import Node, Port, BidirectionalPort
+
+
+def test_generated_modules():
+    """
+    Check that the generated modules are up to date with the specification.
+    """
+    rendered = render()
+
+    for module in [nml, exceptions]:
+        name = module.__name__.split('.')[-1]
+        with open(module.__file__.replace('.pyc', '.py'), 'r') as fd:
+            assert fd.read() == rendered[name]
+
+
+def test_slots():
+    """
+    Check that NML objects don't store a per instance dictionary and that
+    relation collections are created on first use.
+    """
+    node = Node(identifier='sw1', name='Node(sw1)', version='v')
+    port = Port(identifier='sw1p1')
+
+    assert not hasattr(node, '__dict__')
+    assert not hasattr(port, '__dict__')
+
+    # Class level tables
+    assert node.attributes == ('name', 'identifier', 'version')
+    assert port.attributes == ('name', 'identifier', 'version', 'encoding')
+    assert list(port.relation_methods.keys()) == [
+        'existsDuring', 'isAlias', 'locatedAt',
+        'hasLabel', 'hasService', 'isSink', 'isSource'
+    ]
+
+    assert repr(node) == (
+        "Node(name='Node(sw1)', identifier='sw1', version='v', metadata={})"
+    )
+
+    # Relations
+    assert not hasattr(node, '_has_inbound_port_ports')
+    assert not node.has_inbound_port(port)
+    assert node.get_has_inbound_port() == {}
+
+    node.add_has_inbound_port(port)
+    assert node.has_inbound_port(port)
+    assert list(node.get_has_inbound_port().values()) == [port]
+    assert list(node.relations['hasInboundPort']().values()) == [port]
+
+    # Compositions
+    biport = BidirectionalPort()
+    assert biport.get_has_port() == (None, None)
+
+    # Metadata
+    assert Port(speed=10).metadata == {'speed': 10}
+    port.metadata['speed'] = 100
+    assert port.metadata == {'speed': 100}
+
+
+def test_iter_relations():
+    """
+    Check that relations can be iterated without copying them.
+    """
+    node = Node(identifier='sw1')
+    ports = [Port(identifier='sw1p{}'.format(i)) for i in range(3)]
+    for port in ports:
+        node.add_has_inbound_port(port)
+
+    assert list(node.iter_has_inbound_port()) == ports
+    assert list(node.iter_has_outbound_port()) == []
+
+    biport = BidirectionalPort()
+    assert list(biport.iter_has_port()) == []
+    biport.set_has_port(ports[0], ports[1])
+    assert list(biport.iter_has_port()) == ports[:2]
+
+    relations = dict(
+        (relname, list(related))
+        for relname, related in node.iter_relations()
+    )
+    assert list(relations.keys()) == list(node.relation_methods.keys())
+    assert relations['hasInboundPort'] == ports
+    assert relations['isAlias'] == []
+
+
+def test_render_without_slots():
+    """
+    Check that the specification can still be rendered to classes without
+    slots, sharing the class level attribute and relation tables.
+    """
+    namespace = {'__name__': 'pynml.nml_without_slots', '__package__': 'pynml'}
+    code = compile(render(slots=False)['nml'], 'nml.py', 'exec')
+    exec(code, namespace)  # noqa
+
+    node = namespace['Node'](identifier='sw1')
+    assert hasattr(node, '__dict__')
+    assert 'attributes' not in node.__dict__
+    assert 'relations' not in node.__dict__
+    assert node.attributes == ('name', 'identifier', 'version')
+    assert list(node.relations.keys())[-1] == 'implementedBy'
+
+    port = namespace['Port'](identifier='sw1p1')
+    node.add_has_inbound_port(port)
+    assert list(node.iter_has_inbound_port()) == [port]
+    assert [
+        list(related) for relname, related in node.iter_relations()
+        if relname == 'hasInboundPort'
+    ] == [[port]]
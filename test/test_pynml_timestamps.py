@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.timestamps.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from datetime import datetime
+
+import pytest  # noqa
+
+from pynml.nml import Node, Port, Lifetime
+from pynml import timestamps
+from pynml.manager import ExtendedNMLManager
+from pynml.timestamps import Timestamp, now, pinned
+
+
+def test_lazy_version(monkeypatch):
+    """
+    Check that default timestamps are shared and formatted only when read.
+    """
+    monkeypatch.setattr(timestamps, '_last', [Timestamp(0)])
+
+    before = datetime.now().replace(microsecond=0).isoformat()
+    nodes = [Node() for i in range(10)]
+    after = datetime.now().replace(microsecond=0).isoformat()
+
+    stored = nodes[0]._version
+    assert isinstance(stored, Timestamp)
+    assert not hasattr(stored, '_isoformat')
+
+    assert before <= nodes[0].version <= after
+    assert nodes[0].version == stored.isoformat()
+    assert hasattr(stored, '_isoformat')
+
+    # Explicit values are kept as is
+    assert Node(version='v1').version == 'v1'
+    assert Lifetime(start='s').start == 's'
+
+
+def test_pinned():
+    """
+    Check that timestamps can be pinned for a batch.
+    """
+    with pinned('2016-01-01T00:00:00') as timestamp:
+        assert now() == timestamp
+        with pinned(datetime(2016, 1, 2, 0, 0, 0, 5)):
+            assert Node().version == '2016-01-02T00:00:00'
+
+        lifetime = Lifetime()
+        assert lifetime.start == lifetime.end == '2016-01-01T00:00:00'
+
+    assert now() != timestamp
+
+
+def test_manager_pinned():
+    """
+    Check that timestamps can be pinned for the objects built by a manager.
+    """
+    mgr = ExtendedNMLManager()
+    with mgr.pinned_timestamp() as timestamp:
+        assert mgr.timestamp is timestamp
+        node = mgr.create_node(identifier='sw1')
+        biport = mgr.create_biport(node, identifier='sw1bp1')
+        ports = mgr.bulk_create(Port, {'identifier': ['sw1p1']})
+
+        # Other objects take the global default
+        assert now() is not timestamp
+        assert Node(identifier='sw2')._version is not timestamp
+
+        with mgr.pinned_timestamp('2016-01-01T00:00:00'):
+            assert mgr.create_node().version == '2016-01-01T00:00:00'
+        assert mgr.timestamp is timestamp
+    assert mgr.timestamp is None
+
+    assert node._version is ports[0]._version is timestamp
+    assert biport._version is biport.get_has_port()[0]._version is timestamp
+    assert node.version == timestamp.isoformat()
+    assert mgr.create_node(version='v1').version == 'v1'
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.validators.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+import pytest  # noqa
+from rfc3986 import is_valid_uri as rfc3986_is_valid_uri
+
+from pynml import validators
+from pynml.nml import Port
+from pynml.exceptions import AttributeIdError
+from pynml.validators import is_valid_uri, all_valid_uris, clear_cache
+from pynml.validators import trusted
+
+
+URIS = [
+    'sw1p1',
+    'urn:ogf:network:example.net:2013:sw1p1',
+    'urn:ogf:network:example.net:2013:sw1p2',
+    'urn:ogf:network:example.net:2013:sw1p2?q#f',
+    'urn:ogf:network:example.net:2013://sw1p3',
+    'http://schemas.ogf.org/nml/2012/10/ethernet',
+    'http://[bad',
+    'http://host:port',
+    '1a:b',
+    '%zz',
+    'a b',
+    '',
+]
+
+
+def test_is_valid_uri():
+    """
+    Check that URIs are validated as the rfc3986 module does.
+    """
+    clear_cache()
+    for uri in URIS * 2:
+        assert is_valid_uri(uri) == rfc3986_is_valid_uri(uri), uri
+
+    # Known prefixes
+    assert 'urn:ogf:network:example.net:2013' in validators._prefixes
+    assert is_valid_uri('urn:ogf:network:example.net:2013:sw2p1')
+    assert not is_valid_uri('urn:ogf:network:example.net:2013:[sw2p1')
+
+
+def test_all_valid_uris():
+    """
+    Check the validation of many URIs at once.
+    """
+    clear_cache()
+    valid = [uri for uri in URIS if rfc3986_is_valid_uri(uri)]
+    assert all_valid_uris(valid)
+    assert all_valid_uris([])
+
+    prefix = 'urn:ogf:network:example.net:2013:'
+    uris = [prefix + 'sw{}p1'.format(i) for i in range(10)]
+    assert all_valid_uris(uris + [prefix + 'sw1p1%20?q#f'])
+    for suffix in ['sw1p1\n', 'sw1\n\np1', '[sw1p1', '//sw1p1', '%zz']:
+        uri = prefix + suffix
+        assert all_valid_uris(uris + [uri]) == is_valid_uri(uri), uri
+    assert not all_valid_uris(uris + ['http://[bad'])
+    assert not all_valid_uris(uris + [None])
+
+
+def test_cache_size(monkeypatch):
+    """
+    Check that the cache of validated URIs is bounded.
+    """
+    monkeypatch.setattr(validators, 'CACHE_SIZE', 2)
+    clear_cache()
+
+    for uri in ['sw1', 'sw2', 'sw1', 'sw3']:
+        assert is_valid_uri(uri)
+    assert list(validators._cache.keys()) == ['sw1', 'sw3']
+
+
+def test_trusted():
+    """
+    Check that the validation can be disabled for trusted input.
+    """
+    with pytest.raises(AttributeIdError):
+        Port(identifier='http://[bad')
+
+    with trusted():
+        with trusted():
+            assert is_valid_uri('http://[bad')
+        assert Port(identifier='http://[bad').identifier == 'http://[bad'
+
+    assert not is_valid_uri('http://[bad')
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2015-2016 Hewlett Packard Enterprise Development LP
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Test suite for module pynml.whatif.
+
+See http://pythontesting.net/framework/pytest/pytest-introduction/#fixtures
+"""
+
+from __future__ import unicode_literals, absolute_import
+from __future__ import print_function, division
+
+from multiprocessing import active_children
+
+import pytest  # noqa
+
+from pynml.manager import ExtendedNMLManager
+
+
+def topology():
+    """
+    Create a topology with two parallel bilinks between sw1 and sw2, one
+    bilink between sw2 and sw3 and a chain sw3 - sw4 - sw5 - sw3.
+    """
+    mgr = ExtendedNMLManager(name='What if')
+    nodes = dict(
+        (identifier, mgr.create_node(identifier=identifier))
+        for identifier in ('sw1', 'sw2', 'sw3', 'sw4', 'sw5')
+    )
+
+    def bilink(identifier, node_a, node_b):
+        return mgr.create_bilink(
+            mgr.create_biport(nodes[node_a]),
+            mgr.create_biport(nodes[node_b]),
+            identifier=identifier
+        )
+
+    bilink('l1', 'sw1', 'sw2')
+    bilink('l2', 'sw1', 'sw2')
+    bilink('l3', 'sw2', 'sw3')
+    bilink('l4', 'sw3', 'sw4')
+    bilink('l5', 'sw4', 'sw5')
+    bilink('l6', 'sw5', 'sw3')
+    return mgr
+
+
+def test_biconnectivity():
+    """
+    Check the bridges and articulation points.
+    """
+    engine = topology().what_if()
+    assert engine.bridges() == [('sw2', 'sw3')]
+    assert engine.articulation_points() == ['sw2', 'sw3']
+
+
+def test_evaluate():
+    """
+    Check the impact of failures of links, ports and nodes.
+    """
+    mgr = topology()
+    engine = mgr.what_if()
+    assert mgr.what_if() is engine
+    size = len(mgr.namespace)
+
+    # Parallel bilink
+    assert not engine.evaluate(mgr.get_object('l1').get_has_link())
+
+    # One direction of a bridge
+    l3_a_b, l3_b_a = mgr.get_object('l3').get_has_link()
+    impact = engine.evaluate([l3_a_b])
+    assert sorted(impact.disconnected) == [
+        (source, target)
+        for source in ('sw1', 'sw2') for target in ('sw3', 'sw4', 'sw5')
+    ]
+    assert impact.stretched == []
+
+    # Longer paths around the ring
+    impact = engine.evaluate([mgr.get_object('l6').get_has_link()[1]])
+    assert impact.disconnected == []
+    assert sorted(impact.stretched) == [
+        ('sw1', 'sw5', 3, 4), ('sw2', 'sw5', 2, 3), ('sw3', 'sw5', 1, 2),
+    ]
+
+    # Ports and nodes
+    sw3p1 = mgr.get_object('sw3').get_has_inbound_port()
+    impact = engine.evaluate(list(sw3p1.values())[:1])
+    assert ('sw2', 'sw3') in impact.disconnected
+
+    impact = engine.evaluate([mgr.get_object('sw2')])
+    assert sorted(impact.disconnected) == sorted(
+        [('sw1', target) for target in ('sw3', 'sw4', 'sw5')] +
+        [(source, 'sw1') for source in ('sw3', 'sw4', 'sw5')]
+    )
+
+    with pytest.raises(Exception):
+        engine.evaluate(['unknown'])
+
+    # The namespace is not modified
+    assert len(mgr.namespace) == size
+    assert not engine.evaluate([])
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_evaluate_many(workers):
+    """
+    Check the evaluation of many scenarios by a pool of processes.
+    """
+    mgr = topology()
+    engine = mgr.what_if(sources=[mgr.get_object('sw1'), 'sw4'])
+
+    scenarios = [
+        [link]
+        for _, _, bilink in mgr.bilinks() for link in bilink.get_has_link()
+    ] + [[node] for node in mgr.nodes()]
+
+    impacts = list(engine.evaluate_many(scenarios, workers=workers))
+    assert len(impacts) == len(scenarios)
+    for failures, impact in zip(scenarios, impacts):
+        expected = engine.evaluate(failures)
+        assert impact.disconnected == expected.disconnected
+        assert impact.stretched == expected.stretched
+        assert all(
+            source in ('sw1', 'sw4') for source, target in impact.disconnected
+        )
+
+    # The pool is stopped when the caller stops early
+    impacts = engine.evaluate_many(scenarios, workers=workers)
+    next(impacts)
+    impacts.close()
+    assert active_children() == []